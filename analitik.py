@@ -0,0 +1,131 @@
+import math
+import pandas as pd
+from kantin_des import Config
+
+# ============================
+# ESTIMASI ANALITIK M/G/c
+# ============================
+# Kedatangan eksponensial (Poisson) dan layanan Uniform(MIN, MAX) yang dilayani
+# staff mana pun dari satu antrian FCFS bersama: model M/G/c dengan
+# c = NUM_KELOMPOK x NUM_STAFF_PER_KELOMPOK.
+
+# Konfigurasi dipangkas dari optimasi bila estimasi > FAKTOR_PANGKAS x target
+FAKTOR_PANGKAS = 2.0
+
+# Metrik yang bisa dibandingkan dengan ringkas_metrik / results simulasi
+METRIK_ANALITIK = ['avg_waktu_tunggu', 'p50_waktu_tunggu', 'p90_waktu_tunggu',
+                   'p99_waktu_tunggu', 'max_waktu_tunggu', 'waktu_selesai_terakhir']
+
+def erlang_c(c: int, a: float) -> float:
+    """Peluang menunggu M/M/c (rumus Erlang C), a = lambda / mu dengan a < c
+
+    Dihitung lewat rekursi Erlang B agar tidak overflow untuk c besar.
+    """
+    b = 1.0
+    for k in range(1, c + 1):
+        b = a * b / (k + a * b)
+    rho = a / c
+    return b / (1 - rho * (1 - b))
+
+def _kuantil_tunggu(peluang_menunggu: float, rata_bersyarat: float, p: float) -> float:
+    """Kuantil waktu tunggu bila tunggu bersyarat (W | W > 0) eksponensial"""
+    if peluang_menunggu <= 1 - p:
+        return 0.0
+    return rata_bersyarat * math.log(peluang_menunggu / (1 - p))
+
+def estimasi_analitik(config: Config) -> dict:
+    """Perkiraan waktu tunggu, peluang menunggu, dan utilisasi dalam bentuk tertutup
+
+    Bila rho < 1 dipakai pendekatan Allen-Cunneen:
+        Wq ~ C(c, a) / (c mu - lambda) x (Ca^2 + Cs^2) / 2
+    dengan Ca^2 = 1 (Poisson) dan Cs^2 = (MAX - MIN)^2 / (3 (MAX + MIN)^2)
+    untuk layanan uniform; kuantil dari ekor eksponensial seperti M/M/c.
+
+    Bila rho >= 1 antrian tidak punya steady state dan terus tumbuh selama
+    kedatangan berlangsung; dipakai pendekatan fluida untuk NUM_MAHASISWA yang
+    berhingga: mahasiswa ke-i menunggu ~ i (E[S]/c - rata-rata antar kedatangan).
+    """
+    c = config.NUM_KELOMPOK * config.NUM_STAFF_PER_KELOMPOK
+    n = config.NUM_MAHASISWA
+    antar_datang = config.MEAN_INTERARRIVAL
+    rata_layanan = (config.MIN_SERVICE_TIME + config.MAX_SERVICE_TIME) / 2
+    cs2 = ((config.MAX_SERVICE_TIME - config.MIN_SERVICE_TIME) ** 2
+           / (3 * (config.MAX_SERVICE_TIME + config.MIN_SERVICE_TIME) ** 2))
+
+    laju = 1 / antar_datang
+    beban = laju * rata_layanan  # a = lambda / mu (Erlang)
+    rho = beban / c
+    stabil = rho < 1
+
+    if stabil:
+        peluang_menunggu = erlang_c(c, beban)
+        avg_tunggu = peluang_menunggu / (c / rata_layanan - laju) * (1 + cs2) / 2
+        rata_bersyarat = avg_tunggu / peluang_menunggu if peluang_menunggu > 0 else 0.0
+        kuantil = {p: _kuantil_tunggu(peluang_menunggu, rata_bersyarat, p)
+                   for p in (0.50, 0.90, 0.99)}
+        # Maksimum n sampel ~ kuantil 1 - 1/n
+        max_tunggu = _kuantil_tunggu(peluang_menunggu, rata_bersyarat, 1 - 1 / n)
+        waktu_selesai = (n - 1) * antar_datang + avg_tunggu + rata_layanan
+        metode = "Allen-Cunneen"
+    else:
+        selisih = rata_layanan / c - antar_datang
+        max_tunggu = (n - 1) * selisih
+        avg_tunggu = max_tunggu / 2
+        peluang_menunggu = max(1 - c / n, 0.0)
+        kuantil = {p: p * max_tunggu for p in (0.50, 0.90, 0.99)}
+        waktu_selesai = n * rata_layanan / c
+        metode = "fluida"
+
+    return {
+        'metode': metode,
+        'stabil': stabil,
+        'jumlah_server': c,
+        'rho': rho,
+        'peluang_menunggu': peluang_menunggu,
+        'avg_waktu_tunggu': avg_tunggu,
+        'p50_waktu_tunggu': kuantil[0.50],
+        'p90_waktu_tunggu': kuantil[0.90],
+        'p99_waktu_tunggu': kuantil[0.99],
+        'max_waktu_tunggu': max_tunggu,
+        'waktu_selesai_terakhir': waktu_selesai,
+        # Sama seperti simulasi: layanan total / (c x waktu selesai terakhir)
+        'utilisasi': min(n * rata_layanan / (c * waktu_selesai), 1.0) * 100
+    }
+
+def deviasi_simulasi(estimasi: dict, metrik_simulasi: dict) -> pd.DataFrame:
+    """Bandingkan estimasi analitik dengan hasil simulasi, satu baris per metrik
+
+    metrik_simulasi berupa dict dari ringkas_metrik (atau yang sejenis); metrik
+    yang tidak ada di simulasi dilewati. 'utilisasi' dibandingkan dengan
+    rata-rata utilisasi_kelompok_*.
+    """
+    simulasi = dict(metrik_simulasi)
+    utilisasi = [v for k, v in simulasi.items() if k.startswith('utilisasi_kelompok_')]
+    if utilisasi:
+        simulasi['utilisasi'] = sum(utilisasi) / len(utilisasi)
+
+    baris = []
+    for nama in [*METRIK_ANALITIK, 'peluang_menunggu', 'utilisasi']:
+        if nama not in simulasi:
+            continue
+        analitik, nilai_simulasi = estimasi[nama], simulasi[nama]
+        baris.append({
+            'metrik': nama,
+            'analitik': analitik,
+            'simulasi': nilai_simulasi,
+            'selisih': analitik - nilai_simulasi,
+            'deviasi_relatif': ((analitik - nilai_simulasi) / abs(nilai_simulasi)
+                                if nilai_simulasi else float('nan'))
+        })
+    return pd.DataFrame(baris)
+
+def tanpa_harapan(config: Config, metrik: str, target: float,
+                  faktor: float = FAKTOR_PANGKAS) -> bool:
+    """True bila konfigurasi pasti jauh melebihi target sehingga tak perlu disimulasikan
+
+    Hanya dipakai di rezim tidak stabil (rho >= 1): pendekatan fluida di sana
+    cenderung di bawah nilai simulasi, jadi pemangkasan tetap konservatif.
+    Di rezim stabil Allen-Cunneen bisa melebih-lebihkan dekat rho = 1.
+    """
+    estimasi = estimasi_analitik(config)
+    return not estimasi['stabil'] and estimasi.get(metrik, 0.0) > faktor * target
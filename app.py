@@ -1,11 +1,15 @@
 import streamlit as st
-import random
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import datetime
+from dataclasses import replace
+from simulasi_piket import jalankan_piket
+from piket_des import PiketDES, TAHAP, config_dari_parameter, cari_pembagian_pekerja
+from cache_hasil import cache_simulasi, hash_config
 
-random.seed(42)
+SEED = 42
 
 st.set_page_config(page_title="Simulasi Piket IT Del", layout="wide")
 
@@ -84,52 +88,45 @@ st.markdown(f"""
 # ===============================
 # SIMULASI
 # ===============================
+# jam_mulai sengaja tidak masuk parameter (kunci cache): ia hanya menggeser
+# jam selesai saat ditampilkan, sehingga menggantinya tidak memicu simulasi ulang
+parameter_simulasi = {
+    "total_mahasiswa_yang_piket": total_mahasiswa_yang_piket,
+    "total_meja": total_meja,
+    "mahasiswa_per_meja": mahasiswa_per_meja,
+    "min_lauk": min_lauk, "max_lauk": max_lauk,
+    "min_nasi": min_nasi, "max_nasi": max_nasi,
+    "min_angkat": min_angkat, "max_angkat": max_angkat,
+    "seed": SEED
+}
+
+# Simpan parameter saat tombol di-klik agar hasil tetap tampil saat rerun
 if st.button("🚀 Jalankan Simulasi"):
+    st.session_state["piket_aktif"] = parameter_simulasi
+
+if "piket_aktif" in st.session_state:
+
+    parameter = st.session_state["piket_aktif"]
+    total_mahasiswa_yang_piket = parameter["total_mahasiswa_yang_piket"]
+    total_meja = parameter["total_meja"]
+    mahasiswa_per_meja = parameter["mahasiswa_per_meja"]
 
     TOTAL_OMPRENG = total_meja * mahasiswa_per_meja
 
-    waktu_lauk_selesai = 0
-    waktu_angkat_selesai = 0
-    waktu_nasi_selesai = 0
-
-    total_lauk = 0
-    total_nasi = 0
-    total_angkat = 0
-
-    data = []
-    batch_size = random.randint(4, 7)
-    counter_batch = 0
-
-    for i in range(TOTAL_OMPRENG):
-
-        # LAUK
-        waktu_lauk = random.uniform(min_lauk, max_lauk)
-        total_lauk += waktu_lauk
-        waktu_lauk_selesai += waktu_lauk / total_mahasiswa_yang_piket
-
-        # ANGKAT (BATCH)
-        counter_batch += 1
-        if counter_batch >= batch_size:
-            waktu_angkat = random.uniform(min_angkat, max_angkat)
-            total_angkat += waktu_angkat
-            waktu_angkat_selesai = max(
-                waktu_lauk_selesai, waktu_angkat_selesai
-            ) + (waktu_angkat / total_mahasiswa_yang_piket)
-
-            counter_batch = 0
-            batch_size = random.randint(4, 7)
-
-        # NASI
-        waktu_nasi = random.uniform(min_nasi, max_nasi)
-        total_nasi += waktu_nasi
-        waktu_nasi_selesai = max(
-            waktu_angkat_selesai, waktu_nasi_selesai
-        ) + (waktu_nasi / total_mahasiswa_yang_piket)
-
-        data.append({
-            "Ompreng": i + 1,
-            "Waktu Selesai (detik)": waktu_nasi_selesai
-        })
+    # Rerun dengan parameter yang sama diambil dari cache
+    hasil = cache_simulasi.get_or_compute(
+        hash_config("piket", parameter), lambda: jalankan_piket(parameter)
+    )
+
+    waktu_nasi_selesai = hasil.waktu_total[0]
+    total_lauk = hasil.total_lauk[0]
+    total_angkat = hasil.total_angkat[0]
+    total_nasi = hasil.total_nasi[0]
+
+    data = {
+        "Ompreng": np.arange(1, TOTAL_OMPRENG + 1),
+        "Waktu Selesai (detik)": hasil.waktu_selesai[0]
+    }
 
     # ===============================
     # PERHITUNGAN WAKTU
@@ -187,16 +184,10 @@ if st.button("🚀 Jalankan Simulasi"):
     # ===============================
     st.subheader("📊 Distribusi Waktu Total per Meja")
 
-    data_meja = []
-    for meja in range(total_meja):
-        end_index = (meja + 1) * mahasiswa_per_meja - 1
-        waktu_meja = df.iloc[end_index]["Waktu Selesai (detik)"]
-        data_meja.append({
-            "Meja": meja + 1,
-            "Waktu Selesai (detik)": waktu_meja
-        })
-
-    df_meja = pd.DataFrame(data_meja)
+    df_meja = pd.DataFrame({
+        "Meja": np.arange(1, total_meja + 1),
+        "Waktu Selesai (detik)": hasil.waktu_selesai_meja(mahasiswa_per_meja)[0]
+    })
 
     fig_bar_meja = px.bar(df_meja, x="Meja", y="Waktu Selesai (detik)")
     st.plotly_chart(fig_bar_meja, use_container_width=True)
@@ -267,4 +258,67 @@ if st.button("🚀 Jalankan Simulasi"):
         key=lambda x: x[1]
     )
 
-    st.warning(f"⚠️ Bottleneck sistem berada pada proses: **{bottleneck[0]}**")
\ No newline at end of file
+    st.warning(f"⚠️ Bottleneck sistem berada pada proses: **{bottleneck[0]}**")
+
+    # ===============================
+    # MODEL ANTRIAN TANDEM PER TAHAP
+    # ===============================
+    st.subheader("🏭 Model Antrian Tandem per Tahap")
+    st.markdown(
+        "Lauk → angkat (batch 4–7 ompreng) → nasi sebagai antrian bertahap, "
+        "dengan pekerja piket dibagi ke tiap tahap."
+    )
+
+    if total_mahasiswa_yang_piket < 3:
+        st.info("Model tandem butuh minimal 3 mahasiswa piket (satu per tahap).")
+    else:
+        config_piket = config_dari_parameter(parameter)
+        pembagian = cache_simulasi.get_or_compute(
+            hash_config("piket_tandem", config_piket, total_mahasiswa_yang_piket),
+            lambda: cari_pembagian_pekerja(total_mahasiswa_yang_piket, config_piket)
+        )
+
+        terbaik = pembagian.iloc[0]
+        st.success(
+            f"✅ Pembagian tercepat: **{int(terbaik['PEKERJA_LAUK'])} lauk, "
+            f"{int(terbaik['PEKERJA_ANGKAT'])} angkat, {int(terbaik['PEKERJA_NASI'])} nasi** "
+            f"(rata-rata {terbaik['waktu_total_mean'] / 60:.1f} menit)"
+        )
+
+        hasil_tandem = PiketDES(replace(
+            config_piket,
+            PEKERJA_LAUK=int(terbaik['PEKERJA_LAUK']),
+            PEKERJA_ANGKAT=int(terbaik['PEKERJA_ANGKAT']),
+            PEKERJA_NASI=int(terbaik['PEKERJA_NASI'])
+        )).run("fast")
+
+        df_tahap = pd.DataFrame([
+            {
+                "Tahap": tahap.capitalize(),
+                "Pekerja": hasil_tandem['tahap'][tahap]['pekerja'],
+                "Utilisasi (%)": hasil_tandem['tahap'][tahap]['utilisasi'],
+                "Blocking (%)": hasil_tandem['tahap'][tahap]['blocking'],
+                "Rata-rata Tunggu (detik)": hasil_tandem['tahap'][tahap]['avg_tunggu']
+            }
+            for tahap in TAHAP
+        ])
+        fig_tahap = px.bar(
+            df_tahap, x="Tahap", y=["Utilisasi (%)", "Blocking (%)"], barmode="group",
+            title="Utilisasi dan Blocking per Tahap (pembagian tercepat)"
+        )
+        st.plotly_chart(fig_tahap, use_container_width=True)
+        st.dataframe(df_tahap, use_container_width=True)
+
+        st.markdown("**Semua pembagian pekerja** (20 replikasi, diurutkan dari tercepat)")
+        df_pembagian = pembagian.copy()
+        df_pembagian["waktu_total_mean"] = df_pembagian["waktu_total_mean"] / 60
+        df_pembagian["waktu_total_std"] = df_pembagian["waktu_total_std"] / 60
+        st.dataframe(
+            df_pembagian.rename(columns={
+                "waktu_total_mean": "Rata-rata Waktu (menit)",
+                "waktu_total_std": "Std Waktu (menit)"
+            }),
+            use_container_width=True
+        )
+
+st.sidebar.caption(cache_simulasi.ringkasan())
@@ -1,221 +1,46 @@
 import streamlit as st
-import simpy
-import random
+import os
+import time
+import uuid
+import itertools
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import pandas as pd
-from dataclasses import dataclass
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-
-# ============================
-# KONFIGURASI SIMULASI
-# ============================
-@dataclass
-class Config:
-    """Konfigurasi parameter simulasi"""
-    # Parameter dasar
-    NUM_MAHASISWA: int = 500
-    NUM_STAFF_PER_KELOMPOK: int = 2
-    NUM_KELOMPOK: int = 2
-    
-    # Distribusi waktu
-    MIN_SERVICE_TIME: float = 1.0
-    MAX_SERVICE_TIME: float = 3.0
-    
-    # Waktu kedatangan
-    MEAN_INTERARRIVAL: float = 120 / 500
-    
-    # Jam mulai
-    START_HOUR: int = 8
-    START_MINUTE: int = 0
-    
-    # Seed untuk reproduktibilitas
-    RANDOM_SEED: int = 42
-
-# ============================
-# MODEL SIMULASI
-# ============================
-class KantinPrasmananDES:
-    def __init__(self, config: Config):
-        self.config = config
-        self.env = simpy.Environment()
-        
-        # Resources: Staff per kelompok
-        self.kelompok_staff = [
-            simpy.Resource(self.env, capacity=config.NUM_STAFF_PER_KELOMPOK)
-            for _ in range(config.NUM_KELOMPOK)
-        ]
-        
-        # Antrian tunggal untuk semua mahasiswa
-        self.antrian = simpy.Store(self.env)
-        
-        # Statistik
-        self.statistics = {
-            'mahasiswa_data': [],
-            'queue_lengths': [],
-            'queue_times': [],
-            'service_times': [],
-            'utilization': {i: [] for i in range(config.NUM_KELOMPOK)}
-        }
-        
-        # Waktu mulai simulasi
-        self.start_time = datetime(2024, 1, 1, config.START_HOUR, config.START_MINUTE)
-        
-        # Set random seed
-        random.seed(config.RANDOM_SEED)
-        np.random.seed(config.RANDOM_SEED)
-    
-    def waktu_ke_jam(self, waktu_simulasi: float) -> datetime:
-        return self.start_time + timedelta(minutes=waktu_simulasi)
-    
-    def generate_service_time(self) -> float:
-        return random.uniform(self.config.MIN_SERVICE_TIME, self.config.MAX_SERVICE_TIME)
-    
-    def generate_interarrival_time(self) -> float:
-        return random.expovariate(1.0 / self.config.MEAN_INTERARRIVAL)
-    
-    def proses_mahasiswa(self, mahasiswa_id: int):
-        waktu_datang = self.env.now
-        
-        # 1. Masuk ke antrian
-        yield self.antrian.put(mahasiswa_id)
-        
-        # Catat panjang antrian
-        self.statistics['queue_lengths'].append({
-            'time': self.env.now,
-            'queue_length': len(self.antrian.items)
-        })
-        
-        # 2. Tunggu sampai ada staff yang tersedia
-        kelompok_terpilih = None
-        
-        while kelompok_terpilih is None:
-            for i, kelompok in enumerate(self.kelompok_staff):
-                if kelompok.count < kelompok.capacity:
-                    kelompok_terpilih = i
-                    break
-            
-            if kelompok_terpilih is None:
-                yield self.env.timeout(0.01)
-        
-        # 3. Keluar dari antrian
-        yield self.antrian.get()
-        
-        # 4. Hitung waktu tunggu
-        waktu_mulai_layanan = self.env.now
-        waktu_tunggu = waktu_mulai_layanan - waktu_datang
-        
-        # 5. Gunakan staff dari kelompok terpilih
-        with self.kelompok_staff[kelompok_terpilih].request() as request:
-            yield request
-            
-            # Catat utilisasi
-            self.statistics['utilization'][kelompok_terpilih].append({
-                'time': self.env.now,
-                'in_use': self.kelompok_staff[kelompok_terpilih].count
-            })
-            
-            # 6. Proses layanan
-            service_time = self.generate_service_time()
-            yield self.env.timeout(service_time)
-            
-            # 7. Selesai
-            waktu_selesai = self.env.now
-            
-            # Simpan data mahasiswa
-            self.statistics['mahasiswa_data'].append({
-                'id': mahasiswa_id,
-                'waktu_datang': waktu_datang,
-                'waktu_mulai': waktu_mulai_layanan,
-                'waktu_selesai': waktu_selesai,
-                'waktu_tunggu': waktu_tunggu,
-                'waktu_layanan': service_time,
-                'kelompok': kelompok_terpilih,
-                'jam_datang': self.waktu_ke_jam(waktu_datang),
-                'jam_selesai': self.waktu_ke_jam(waktu_selesai)
-            })
-            
-            self.statistics['queue_times'].append(waktu_tunggu)
-            self.statistics['service_times'].append(service_time)
-    
-    def proses_kedatangan(self):
-        for i in range(self.config.NUM_MAHASISWA):
-            self.env.process(self.proses_mahasiswa(i))
-            
-            if i < self.config.NUM_MAHASISWA - 1:
-                interarrival = self.generate_interarrival_time()
-                yield self.env.timeout(interarrival)
-    
-    def run_simulation(self):
-        self.env.process(self.proses_kedatangan())
-        self.env.run()
-        return self.analyze_results()
-    
-    def analyze_results(self):
-        if not self.statistics['mahasiswa_data']:
-            return None, None
-        
-        df = pd.DataFrame(self.statistics['mahasiswa_data'])
-        
-        results = {
-            'total_mahasiswa': len(df),
-            'waktu_selesai_terakhir': df['waktu_selesai'].max(),
-            'jam_selesai_terakhir': self.waktu_ke_jam(df['waktu_selesai'].max()),
-            
-            # Statistik waktu tunggu
-            'avg_waktu_tunggu': df['waktu_tunggu'].mean(),
-            'max_waktu_tunggu': df['waktu_tunggu'].max(),
-            'min_waktu_tunggu': df['waktu_tunggu'].min(),
-            'std_waktu_tunggu': df['waktu_tunggu'].std(),
-            
-            # Statistik waktu layanan
-            'avg_waktu_layanan': df['waktu_layanan'].mean(),
-            'total_waktu_layanan': df['waktu_layanan'].sum(),
-            
-            # Utilisasi
-            'utilisasi_kelompok': {},
-            
-            # Distribusi per jam
-            'distribusi_jam': self.calculate_hourly_distribution(df)
-        }
-        
-        total_simulation_time = df['waktu_selesai'].max()
-        for kelompok in range(self.config.NUM_KELOMPOK):
-            kelompok_df = df[df['kelompok'] == kelompok]
-            if len(kelompok_df) > 0:
-                total_service_time = kelompok_df['waktu_layanan'].sum()
-                utilisation = (total_service_time / 
-                             (total_simulation_time * self.config.NUM_STAFF_PER_KELOMPOK)) * 100
-                results['utilisasi_kelompok'][kelompok] = utilisation
-            else:
-                results['utilisasi_kelompok'][kelompok] = 0
-        
-        return results, df
-    
-    def calculate_hourly_distribution(self, df):
-        df['jam'] = df['jam_selesai'].dt.hour
-        hourly = df.groupby('jam').size().reset_index(name='jumlah')
-        return dict(zip(hourly['jam'], hourly['jumlah']))
+from dataclasses import replace
+from kantin_des import Config, KantinPrasmananDES, config_simulasi, geser_jam_mulai
+from replikasi import jalankan_replikasi, jalankan_sampai_presisi, ringkas_metrik, TOLERANSI_ABSOLUT
+from cache_hasil import cache_simulasi, hash_config
+from sensitivitas import buat_grid, kunci_sel, jalankan_sweep, sweep_dataframe
+from optimasi_staff import METRIK_TARGET, optimasi_staff
+from analitik import estimasi_analitik, deviasi_simulasi
+from statistik import HistogramTetap
+from ekspor_hasil import FORMAT_EKSPOR, pembuat_unduhan
+from pekerjaan_latar import (
+    ANTRI, BERJALAN, SELESAI, STATUS_AKHIR, kunci_simulasi, simpan_run, muat_run,
+    manajer_pekerjaan
+)
+from penyimpanan_run import KOLOM_METRIK, penyimpanan_aktif
+from render_lod import (
+    BATAS_WEBGL, pilih_scatter, turunkan, catatan_lod, statistik_box
+)
 
 # ============================
 # FUNGSI VISUALISASI PLOTLY
 # ============================
 def create_wait_time_distribution(df):
-    """Buat histogram distribusi waktu tunggu"""
-    fig = px.histogram(
-        df, 
-        x='waktu_tunggu',
-        nbins=30,
-        title='📊 Distribusi Waktu Tunggu Mahasiswa',
-        labels={'waktu_tunggu': 'Waktu Tunggu (menit)', 'count': 'Jumlah Mahasiswa'},
-        color_discrete_sequence=['#1f77b4'],
-        opacity=0.8
+    """Buat histogram distribusi waktu tunggu (dibin di server, hanya jumlah per bin dikirim)"""
+    waktu_tunggu = df['waktu_tunggu'].to_numpy()
+    histogram = HistogramTetap(waktu_tunggu.min(), waktu_tunggu.max(), 30)
+    histogram.tambah_banyak(waktu_tunggu)
+    fig = create_binned_histogram_chart(
+        histogram, '📊 Distribusi Waktu Tunggu Mahasiswa', "Waktu Tunggu (menit)"
     )
     
     # Tambah garis rata-rata
-    avg_wait = df['waktu_tunggu'].mean()
+    avg_wait = waktu_tunggu.mean()
     fig.add_vline(
         x=avg_wait, 
         line_dash="dash", 
@@ -224,23 +49,21 @@ def create_wait_time_distribution(df):
         annotation_position="top right"
     )
     
-    fig.update_layout(
-        xaxis_title="Waktu Tunggu (menit)",
-        yaxis_title="Frekuensi",
-        showlegend=False,
-        hovermode="x unified"
-    )
+    fig.update_layout(hovermode="x unified")
     
     return fig
 
 def create_timeline_chart(df):
     """Buat timeline kedatangan dan penyelesaian"""
     fig = go.Figure()
+    Scatter = pilih_scatter(len(df))
+    x_datang, id_datang, info_datang = turunkan(df['waktu_datang'], df['id'])
+    x_selesai, id_selesai, info_selesai = turunkan(df['waktu_selesai'], df['id'])
     
     # Scatter untuk kedatangan
-    fig.add_trace(go.Scatter(
-        x=df['waktu_datang'],
-        y=df['id'],
+    fig.add_trace(Scatter(
+        x=x_datang,
+        y=id_datang,
         mode='markers',
         name='Kedatangan',
         marker=dict(size=5, color='blue', opacity=0.5),
@@ -248,9 +71,9 @@ def create_timeline_chart(df):
     ))
     
     # Scatter untuk selesai
-    fig.add_trace(go.Scatter(
-        x=df['waktu_selesai'],
-        y=df['id'],
+    fig.add_trace(Scatter(
+        x=x_selesai,
+        y=id_selesai,
         mode='markers',
         name='Selesai',
         marker=dict(size=5, color='green', opacity=0.5),
@@ -265,7 +88,7 @@ def create_timeline_chart(df):
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
     )
     
-    return fig
+    return catatan_lod(fig, info_datang, info_selesai)
 
 def create_hourly_distribution_chart(results):
     """Buat chart distribusi per jam"""
@@ -297,11 +120,21 @@ def create_service_time_boxplot(df, config):
     for kelompok in sorted(df['kelompok'].unique()):
         kelompok_df = df[df['kelompok'] == kelompok]
         kelompok_data.append(kelompok_df['waktu_layanan'].values)
-        kelompok_labels.append(f'Kelompok {kelompok+1}')
+        kelompok_labels.append(f'Kelompok {int(kelompok) + 1}')
     
     fig = go.Figure()
     
     for i, data in enumerate(kelompok_data):
+        if len(data) > BATAS_WEBGL:
+            # Data besar: kirim kuartil hasil hitungan NumPy saja
+            fig.add_trace(go.Box(
+                **statistik_box(data),
+                x=[kelompok_labels[i]],
+                name=kelompok_labels[i],
+                marker_color=px.colors.qualitative.Set2[i],
+                hoverinfo='y'
+            ))
+            continue
         fig.add_trace(go.Box(
             y=data,
             name=kelompok_labels[i],
@@ -319,29 +152,33 @@ def create_service_time_boxplot(df, config):
     
     return fig
 
-def create_queue_length_chart(model):
+def create_queue_length_chart(queue_lengths):
     """Buat chart panjang antrian sepanjang waktu"""
-    if not model.statistics['queue_lengths']:
+    if len(queue_lengths) == 0:
         return None
     
-    queue_df = pd.DataFrame(model.statistics['queue_lengths'])
-    
-    fig = px.line(
-        queue_df,
-        x='time',
-        y='queue_length',
-        title='📊 Panjang Antrian Sepanjang Waktu',
-        labels={'time': 'Waktu Simulasi (menit)', 'queue_length': 'Panjang Antrian'},
-        color_discrete_sequence=['#ff7f0e']
+    queue_df = pd.DataFrame(queue_lengths)
+    # Min/max per bucket agar puncak antrian tetap terlihat setelah downsampling
+    waktu, panjang, info = turunkan(
+        queue_df['time'], queue_df['queue_length'], metode="minmax"
     )
     
+    fig = go.Figure(pilih_scatter(len(waktu))(
+        x=waktu,
+        y=panjang,
+        mode='lines',
+        line=dict(color='#ff7f0e'),
+        hovertemplate='%{x:.1f} menit: %{y} orang<extra></extra>'
+    ))
+    
     fig.update_layout(
+        title='📊 Panjang Antrian Sepanjang Waktu',
         xaxis_title="Waktu (menit)",
         yaxis_title="Panjang Antrian",
         hovermode="x unified"
     )
     
-    return fig
+    return catatan_lod(fig, info)
 
 def create_utilization_gauge_chart(results, config):
     """Buat gauge chart untuk utilisasi staff"""
@@ -371,6 +208,503 @@ def create_utilization_gauge_chart(results, config):
     fig.update_layout(height=300)
     return fig
 
+def create_binned_histogram_chart(histogram, judul, label_x, warna='#1f77b4'):
+    """Buat bar chart dari HistogramTetap (hanya jumlah per bin yang dikirim)"""
+    tengah = (histogram.tepi[:-1] + histogram.tepi[1:]) / 2
+    fig = go.Figure(go.Bar(
+        x=tengah,
+        y=histogram.jumlah,
+        width=np.diff(histogram.tepi),
+        marker_color=warna,
+        opacity=0.8,
+        hovertemplate='%{x:.2f} menit: %{y} mahasiswa<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=judul,
+        xaxis_title=label_x,
+        yaxis_title="Frekuensi",
+        bargap=0,
+        showlegend=False
+    )
+    
+    if histogram.di_atas:
+        fig.add_annotation(
+            text=f"{histogram.di_atas:,} nilai > {histogram.tepi[-1]:.0f} menit",
+            xref="paper", yref="paper", x=1, y=1, showarrow=False
+        )
+    
+    return fig
+
+def tampilkan_visualisasi_streaming(results, config):
+    """Visualisasi untuk hasil mode streaming (tanpa DataFrame per mahasiswa)"""
+    st.markdown("---")
+    st.header("📊 Visualisasi Hasil (Mode Streaming)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(
+            create_binned_histogram_chart(
+                results['histogram_waktu_tunggu'],
+                '📊 Distribusi Waktu Tunggu Mahasiswa',
+                "Waktu Tunggu (menit)"
+            ),
+            use_container_width=True
+        )
+    
+    with col2:
+        st.plotly_chart(
+            create_binned_histogram_chart(
+                results['histogram_waktu_layanan'],
+                '⏱️ Distribusi Waktu Layanan',
+                "Waktu Layanan (menit)",
+                warna='#2ca02c'
+            ),
+            use_container_width=True
+        )
+    
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        st.plotly_chart(create_hourly_distribution_chart(results), use_container_width=True)
+    
+    with col4:
+        st.plotly_chart(
+            create_utilization_gauge_chart(results, config),
+            use_container_width=True
+        )
+    
+    st.caption("Mode streaming hanya menyimpan ringkasan, sehingga timeline, boxplot, "
+               "grafik antrian dan tabel data per mahasiswa tidak tersedia.")
+
+def tampilkan_steady_state(steady):
+    """Titik potong warm-up MSER-5 dan CI batch means dari results['steady_state']"""
+    with st.expander("📉 Steady State (MSER-5 + Batch Means)", expanded=False):
+        if steady is None:
+            st.info("Terlalu sedikit mahasiswa untuk analisis steady state (minimal 50).")
+            return
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric(
+            "Titik Potong Warm-up",
+            f"{steady['titik_potong']:,} mahasiswa",
+            f"pukul {steady['jam_potong'].strftime('%H:%M')}", delta_color="off"
+        )
+        col2.metric(
+            "Rata-rata Tunggu Steady State",
+            f"{steady['rata_rata']:.2f} menit",
+            f"{steady['rata_rata'] - steady['rata_rata_semua']:+.2f} vs semua data", delta_color="off"
+        )
+        col3.metric("Half-width CI 95%", f"±{steady['half_width']:.2f} menit")
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=steady['waktu_batch'], y=steady['rata_rata_batch'],
+            mode='lines', name='Rata-rata batch'
+        ))
+        fig.add_vline(x=steady['waktu_potong'], line_dash="dash", line_color="red",
+                      annotation_text="Potong warm-up")
+        fig.update_layout(
+            title="Rata-rata Waktu Tunggu per Batch",
+            xaxis_title="Waktu Mulai Layanan (menit)",
+            yaxis_title="Waktu Tunggu (menit)",
+            height=350
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(
+            f"CI dari {steady['jumlah_batch']} batch × {steady['ukuran_batch']:,} mahasiswa "
+            f"setelah titik potong ({steady['n_steady']:,} mahasiswa). Bila antrian terus "
+            f"tumbuh (utilisasi ≥ 100%), sistem tidak punya steady state dan angka ini hanya indikatif."
+        )
+
+def tampilkan_panel_performa(profil):
+    """Panel 'Performance' dari results['profil'] (hanya bila profiling aktif)"""
+    with st.expander("⚡ Performance", expanded=False):
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Waktu Engine", f"{profil['waktu_engine']:.3f} s")
+        col2.metric("Simulasi", f"{profil['waktu_simulasi']:.3f} s")
+        col3.metric("Analisis", f"{profil['waktu_analisis']:.3f} s")
+        col4.metric("Kalender Maks", f"{profil['kalender_maks']:,} event")
+        
+        if profil['engine'] != "simpy":
+            st.caption("Engine fast tidak memakai event SimPy; hanya waktu per tahap yang diukur.")
+            return
+        
+        col_kiri, col_kanan = st.columns(2)
+        with col_kiri:
+            st.subheader("Event per Jenis")
+            df_event = pd.DataFrame({
+                'dijadwalkan': pd.Series(profil['event_dijadwalkan']),
+                'diproses': pd.Series(profil['event_diproses'])
+            }).fillna(0).astype(int).sort_values('diproses', ascending=False)
+            st.dataframe(df_event, use_container_width=True)
+        
+        with col_kanan:
+            st.subheader("Waktu per Jenis Proses")
+            df_proses = pd.DataFrame({
+                'step': pd.Series(profil['step_per_proses']),
+                'waktu (s)': pd.Series(profil['waktu_per_proses'])
+            })
+            df_proses['µs/step'] = df_proses['waktu (s)'] / df_proses['step'] * 1e6
+            st.dataframe(df_proses.sort_values('waktu (s)', ascending=False),
+                         use_container_width=True)
+            st.caption(f"Di luar step (loop, penjadwalan, instrumentasi): "
+                       f"{profil['waktu_di_luar_step']:.3f} s")
+        
+        if profil['sampel_kalender']:
+            st.subheader("Ukuran Kalender Event")
+            df_kalender = pd.DataFrame(
+                profil['sampel_kalender'], columns=['Waktu (menit)', 'Event Terjadwal']
+            )
+            st.line_chart(df_kalender.set_index('Waktu (menit)'))
+
+def create_sensitivity_heatmap(df_sweep, metrik='avg_waktu_tunggu'):
+    """Buat heatmap kelompok x staff per kelompok, satu panel per jumlah mahasiswa"""
+    fig = px.density_heatmap(
+        df_sweep,
+        x='NUM_STAFF_PER_KELOMPOK',
+        y='NUM_KELOMPOK',
+        z=metrik,
+        facet_col='NUM_MAHASISWA',
+        histfunc='avg',
+        text_auto='.1f',
+        color_continuous_scale='RdYlGn_r',
+        title=f'🔥 Sensitivitas {metrik}',
+        labels={
+            'NUM_STAFF_PER_KELOMPOK': 'Staff/Kelompok',
+            'NUM_KELOMPOK': 'Kelompok',
+            'NUM_MAHASISWA': 'Mahasiswa'
+        }
+    )
+    
+    fig.update_xaxes(dtick=1)
+    fig.update_yaxes(dtick=1)
+    fig.update_layout(coloraxis_colorbar_title=metrik)
+    
+    return fig
+
+# ============================
+# ESTIMASI ANALITIK M/G/c
+# ============================
+def tampilkan_estimasi_analitik(config):
+    """Estimasi instan di sidebar, dihitung ulang setiap slider bergeser"""
+    estimasi = estimasi_analitik(config)
+    col1, col2 = st.columns(2)
+    col1.metric("ρ (Beban)", f"{estimasi['rho']:.2f}")
+    col2.metric("P(Menunggu)", f"{estimasi['peluang_menunggu']:.0%}")
+    col1.metric("Tunggu Rata-rata", f"{estimasi['avg_waktu_tunggu']:.2f} mnt")
+    col2.metric("Tunggu P90", f"{estimasi['p90_waktu_tunggu']:.2f} mnt")
+    if not estimasi['stabil']:
+        st.warning(
+            f"⚠️ ρ ≥ 1: {estimasi['jumlah_server']} staff tidak mengimbangi laju kedatangan, "
+            f"antrian terus memanjang selama kedatangan berlangsung."
+        )
+    st.caption(f"M/G/{estimasi['jumlah_server']}, pendekatan {estimasi['metode']}")
+
+def tampilkan_deviasi_analitik(results, df, config):
+    """Tabel estimasi analitik vs hasil simulasi beserta deviasi relatifnya"""
+    metrik = ringkas_metrik(results)
+    if df is not None:
+        metrik['peluang_menunggu'] = float((df['waktu_tunggu'] > 0).mean())
+    deviasi = deviasi_simulasi(estimasi_analitik(config), metrik)
+    
+    with st.expander("📐 Analitik vs Simulasi (M/G/c)", expanded=False):
+        st.dataframe(
+            deviasi.style.format({
+                'analitik': "{:.3f}", 'simulasi': "{:.3f}",
+                'selisih': "{:+.3f}", 'deviasi_relatif': "{:+.1%}"
+            }),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.caption(
+            "ρ < 1: Allen-Cunneen (steady state, tidak memperhitungkan awal/akhir sesi). "
+            "ρ ≥ 1: pendekatan fluida untuk jumlah mahasiswa berhingga."
+        )
+
+# ============================
+# CACHE SIMULASI
+# ============================
+def simulasi_tercache(config, engine):
+    """Jalankan simulasi sekali per (config, engine), rerun berikutnya dari cache
+    
+    Cache memori kosong -> coba penyimpanan run di disk (bila aktif) -> simulasi.
+    Jam mulai tidak termasuk kunci cache: hasil digeser ke jam mulai config
+    secara vektor, jadi mengganti jam tidak memicu simulasi ulang.
+    """
+    def jalankan():
+        # Setelah server restart, run yang sama dimuat dari penyimpanan run
+        hasil = muat_run(config, engine)
+        if hasil is not None:
+            return hasil
+        mulai = time.perf_counter()
+        model = KantinPrasmananDES(config_simulasi(config))
+        results, df = jalankan_dengan_progres(model, engine)
+        hasil = (results, df, model.statistics['queue_lengths'])
+        simpan_run(config, engine, hasil, time.perf_counter() - mulai)
+        return hasil
+    
+    results, df, queue_lengths = cache_simulasi.get_or_compute(
+        kunci_simulasi(config, engine), jalankan
+    )
+    results, df = geser_jam_mulai(results, df, config)
+    return results, df, queue_lengths
+
+def jalankan_dengan_progres(model, engine, jumlah_irisan=20, jeda_update=0.2):
+    """Jalankan simulasi bertahap sambil menampilkan hasil sementara di tempat"""
+    wadah = st.empty()
+    riwayat = []
+    update_terakhir = 0.0
+    
+    for cuplikan in model.jalankan_bertahap(engine, jumlah_irisan):
+        if cuplikan.selesai:
+            break
+        riwayat.append({
+            'Waktu (menit)': cuplikan.waktu,
+            'Rata-rata Tunggu (menit)': cuplikan.rata_tunggu,
+            'Panjang Antrian': cuplikan.panjang_antrian
+        })
+        
+        # Batasi frekuensi render agar overhead tetap kecil
+        sekarang = time.monotonic()
+        if sekarang - update_terakhir < jeda_update:
+            continue
+        update_terakhir = sekarang
+        
+        with wadah.container():
+            st.progress(
+                min(cuplikan.progres, 1.0),
+                text=f"Simulasi berjalan... menit ke-{cuplikan.waktu:.0f}"
+            )
+            col1, col2, col3 = st.columns(3)
+            col1.metric("👥 Sudah Dilayani", f"{cuplikan.dilayani:,}")
+            col2.metric("⏱️ Rata-rata Tunggu Sementara", f"{cuplikan.rata_tunggu:.2f} menit")
+            col3.metric("📊 Panjang Antrian Saat Ini", f"{cuplikan.panjang_antrian:,}")
+            st.line_chart(pd.DataFrame(riwayat).set_index('Waktu (menit)'))
+    
+    wadah.empty()
+    return cuplikan.hasil
+
+def panel_pekerjaan(id_pekerjaan):
+    """Progres dan tombol batal satu pekerjaan; fragment ini saja yang di-refresh"""
+    pekerjaan = manajer_pekerjaan.ambil(id_pekerjaan)
+    if pekerjaan.status in STATUS_AKHIR:
+        # Selesai/dibatalkan/gagal: render ulang seluruh halaman sekali
+        if st.session_state.get('status_pekerjaan_terakhir') != pekerjaan.status:
+            st.session_state['status_pekerjaan_terakhir'] = pekerjaan.status
+            st.rerun(scope="app")
+        if pekerjaan.galat:
+            st.error(f"❌ Pekerjaan {pekerjaan.id} gagal: {pekerjaan.galat}")
+        else:
+            st.warning(f"⛔ Pekerjaan {pekerjaan.id} dibatalkan setelah {pekerjaan.durasi:.1f} s.")
+        return
+    st.session_state['status_pekerjaan_terakhir'] = pekerjaan.status
+    
+    if pekerjaan.status == ANTRI:
+        st.info(
+            f"⏳ Pekerjaan {pekerjaan.id} menunggu worker "
+            f"({manajer_pekerjaan.posisi_antrian(pekerjaan.id)} pekerjaan di depan)."
+        )
+    else:
+        cuplikan = pekerjaan.cuplikan
+        st.progress(
+            pekerjaan.progres,
+            text=f"Pekerjaan {pekerjaan.id} berjalan {pekerjaan.durasi:.1f} s"
+        )
+        if cuplikan is not None:
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Waktu Simulasi", f"{cuplikan.waktu:.0f} menit")
+            col2.metric("Dilayani", f"{cuplikan.dilayani:,} / {pekerjaan.config.NUM_MAHASISWA:,}")
+            col3.metric("Rata-rata Tunggu", f"{cuplikan.rata_tunggu:.2f} menit")
+            col4.metric("Panjang Antrian", f"{cuplikan.panjang_antrian:,}")
+    
+    # Pembatalan berlaku di irisan berikutnya dan terlihat pada polling berikutnya
+    if st.button("⛔ Batalkan Simulasi", key=f"batal_{pekerjaan.id}"):
+        manajer_pekerjaan.batalkan(pekerjaan.id)
+
+def hasil_latar_belakang(id_pekerjaan, config):
+    """(results, df, queue_lengths) bila pekerjaan selesai; selain itu tampilkan progres"""
+    pekerjaan = manajer_pekerjaan.ambil(id_pekerjaan)
+    if pekerjaan is None:
+        st.warning("Pekerjaan tidak ditemukan lagi (riwayat server dibersihkan). Jalankan ulang simulasi.")
+        return None, None, None
+    if pekerjaan.status == SELESAI:
+        results, df, queue_lengths = pekerjaan.hasil
+        results, df = geser_jam_mulai(results, df, config)
+        return results, df, queue_lengths
+    
+    # Polling hanya selama pekerjaan belum berakhir; halaman lain tetap interaktif
+    aktif = pekerjaan.status in (ANTRI, BERJALAN)
+    st.fragment(panel_pekerjaan, run_every=1.0 if aktif else None)(id_pekerjaan)
+    return None, None, None
+
+# ============================
+# ANALISIS SENSITIVITAS
+# ============================
+def tampilkan_analisis_sensitivitas(base_config, engine="fast"):
+    """Form sweep grid parameter dan tampilkan hasilnya secara bertahap"""
+    st.header("🔬 Analisis Sensitivitas Otomatis")
+    
+    with st.form("form_sensitivitas"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            grid_mahasiswa = st.multiselect(
+                "Jumlah Mahasiswa",
+                [100, 250, 500, 750, 1000, 1500, 2000],
+                default=[250, 500, 750, 1000, 1500]
+            )
+            grid_kelompok = st.multiselect(
+                "Jumlah Kelompok Staff", [1, 2, 3, 4, 5], default=[1, 2, 3, 4, 5]
+            )
+            grid_staff = st.multiselect(
+                "Staff per Kelompok", [1, 2, 3, 4, 5], default=[1, 2, 3, 4, 5]
+            )
+        
+        with col2:
+            grid_min_service = st.multiselect(
+                "Waktu Layanan Minimum (menit)",
+                [0.5, 1.0, 1.5, 2.0, 3.0],
+                default=[base_config.MIN_SERVICE_TIME]
+            )
+            grid_max_service = st.multiselect(
+                "Waktu Layanan Maksimum (menit)",
+                [2.0, 3.0, 4.0, 5.0, 6.0],
+                default=[base_config.MAX_SERVICE_TIME]
+            )
+            metrik = st.selectbox(
+                "Metrik Heatmap",
+                ['avg_waktu_tunggu', 'max_waktu_tunggu', 'waktu_selesai_terakhir', 'utilisasi_rata']
+            )
+        
+        jalankan = st.form_submit_button("🔬 Jalankan Sweep", use_container_width=True)
+    
+    if not jalankan:
+        return
+    
+    configs = buat_grid(
+        base_config,
+        num_mahasiswa=grid_mahasiswa,
+        num_kelompok=grid_kelompok,
+        num_staff_per_kelompok=grid_staff,
+        service_time=list(itertools.product(grid_min_service, grid_max_service))
+    )
+    if not configs:
+        st.warning("Grid kosong, pilih minimal satu nilai untuk tiap parameter.")
+        return
+    
+    # Sel yang sudah pernah dihitung di sesi ini tidak disimulasikan ulang
+    hasil_tersimpan = st.session_state.setdefault('sweep_cache', {})
+    sudah_ada = sum(kunci_sel(c, engine) in hasil_tersimpan for c in configs)
+    st.caption(
+        f"{len(configs)} sel grid, {sudah_ada} sudah dihitung sebelumnya "
+        f"(engine {engine}, {os.cpu_count()} core)."
+    )
+    
+    progress = st.progress(0.0)
+    slot_tabel = st.empty()
+    slot_heatmap = st.empty()
+    
+    baris = []
+    terakhir_render = 0.0
+    for baris_baru in jalankan_sweep(configs, engine=engine, hasil_tersimpan=hasil_tersimpan):
+        baris.append(baris_baru)
+        progress.progress(len(baris) / len(configs), text=f"{len(baris)}/{len(configs)} sel selesai")
+        
+        # Batasi frekuensi render agar sweep tidak didominasi biaya gambar
+        if time.perf_counter() - terakhir_render > 0.5 or len(baris) == len(configs):
+            df_sweep = sweep_dataframe(baris)
+            slot_tabel.dataframe(df_sweep, hide_index=True, use_container_width=True)
+            slot_heatmap.plotly_chart(
+                create_sensitivity_heatmap(df_sweep, metrik), use_container_width=True
+            )
+            terakhir_render = time.perf_counter()
+
+# ============================
+# OPTIMASI JUMLAH STAFF
+# ============================
+def tampilkan_optimasi_staff(base_config, engine="fast"):
+    """Form target waktu tunggu dan tampilkan konfigurasi staff termurah yang memenuhi"""
+    st.header("🎯 Optimasi Jumlah Staff")
+    
+    with st.form("form_optimasi_staff"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            metrik = st.selectbox("Metrik Target", METRIK_TARGET)
+            target = st.number_input("Target Maksimum (menit)", min_value=0.0, value=5.0, step=0.5)
+        
+        with col2:
+            max_kelompok = st.number_input("Maks. Jumlah Kelompok", min_value=1, max_value=10, value=5)
+            max_staff = st.number_input("Maks. Staff per Kelompok", min_value=1, max_value=10, value=5)
+        
+        jalankan = st.form_submit_button("🎯 Cari Staff Minimum", use_container_width=True)
+    
+    if jalankan:
+        st.session_state['optimasi_aktif'] = (metrik, target, max_kelompok, max_staff)
+    if 'optimasi_aktif' not in st.session_state:
+        return
+    
+    metrik, target, max_kelompok, max_staff = st.session_state['optimasi_aktif']
+    with st.spinner("Mencari konfigurasi staff..."):
+        hasil = cache_simulasi.get_or_compute(
+            hash_config('optimasi_staff', base_config, engine, metrik, target, max_kelompok, max_staff),
+            lambda: optimasi_staff(
+                base_config, target=target, metrik=metrik, max_kelompok=max_kelompok,
+                max_staff_per_kelompok=max_staff, engine=engine
+            )
+        )
+    
+    terbaik = hasil['terbaik']
+    if terbaik is None:
+        st.error(
+            f"❌ Tidak ada konfigurasi hingga {max_kelompok} kelompok × {max_staff} staff "
+            f"yang memenuhi {metrik} ≤ {target:.2f} menit."
+        )
+    else:
+        st.success(
+            f"✅ Termurah: **{terbaik['NUM_KELOMPOK']} kelompok × {terbaik['NUM_STAFF_PER_KELOMPOK']} staff "
+            f"= {terbaik['total_staff']} orang**, {metrik} rata-rata {terbaik['mean']:.2f} menit "
+            f"(CI 95% {terbaik['ci_bawah']:.2f}–{terbaik['ci_atas']:.2f}, {terbaik['n']} replikasi), "
+            f"keyakinan memenuhi target {terbaik['keyakinan'] * 100:.1f}%."
+        )
+    
+    st.caption(
+        f"{hasil['jumlah_run']} run simulasi, dibanding {hasil['jumlah_run_grid_min']}–"
+        f"{hasil['jumlah_run_grid_maks']} run untuk grid penuh dengan aturan replikasi "
+        f"yang sama; {hasil['jumlah_dipangkas']} konfigurasi "
+        f"dipangkas tanpa simulasi karena estimasi analitik jauh di atas target."
+    )
+    st.dataframe(hasil['evaluasi'], hide_index=True, use_container_width=True)
+
+# ============================
+# RIWAYAT RUN TERSIMPAN
+# ============================
+def tampilkan_riwayat_run():
+    """Tabel run dari penyimpanan persisten, bisa difilter jumlah mahasiswa dan diurutkan"""
+    penyimpanan = penyimpanan_aktif()
+    if penyimpanan is None:
+        return
+    
+    with st.expander(f"🗄️ Riwayat Run Tersimpan ({len(penyimpanan)} run)", expanded=False):
+        semua = penyimpanan.cari()
+        if semua.empty:
+            st.info("Belum ada run tersimpan.")
+            return
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            pilihan = sorted(semua['NUM_MAHASISWA'].unique().tolist())
+            jumlah = st.multiselect("Jumlah Mahasiswa", pilihan, key="riwayat_mahasiswa")
+        with col2:
+            urut = st.selectbox("Urutkan", KOLOM_METRIK, key="riwayat_urut")
+        
+        filter_run = {'NUM_MAHASISWA': jumlah} if jumlah else {}
+        df_run = penyimpanan.cari(urut=urut, **filter_run)
+        st.dataframe(df_run, hide_index=True, use_container_width=True)
+        st.caption(f"Penyimpanan: `{penyimpanan.path}`")
+
 # ============================
 # APLIKASI STREAMLIT
 # ============================
@@ -390,7 +724,7 @@ def main():
         num_mahasiswa = st.number_input(
             "Jumlah Mahasiswa", 
             min_value=100, 
-            max_value=2000, 
+            max_value=1_000_000, 
             value=500,
             step=50,
             help="Total mahasiswa yang akan dilayani"
@@ -432,6 +766,70 @@ def main():
             step=0.5
         )
         
+        tampilkan_estimasi_analitik(Config(
+            NUM_MAHASISWA=num_mahasiswa,
+            NUM_STAFF_PER_KELOMPOK=num_staff_per_kelompok,
+            NUM_KELOMPOK=num_kelompok,
+            MIN_SERVICE_TIME=min_service,
+            MAX_SERVICE_TIME=max_service
+        ))
+        
+        st.markdown("---")
+        
+        # Engine simulasi
+        st.subheader("🧮 Engine Simulasi")
+        engine = st.radio(
+            "Engine",
+            ["simpy", "fast"],
+            format_func=lambda e: "SimPy (DES)" if e == "simpy" else "Fast (heap FCFS)",
+            help="Fast menghitung antrian FCFS langsung tanpa SimPy, jauh lebih cepat untuk populasi besar"
+        )
+        
+        streaming = st.checkbox(
+            "Mode Streaming (memori konstan)",
+            help="Hanya simpan ringkasan (rata-rata, kuantil, histogram). "
+                 "Grafik per mahasiswa dan tabel data tidak tersedia."
+        )
+        
+        profiling = st.checkbox(
+            "Profiling Engine",
+            help="Hitung event per jenis dan waktu per proses SimPy (simulasi lebih lambat)"
+        )
+        
+        num_replikasi = st.number_input(
+            "Jumlah Replikasi",
+            min_value=1,
+            max_value=500,
+            value=1,
+            help="Lebih dari 1: jalankan replikasi independen paralel dan tampilkan CI 95%"
+        )
+        
+        antitetik = st.checkbox(
+            "Replikasi Antitetik",
+            help="Tiap replikasi = pasangan run U dan 1-U; CI lebih sempit untuk jumlah run yang sama"
+        )
+        
+        sekuensial = st.checkbox(
+            "Berhenti Otomatis (Presisi CI)",
+            help="Tambah replikasi per batch sampai half-width CI relatif tercapai; "
+                 "Jumlah Replikasi > 1 menjadi batas maksimum (selain itu 500)"
+        )
+        presisi = None
+        if sekuensial:
+            target_presisi = st.number_input(
+                "Target Half-width Relatif (%)", min_value=0.1, max_value=50.0, value=5.0, step=0.5
+            )
+            anggaran_waktu = st.number_input(
+                "Anggaran Waktu (detik)", min_value=1, max_value=600, value=30
+            )
+            presisi = (target_presisi / 100, float(anggaran_waktu))
+        
+        latar_belakang = st.checkbox(
+            "Jalankan di Latar Belakang",
+            help="Simulasi dikirim ke worker server; halaman tetap interaktif dan run bisa dibatalkan"
+        )
+        st.caption(manajer_pekerjaan.ringkasan())
+        
         st.markdown("---")
         
         # Jam mulai
@@ -455,6 +853,8 @@ def main():
             
         
         if reset_params:
+            st.session_state.pop('simulasi_aktif', None)
+            st.session_state.pop('id_pekerjaan', None)
             st.rerun()
     
     # Header utama
@@ -464,27 +864,49 @@ def main():
     dengan variasi jumlah staff dan mahasiswa.
     """)
     
-    # Jika tombol di-klik, jalankan simulasi
+    # Jika tombol di-klik, simpan konfigurasi agar hasil tetap tampil saat rerun
     if run_simulation:
-        with st.spinner("Menjalankan simulasi..."):
-            # Setup konfigurasi
-            config = Config(
+        st.session_state['simulasi_aktif'] = (
+            Config(
                 NUM_MAHASISWA=num_mahasiswa,
                 NUM_STAFF_PER_KELOMPOK=num_staff_per_kelompok,
                 NUM_KELOMPOK=num_kelompok,
                 MIN_SERVICE_TIME=min_service,
                 MAX_SERVICE_TIME=max_service,
                 START_HOUR=start_hour,
-                START_MINUTE=start_minute
+                START_MINUTE=start_minute,
+                STREAMING=streaming,
+                PROFILING=profiling
+            ),
+            engine,
+            num_replikasi,
+            antitetik,
+            presisi
+        )
+        if latar_belakang:
+            config_baru, engine_baru = st.session_state['simulasi_aktif'][:2]
+            st.session_state['id_pekerjaan'] = manajer_pekerjaan.kirim(
+                config_baru, engine_baru, pemilik=st.session_state.setdefault('id_sesi', uuid.uuid4().hex)
             )
-            
-            # Jalankan simulasi
-            model = KantinPrasmananDES(config)
-            results, df = model.run_simulation()
+        else:
+            st.session_state.pop('id_pekerjaan', None)
+    
+    if 'simulasi_aktif' in st.session_state:
+        config, engine, num_replikasi, antitetik, presisi = st.session_state['simulasi_aktif']
+        # Jam mulai hanya presentasi: diambil langsung dari sidebar tanpa klik ulang
+        config = replace(config, START_HOUR=start_hour, START_MINUTE=start_minute)
+        
+        id_pekerjaan = st.session_state.get('id_pekerjaan')
+        with st.spinner("Menjalankan simulasi..."):
+            # Jalankan simulasi (atau ambil dari cache jika konfigurasi sama)
+            if id_pekerjaan is not None:
+                results, df, queue_lengths = hasil_latar_belakang(id_pekerjaan, config)
+            else:
+                results, df, queue_lengths = simulasi_tercache(config, engine)
             
             if results:
                 # Tampilkan summary metrics
-                st.success(f"✅ Simulasi selesai! {num_mahasiswa} mahasiswa dilayani.")
+                st.success(f"✅ Simulasi selesai! {config.NUM_MAHASISWA} mahasiswa dilayani.")
                 
                 # Metrics utama
                 col1, col2, col3, col4 = st.columns(4)
@@ -502,7 +924,7 @@ def main():
                     )
                 
                 with col3:
-                    total_staff = num_kelompok * num_staff_per_kelompok
+                    total_staff = config.NUM_KELOMPOK * config.NUM_STAFF_PER_KELOMPOK
                     st.metric(
                         "👨•🍳 Total Staff",
                         f"{total_staff} orang"
@@ -515,6 +937,8 @@ def main():
                         f"{avg_util:.1f}%"
                     )
                 
+                tampilkan_deviasi_analitik(results, df, config)
+                
                 # Tampilkan detail hasil
                 with st.expander("📋 Detail Hasil Simulasi", expanded=False):
                     col_left, col_right = st.columns(2)
@@ -525,6 +949,11 @@ def main():
                         st.write(f"**Maksimum:** {results['max_waktu_tunggu']:.2f} menit")
                         st.write(f"**Minimum:** {results['min_waktu_tunggu']:.2f} menit")
                         st.write(f"**Standar Deviasi:** {results['std_waktu_tunggu']:.2f} menit")
+                        kuantil = results['kuantil_waktu_tunggu']
+                        st.write(
+                            f"**P50 / P90 / P99:** {kuantil['p50']:.2f} / "
+                            f"{kuantil['p90']:.2f} / {kuantil['p99']:.2f} menit"
+                        )
                         
                         st.subheader("Statistik Waktu Layanan")
                         st.write(f"**Rata-rata:** {results['avg_waktu_layanan']:.2f} menit")
@@ -533,85 +962,183 @@ def main():
                     with col_right:
                         st.subheader("Utilisasi per Kelompok")
                         for kelompok, util in results['utilisasi_kelompok'].items():
-                            st.write(f"**Kelompok {kelompok+1}:** {util:.1f}%")
+                            sibuk = results['avg_staff_sibuk'][kelompok]
+                            st.write(f"**Kelompok {kelompok+1}:** {util:.1f}% ({sibuk:.2f} staff sibuk rata-rata)")
+                        
+                        st.subheader("Antrian (Berbobot Waktu)")
+                        little = results['cek_little']
+                        st.write(f"**Rata-rata Panjang Antrian:** {results['avg_panjang_antrian']:.2f} orang")
+                        st.write(f"**Maksimum Panjang Antrian:** {results['max_panjang_antrian']} orang")
+                        st.write(
+                            f"**Hukum Little:** L = {little['L']:.2f} vs "
+                            f"λW = {little['lambda']:.3f} × {little['W']:.2f} = {little['lambda_W']:.2f} "
+                            f"(selisih {little['selisih_relatif']:.1e})"
+                        )
                         
                         st.subheader("Parameter Simulasi")
-                        st.write(f"**Jumlah Mahasiswa:** {num_mahasiswa}")
-                        st.write(f"**Jumlah Kelompok:** {num_kelompok}")
-                        st.write(f"**Staff per Kelompok:** {num_staff_per_kelompok}")
-                        st.write(f"**Total Staff:** {num_kelompok * num_staff_per_kelompok}")
-                        st.write(f"**Waktu Mulai:** {start_hour:02d}:{start_minute:02d}")
-                        st.write(f"**Rentang Waktu Layanan:** {min_service}-{max_service} menit")
-                
-                # VISUALISASI
-                st.markdown("---")
-                st.header("📊 Visualisasi Hasil")
-                
-                # Baris 1: Distribusi waktu tunggu dan timeline
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    fig_wait = create_wait_time_distribution(df)
-                    st.plotly_chart(fig_wait, use_container_width=True)
-                
-                with col2:
-                    fig_timeline = create_timeline_chart(df)
-                    st.plotly_chart(fig_timeline, use_container_width=True)
-                
-                # Baris 2: Distribusi per jam dan boxplot
-                col3, col4 = st.columns(2)
-                
-                with col3:
-                    fig_hourly = create_hourly_distribution_chart(results)
-                    st.plotly_chart(fig_hourly, use_container_width=True)
-                
-                with col4:
-                    fig_boxplot = create_service_time_boxplot(df, config)
-                    st.plotly_chart(fig_boxplot, use_container_width=True)
-                
-                # Baris 3: Panjang antrian dan gauge utilisasi
-                col5, col6 = st.columns(2)
+                        st.write(f"**Jumlah Mahasiswa:** {config.NUM_MAHASISWA}")
+                        st.write(f"**Jumlah Kelompok:** {config.NUM_KELOMPOK}")
+                        st.write(f"**Staff per Kelompok:** {config.NUM_STAFF_PER_KELOMPOK}")
+                        st.write(f"**Total Staff:** {config.NUM_KELOMPOK * config.NUM_STAFF_PER_KELOMPOK}")
+                        st.write(f"**Waktu Mulai:** {config.START_HOUR:02d}:{config.START_MINUTE:02d}")
+                        st.write(f"**Rentang Waktu Layanan:** {config.MIN_SERVICE_TIME}-{config.MAX_SERVICE_TIME} menit")
+                        st.write(f"**Jumlah Event Simulasi:** {results['jumlah_event']:,}")
                 
-                with col5:
-                    fig_queue = create_queue_length_chart(model)
-                    if fig_queue:
-                        st.plotly_chart(fig_queue, use_container_width=True)
+                tampilkan_steady_state(results['steady_state'])
                 
-                with col6:
-                    fig_gauge = create_utilization_gauge_chart(results, config)
-                    st.plotly_chart(fig_gauge, use_container_width=True)
+                if 'profil' in results:
+                    tampilkan_panel_performa(results['profil'])
                 
-                # Tampilkan data tabel
-                st.markdown("---")
-                st.subheader("📄 Data Hasil Simulasi")
+                if df is None:
+                    # Mode streaming: tidak ada data per mahasiswa, tampilkan histogram ber-bin
+                    tampilkan_visualisasi_streaming(results, config)
+                else:
+                    # VISUALISASI
+                    st.markdown("---")
+                    st.header("📊 Visualisasi Hasil")
+                    
+                    # Baris 1: Distribusi waktu tunggu dan timeline
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        fig_wait = create_wait_time_distribution(df)
+                        st.plotly_chart(fig_wait, use_container_width=True)
+                    
+                    with col2:
+                        fig_timeline = create_timeline_chart(df)
+                        st.plotly_chart(fig_timeline, use_container_width=True)
+                    
+                    # Baris 2: Distribusi per jam dan boxplot
+                    col3, col4 = st.columns(2)
+                    
+                    with col3:
+                        fig_hourly = create_hourly_distribution_chart(results)
+                        st.plotly_chart(fig_hourly, use_container_width=True)
+                    
+                    with col4:
+                        fig_boxplot = create_service_time_boxplot(df, config)
+                        st.plotly_chart(fig_boxplot, use_container_width=True)
+                    
+                    # Baris 3: Panjang antrian dan gauge utilisasi
+                    col5, col6 = st.columns(2)
+                    
+                    with col5:
+                        fig_queue = create_queue_length_chart(queue_lengths)
+                        if fig_queue:
+                            st.plotly_chart(fig_queue, use_container_width=True)
+                    
+                    with col6:
+                        fig_gauge = create_utilization_gauge_chart(results, config)
+                        st.plotly_chart(fig_gauge, use_container_width=True)
+                    
+                    # Tampilkan data tabel
+                    st.markdown("---")
+                    st.subheader("📄 Data Hasil Simulasi")
+                    
+                    with st.expander("Lihat Data", expanded=False):
+                        # Engine fast sudah urut id; hindari salinan sort yang tidak perlu
+                        df_urut = df if df['id'].is_monotonic_increasing else df.sort_values('id')
+                        st.dataframe(
+                            df_urut,
+                            column_config={
+                                "id": st.column_config.NumberColumn("ID Mahasiswa"),
+                                "waktu_tunggu": st.column_config.NumberColumn("Waktu Tunggu", format="%.2f"),
+                                "waktu_layanan": st.column_config.NumberColumn("Waktu Layanan", format="%.2f"),
+                                "jam_datang": st.column_config.DatetimeColumn("Waktu Datang"),
+                                "jam_selesai": st.column_config.DatetimeColumn("Waktu Selesai"),
+                                "kelompok": st.column_config.NumberColumn("Kelompok")
+                            },
+                            hide_index=True,
+                            use_container_width=True
+                        )
+                    
+                        # Tombol download: file dibuat saat diklik (Parquet/Arrow dari buffer yang sama)
+                        col_format, col_unduh = st.columns([1, 2])
+                        nama_format = col_format.selectbox(
+                            "Format", list(FORMAT_EKSPOR), label_visibility="collapsed"
+                        )
+                        _, ekstensi, mime = FORMAT_EKSPOR[nama_format]
+                        col_unduh.download_button(
+                            label=f"📥 Download Data {nama_format}",
+                            data=pembuat_unduhan(df_urut, nama_format),
+                            file_name=f"simulasi_kantin_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ekstensi}",
+                            mime=mime,
+                            use_container_width=True
+                        )
                 
-                with st.expander("Lihat Data", expanded=False):
+                # Replikasi sekuensial sampai presisi tercapai
+                if presisi is not None:
+                    st.markdown("---")
+                    st.subheader("🎯 Replikasi Sampai Presisi")
+                    target_presisi, anggaran_waktu = presisi
+                    
+                    with st.spinner(f"Menambah replikasi sampai half-width ≤ {target_presisi:.1%}..."):
+                        ringkasan, df_replikasi, info = cache_simulasi.get_or_compute(
+                            hash_config('replikasi_presisi', config_simulasi(config), engine, num_replikasi,
+                                        antitetik, target_presisi, anggaran_waktu),
+                            lambda: jalankan_sampai_presisi(
+                                config, target_presisi=target_presisi,
+                                anggaran_waktu=anggaran_waktu,
+                                n_maks=num_replikasi if num_replikasi > 1 else 500,
+                                engine=engine, antitetik=antitetik
+                            )
+                        )
+                    
+                    alasan = {
+                        'presisi': "target presisi tercapai",
+                        'anggaran_waktu': "anggaran waktu habis",
+                        'n_maks': "batas Jumlah Replikasi tercapai"
+                    }[info['alasan_berhenti']]
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("Replikasi Dibutuhkan", info['n_replikasi'])
+                    col2.metric("Durasi", f"{info['durasi']:.2f} s")
+                    col3.metric(
+                        "Half-width Relatif Terburuk",
+                        f"{max(info['presisi_relatif'].values()):.2%}"
+                    )
+                    if info['alasan_berhenti'] == 'presisi':
+                        st.success(
+                            f"✅ Berhenti: {alasan} (half-width ≤ {target_presisi:.1%} × |mean| "
+                            f"atau ≤ {TOLERANSI_ABSOLUT} menit)."
+                        )
+                    else:
+                        st.warning(f"⚠️ Berhenti: {alasan} sebelum presisi {target_presisi:.1%} tercapai.")
                     st.dataframe(
-                        df.sort_values('id'),
-                        column_config={
-                            "id": st.column_config.NumberColumn("ID Mahasiswa"),
-                            "waktu_tunggu": st.column_config.NumberColumn("Waktu Tunggu", format="%.2f"),
-                            "waktu_layanan": st.column_config.NumberColumn("Waktu Layanan", format="%.2f"),
-                            "jam_datang": st.column_config.DatetimeColumn("Waktu Datang"),
-                            "jam_selesai": st.column_config.DatetimeColumn("Waktu Selesai"),
-                            "kelompok": st.column_config.NumberColumn("Kelompok")
-                        },
-                        hide_index=True,
+                        ringkasan.style.format("{:.3f}"),
                         use_container_width=True
                     )
+                
+                # Replikasi independen
+                elif num_replikasi > 1:
+                    st.markdown("---")
+                    st.subheader("🔁 Replikasi Independen")
                     
-                    # Tombol download
-                    csv = df.to_csv(index=False).encode('utf-8')
-                    st.download_button(
-                        label="📥 Download Data CSV",
-                        data=csv,
-                        file_name=f"simulasi_kantin_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
+                    with st.spinner(f"Menjalankan {num_replikasi} replikasi..."):
+                        ringkasan, df_replikasi = cache_simulasi.get_or_compute(
+                            hash_config('replikasi', config_simulasi(config), engine, num_replikasi, antitetik),
+                            lambda: jalankan_replikasi(
+                                config, n_replikasi=num_replikasi, engine=engine,
+                                antitetik=antitetik
+                            )
+                        )
+                    
+                    st.dataframe(
+                        ringkasan.style.format("{:.2f}"),
                         use_container_width=True
                     )
-                
-                # Analisis sensitivitas otomatis
-            else:
+                    keterangan = (
+                        f"{num_replikasi} replikasi dengan seed independen "
+                        f"(SeedSequence.spawn dari seed {config.RANDOM_SEED}), CI 95% distribusi t."
+                    )
+                    if antitetik:
+                        faktor = ringkasan.loc['avg_waktu_tunggu', 'faktor_reduksi_varians']
+                        keterangan += (
+                            f" Tiap replikasi adalah pasangan antitetik ({2 * num_replikasi} run); "
+                            f"varians rata-rata waktu tunggu {faktor:.1f}× lebih kecil "
+                            f"dibanding {2 * num_replikasi} run independen."
+                        )
+                    st.caption(keterangan)
+            elif id_pekerjaan is None:
                 st.error("❌ Gagal menjalankan simulasi!")
     
     else:
@@ -647,6 +1174,34 @@ def main():
             st.write("📈 **Timeline Pelayanan**")
             st.info("Chart akan muncul setelah simulasi dijalankan")
     
+    # Analisis sensitivitas otomatis
+    st.markdown("---")
+    tampilkan_analisis_sensitivitas(
+        Config(
+            NUM_MAHASISWA=num_mahasiswa,
+            NUM_STAFF_PER_KELOMPOK=num_staff_per_kelompok,
+            NUM_KELOMPOK=num_kelompok,
+            MIN_SERVICE_TIME=min_service,
+            MAX_SERVICE_TIME=max_service
+        )
+    )
+    
+    # Optimasi jumlah staff untuk parameter lain di sidebar
+    st.markdown("---")
+    tampilkan_optimasi_staff(
+        Config(
+            NUM_MAHASISWA=num_mahasiswa,
+            MIN_SERVICE_TIME=min_service,
+            MAX_SERVICE_TIME=max_service
+        )
+    )
+    
+    st.markdown("---")
+    tampilkan_riwayat_run()
+    
+    # Statistik cache (ditulis terakhir agar hit/miss rerun ini ikut terhitung)
+    st.sidebar.caption(cache_simulasi.ringkasan())
+    
     # Footer
     st.markdown("---")
     st.caption(
@@ -0,0 +1,346 @@
+"""Benchmark performa simulasi kantin (SimPy & fast) dan piket
+
+Contoh:
+    python benchmark.py --profil cepat                  # ukur, bandingkan dengan baseline
+    python benchmark.py --profil lengkap --simpan-baseline
+
+Setiap kasus dijalankan di proses baru agar memori puncak dan cache antar
+kasus tidak saling memengaruhi. Hasil disimpan sebagai JSON lalu
+dibandingkan dengan baseline (benchmark_baseline.json, profil "cepat",
+ikut di repo): kasus yang lebih lambat/boros dari toleransi ditandai REGRESI
+dan program keluar dengan kode 1. Bila file baseline tidak ada, program
+keluar dengan kode 2 kecuali --tanpa-baseline atau --simpan-baseline.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import importlib
+import tracemalloc
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import simpy
+from kantin_des import Config, KantinPrasmananDES
+from simulasi_piket import PARAMETER_PIKET, jalankan_piket
+
+try:
+    import resource
+except ImportError:     # Windows: memori diukur dengan tracemalloc
+    resource = None
+
+# ============================
+# DAFTAR KASUS
+# ============================
+PROFIL = {
+    'cepat': {
+        'mahasiswa_fast': [100, 1_000, 10_000],
+        'mahasiswa_simpy': [100, 1_000, 10_000],
+        'kelompok_staff': [1, 5],
+        'meja': [60, 1_000, 10_000]
+    },
+    'lengkap': {
+        'mahasiswa_fast': [100, 1_000, 10_000, 100_000, 1_000_000],
+        'mahasiswa_simpy': [100, 1_000, 10_000, 100_000],
+        'kelompok_staff': [1, 2, 3, 4, 5],
+        'meja': [60, 300, 1_000, 3_000, 10_000]
+    }
+}
+
+# Metrik yang dibandingkan dengan baseline, beserta selisih absolut minimum
+# agar derau pengukuran pada kasus yang sangat cepat tidak dianggap regresi
+METRIK_BANDING = {
+    'waktu_total': 0.005,
+    'waktu_analisis': 0.005,
+    'waktu_plot': 0.005,
+    'memori_puncak_mb': 5.0
+}
+
+def daftar_kasus(profil: str) -> list:
+    """Susun semua kasus benchmark untuk satu profil"""
+    p = PROFIL[profil]
+    kasus = []
+    for engine, kunci in (('fast', 'mahasiswa_fast'), ('simpy', 'mahasiswa_simpy')):
+        for n in p[kunci]:
+            kasus.append({
+                'id': f"kantin-{engine}-n{n}-k2s2",
+                'model': "kantin", 'engine': engine,
+                'config': {'NUM_MAHASISWA': n}
+            })
+        # Variasi jumlah kelompok dan staff per kelompok pada N menengah
+        n = 10_000 if engine == 'fast' else 1_000
+        for k in p['kelompok_staff']:
+            for s in p['kelompok_staff']:
+                if (k, s) == (2, 2) and n in p[kunci]:
+                    continue
+                kasus.append({
+                    'id': f"kantin-{engine}-n{n}-k{k}s{s}",
+                    'model': "kantin", 'engine': engine,
+                    'config': {'NUM_MAHASISWA': n, 'NUM_KELOMPOK': k,
+                               'NUM_STAFF_PER_KELOMPOK': s}
+                })
+    for meja in p['meja']:
+        kasus.append({
+            'id': f"piket-meja{meja}-r1",
+            'model': "piket", 'replikasi': 1,
+            'parameter': {**PARAMETER_PIKET, 'total_meja': meja}
+        })
+    kasus.append({
+        'id': "piket-meja60-r1000",
+        'model': "piket", 'replikasi': 1_000,
+        'parameter': dict(PARAMETER_PIKET)
+    })
+    return kasus
+
+# ============================
+# PENGUKURAN SATU KASUS
+# ============================
+def _rss_puncak_mb() -> float:
+    # ru_maxrss dalam KB di Linux, byte di macOS
+    skala = 1024**2 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / skala
+
+def buat_semua_plot(model, results, df) -> int:
+    """Bangun semua grafik app_latihan dan serialisasi ke JSON (ukuran byte)"""
+    import app_latihan as app
+
+    figur = [
+        app.create_wait_time_distribution(df),
+        app.create_timeline_chart(df),
+        app.create_hourly_distribution_chart(results),
+        app.create_service_time_boxplot(df, model.config),
+        app.create_queue_length_chart(model.statistics['queue_lengths']),
+        app.create_utilization_gauge_chart(results, model.config)
+    ]
+    return sum(len(fig.to_json()) for fig in figur if fig is not None)
+
+def _jalankan_kantin(kasus: dict, dengan_plot: bool) -> dict:
+    waktu_mulai = time.perf_counter()
+    model = KantinPrasmananDES(Config(**kasus['config']))
+    results, df = model.run_simulation(engine=kasus['engine'])
+    waktu_total = time.perf_counter() - waktu_mulai
+
+    # run_simulation sudah termasuk analisis; ulangi untuk mengukurnya terpisah
+    mulai = time.perf_counter()
+    model.analyze_results()
+    waktu_analisis = time.perf_counter() - mulai
+
+    ukuran_plot, waktu_plot = None, None
+    if dengan_plot and df is not None:
+        mulai = time.perf_counter()
+        ukuran_plot = buat_semua_plot(model, results, df)
+        waktu_plot = time.perf_counter() - mulai
+
+    waktu_simulasi = waktu_total - waktu_analisis
+    n = kasus['config']['NUM_MAHASISWA']
+    return {
+        'waktu_total': waktu_total,
+        'waktu_simulasi': waktu_simulasi,
+        'waktu_analisis': waktu_analisis,
+        'waktu_plot': waktu_plot,
+        'jumlah_event': model.jumlah_event or None,
+        'event_per_detik': model.jumlah_event / waktu_simulasi if model.jumlah_event else None,
+        'mahasiswa_per_detik': n / waktu_total,
+        'ukuran_plot_kb': ukuran_plot / 1024 if ukuran_plot else None
+    }
+
+def _jalankan_piket(kasus: dict) -> dict:
+    mulai = time.perf_counter()
+    hasil = jalankan_piket(kasus['parameter'], replikasi=kasus['replikasi'])
+    waktu_total = time.perf_counter() - mulai
+    ompreng = hasil.waktu_selesai.size
+    return {
+        'waktu_total': waktu_total,
+        'waktu_simulasi': waktu_total,
+        'waktu_analisis': None,
+        'waktu_plot': None,
+        'jumlah_event': None,
+        'event_per_detik': None,
+        'ompreng_per_detik': ompreng / waktu_total
+    }
+
+def ukur_kasus(kasus: dict, ulang: int = 3, dengan_plot: bool = True,
+               batas_waktu: float = 2.0) -> dict:
+    """Jalankan satu kasus beberapa kali dan ambil waktu tercepat per tahap
+
+    Pengulangan dihentikan lebih awal bila satu putaran sudah lebih lama
+    dari batas_waktu detik (kasus besar cukup diukur sekali).
+    """
+    if resource is None:
+        tracemalloc.start()
+    else:
+        rss_awal = _rss_puncak_mb()
+
+    putaran = []
+    for _ in range(ulang):
+        if kasus['model'] == "kantin":
+            putaran.append(_jalankan_kantin(kasus, dengan_plot))
+        else:
+            putaran.append(_jalankan_piket(kasus))
+        if putaran[-1]['waktu_total'] > batas_waktu:
+            break
+
+    if resource is None:
+        memori = tracemalloc.get_traced_memory()[1] / 1024**2
+        tracemalloc.stop()
+    else:
+        memori = _rss_puncak_mb() - rss_awal
+
+    hasil = dict(putaran[0])
+    for kunci, nilai in hasil.items():
+        if kunci.startswith('waktu_') and nilai is not None:
+            hasil[kunci] = min(p[kunci] for p in putaran)
+    for kunci in ('event_per_detik', 'mahasiswa_per_detik', 'ompreng_per_detik'):
+        if hasil.get(kunci) is not None:
+            hasil[kunci] = max(p[kunci] for p in putaran)
+
+    return {
+        'id': kasus['id'],
+        'model': kasus['model'],
+        'engine': kasus.get('engine'),
+        **kasus.get('config', {}),
+        **({'total_meja': kasus['parameter']['total_meja'],
+            'replikasi': kasus['replikasi']} if kasus['model'] == "piket" else {}),
+        **hasil,
+        'memori_puncak_mb': memori,
+        'jumlah_putaran': len(putaran)
+    }
+
+def ukur_terisolasi(kasus: dict, **kwargs) -> dict:
+    """ukur_kasus() di proses anak baru (memori puncak tidak tercampur)"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(ukur_kasus, kasus, **kwargs).result()
+
+# ============================
+# BASELINE DAN REGRESI
+# ============================
+def info_lingkungan(profil: str) -> dict:
+    return {
+        'waktu': datetime.now().isoformat(timespec='seconds'),
+        'profil': profil,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'simpy': simpy.__version__
+    }
+
+def bandingkan(hasil: list, baseline: list, toleransi: float = 0.25) -> pd.DataFrame:
+    """Bandingkan hasil dengan baseline per kasus dan metrik
+
+    Status REGRESI jika nilai sekarang > baseline * (1 + toleransi) dan
+    selisihnya melebihi ambang absolut di METRIK_BANDING.
+    """
+    lama = {b['id']: b for b in baseline}
+    baris = []
+    for h in hasil:
+        if h['id'] not in lama:
+            continue
+        for metrik, ambang in METRIK_BANDING.items():
+            nilai_lama, nilai_baru = lama[h['id']].get(metrik), h.get(metrik)
+            if nilai_lama is None or nilai_baru is None:
+                continue
+            rasio = nilai_baru / nilai_lama if nilai_lama > 0 else float('inf')
+            selisih = nilai_baru - nilai_lama
+            if rasio > 1 + toleransi and selisih > ambang:
+                status = "REGRESI"
+            elif rasio < 1 / (1 + toleransi) and -selisih > ambang:
+                status = "lebih baik"
+            else:
+                status = "ok"
+            baris.append({
+                'id': h['id'], 'metrik': metrik,
+                'baseline': nilai_lama, 'sekarang': nilai_baru,
+                'rasio': rasio, 'status': status
+            })
+    return pd.DataFrame(baris, columns=['id', 'metrik', 'baseline', 'sekarang', 'rasio', 'status'])
+
+def simpan_json(path: str, meta: dict, hasil: list):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'hasil': hasil}, f, indent=2)
+
+def baca_json(path: str) -> tuple:
+    """(meta, hasil) dari file JSON hasil benchmark"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('meta', {}), data['hasil']
+
+# ============================
+# ENTRY POINT
+# ============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark simulasi kantin dan piket")
+    parser.add_argument('--profil', choices=sorted(PROFIL), default='cepat')
+    parser.add_argument('-o', '--output', default='benchmark_hasil.json',
+                        help="file JSON hasil benchmark")
+    parser.add_argument('--baseline', default='benchmark_baseline.json',
+                        help="file JSON baseline untuk deteksi regresi")
+    parser.add_argument('--simpan-baseline', action='store_true',
+                        help="simpan hasil ini sebagai baseline baru")
+    parser.add_argument('--tanpa-baseline', action='store_true',
+                        help="ukur saja tanpa membandingkan dengan baseline")
+    parser.add_argument('--toleransi', type=float, default=0.25,
+                        help="kenaikan relatif yang masih diterima (default 0.25 = 25%%)")
+    parser.add_argument('--ulang', type=int, default=3,
+                        help="jumlah pengulangan per kasus (diambil yang tercepat)")
+    parser.add_argument('--filter', default='',
+                        help="hanya jalankan kasus yang id-nya memuat teks ini")
+    parser.add_argument('--tanpa-plot', action='store_true',
+                        help="lewati tahap pembuatan grafik (tanpa impor Streamlit/Plotly)")
+    args = parser.parse_args(argv)
+
+    bandingkan_baseline = not (args.simpan_baseline or args.tanpa_baseline)
+    if bandingkan_baseline and not os.path.exists(args.baseline):
+        # Dicek sebelum mengukur: tanpa baseline, regresi tidak bisa dideteksi
+        parser.error(f"baseline {args.baseline} tidak ditemukan; buat dengan "
+                     f"--simpan-baseline atau lewati dengan --tanpa-baseline")
+
+    dengan_plot = not args.tanpa_plot
+    if dengan_plot:
+        # Impor sekali di proses induk; proses anak (fork) tinggal mewarisi
+        importlib.import_module('app_latihan')
+
+    semua_kasus = [k for k in daftar_kasus(args.profil) if args.filter in k['id']]
+    hasil = []
+    for i, kasus in enumerate(semua_kasus, 1):
+        h = ukur_terisolasi(kasus, ulang=args.ulang, dengan_plot=dengan_plot)
+        hasil.append(h)
+        print(f"[{i}/{len(semua_kasus)}] {h['id']:<32} "
+              f"{h['waktu_total']:8.3f} s  {h['memori_puncak_mb']:8.1f} MB", file=sys.stderr)
+
+    meta = info_lingkungan(args.profil)
+    simpan_json(args.output, meta, hasil)
+
+    kolom = ['id', 'waktu_total', 'waktu_simulasi', 'waktu_analisis', 'waktu_plot',
+             'event_per_detik', 'memori_puncak_mb']
+    print(pd.DataFrame(hasil)[kolom].to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+
+    kode_keluar = 0
+    if bandingkan_baseline:
+        meta_baseline, baseline = baca_json(args.baseline)
+        beda = [k for k in ('platform', 'cpu', 'python') if meta_baseline.get(k) != meta[k]]
+        if beda:
+            # Waktu hanya sebanding di mesin yang sama; buat baseline lokal bila perlu
+            print(f"Peringatan: baseline diukur di lingkungan lain ({', '.join(beda)} berbeda)",
+                  file=sys.stderr)
+        perbandingan = bandingkan(hasil, baseline, args.toleransi)
+        regresi = perbandingan[perbandingan['status'] == "REGRESI"]
+        print(f"\nDibandingkan dengan {args.baseline} (toleransi {args.toleransi:.0%}):")
+        if regresi.empty:
+            print("Tidak ada regresi.")
+        else:
+            print(regresi.to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+            kode_keluar = 1
+
+    if args.simpan_baseline:
+        simpan_json(args.baseline, meta, hasil)
+        print(f"\nBaseline disimpan ke {args.baseline}")
+
+    return kode_keluar
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import sys
+import json
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass, fields
+
+# ============================
+# CACHE HASIL SIMULASI (LRU)
+# ============================
+def _kanonik(obj):
+    """Ubah objek menjadi struktur JSON yang urutannya stabil"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {'__tipe__': type(obj).__name__, **_kanonik(asdict(obj))}
+    if isinstance(obj, dict):
+        return {str(k): _kanonik(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(obj, (list, tuple)):
+        return [_kanonik(v) for v in obj]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, float) and obj.is_integer():
+        # 2 dan 2.0 dari widget Streamlit harus menghasilkan kunci yang sama
+        return int(obj)
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    return str(obj)
+
+def hash_config(*objs) -> str:
+    """Hash kanonik (SHA-256) dari Config, dict parameter, atau kombinasinya"""
+    teks = json.dumps(_kanonik(list(objs)), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(teks.encode('utf-8')).hexdigest()
+
+def perkiraan_ukuran(obj) -> int:
+    """Perkiraan ukuran memori (byte) hasil simulasi yang akan di-cache"""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(perkiraan_ukuran(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(perkiraan_ukuran(v) for v in obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return sum(perkiraan_ukuran(getattr(obj, f.name)) for f in fields(obj))
+    return sys.getsizeof(obj)
+
+_KOSONG = object()
+
+class LRUCache:
+    """Cache LRU thread-safe dengan batas jumlah entri dan total ukuran"""
+
+    def __init__(self, max_entri: int = 32, max_bytes: int = 512 * 1024**2):
+        self.max_entri = max_entri
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, kunci):
+        return kunci in self._data
+
+    def get(self, kunci, default=None):
+        with self._lock:
+            if kunci not in self._data:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(kunci)
+            return self._data[kunci][0]
+
+    def put(self, kunci, nilai):
+        ukuran = perkiraan_ukuran(nilai)
+        with self._lock:
+            if kunci in self._data:
+                self.total_bytes -= self._data.pop(kunci)[1]
+            # Hasil yang lebih besar dari seluruh kapasitas tidak disimpan
+            if ukuran > self.max_bytes:
+                return
+            self._data[kunci] = (nilai, ukuran)
+            self.total_bytes += ukuran
+            while len(self._data) > self.max_entri or self.total_bytes > self.max_bytes:
+                _, (_, ukuran_lama) = self._data.popitem(last=False)
+                self.total_bytes -= ukuran_lama
+                self.evictions += 1
+
+    def get_or_compute(self, kunci, fungsi):
+        """Ambil dari cache, atau hitung dengan fungsi() lalu simpan"""
+        nilai = self.get(kunci, _KOSONG)
+        if nilai is _KOSONG:
+            nilai = fungsi()
+            self.put(kunci, nilai)
+        return nilai
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def statistik(self) -> dict:
+        return {
+            'entri': len(self._data),
+            'max_entri': self.max_entri,
+            'total_mb': self.total_bytes / 1024**2,
+            'max_mb': self.max_bytes / 1024**2,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def ringkasan(self) -> str:
+        s = self.statistik()
+        return (f"Cache: {s['hits']} hit, {s['misses']} miss, "
+                f"{s['entri']}/{s['max_entri']} entri, "
+                f"{s['total_mb']:.1f}/{s['max_mb']:.0f} MB")
+
+# Satu cache per proses server, dipakai bersama oleh semua sesi pengguna
+cache_simulasi = LRUCache()
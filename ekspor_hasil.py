@@ -0,0 +1,52 @@
+import io
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pandas as pd
+
+# ============================
+# EKSPOR HASIL (ARROW / PARQUET)
+# ============================
+def ke_tabel(df: pd.DataFrame) -> pa.Table:
+    """Tabel Arrow dari DataFrame; kolom numerik/datetime dibungkus tanpa salinan"""
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+def ke_parquet(tabel: pa.Table) -> bytes:
+    buffer = io.BytesIO()
+    pq.write_table(tabel, buffer, compression='zstd')
+    return buffer.getvalue()
+
+def ke_arrow_ipc(tabel: pa.Table) -> bytes:
+    """File Arrow IPC (Feather v2), bisa dibuka langsung dengan pyarrow/pandas/polars"""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, tabel.schema) as writer:
+        writer.write_table(tabel)
+    return sink.getvalue().to_pybytes()
+
+def ke_csv(tabel: pa.Table) -> bytes:
+    return tabel.to_pandas().to_csv(index=False).encode('utf-8')
+
+# Nama format -> (fungsi tulis, ekstensi file, MIME)
+FORMAT_EKSPOR = {
+    'Parquet': (ke_parquet, 'parquet', 'application/vnd.apache.parquet'),
+    'Arrow IPC': (ke_arrow_ipc, 'arrow', 'application/vnd.apache.arrow.file'),
+    'CSV': (ke_csv, 'csv', 'text/csv'),
+}
+
+def pembuat_unduhan(df: pd.DataFrame, nama_format: str = 'Parquet'):
+    """Callable tanpa argumen untuk st.download_button(data=...)
+
+    File baru dibuat saat tombol diklik, bukan di setiap rerun.
+    """
+    tulis = FORMAT_EKSPOR[nama_format][0]
+    return lambda: tulis(ke_tabel(df))
+
+def tulis_file(df: pd.DataFrame, path: str):
+    """Tulis DataFrame ke .parquet, .arrow/.feather, atau CSV sesuai ekstensi"""
+    if path.endswith('.parquet'):
+        pq.write_table(ke_tabel(df), path, compression='zstd')
+    elif path.endswith(('.arrow', '.feather')):
+        tabel = ke_tabel(df)
+        with pa.ipc.new_file(path, tabel.schema) as writer:
+            writer.write_table(tabel)
+    else:
+        df.to_csv(path, index=False)
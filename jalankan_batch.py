@@ -0,0 +1,216 @@
+"""Jalankan skenario simulasi dari file JSON/TOML tanpa Streamlit
+
+Contoh:
+    python jalankan_batch.py skenario.toml -o hasil.parquet --workers 4
+    python jalankan_batch.py skenario.toml --store hasil_run/run_store.sqlite
+
+File TOML berisi tabel [[skenario]]; file JSON berisi list skenario atau
+{"skenario": [...]}. Tiap skenario boleh memuat:
+    nama       label skenario di file hasil (default "skenario_<i>")
+    model      "kantin" (default) atau "piket"
+    engine     "fast" (default) atau "simpy", hanya untuk model kantin
+    replikasi  jumlah replikasi (default 1)
+serta field Config (mis. NUM_MAHASISWA) untuk model kantin, atau kunci
+PARAMETER_PIKET (mis. total_meja) untuk model piket.
+
+Dengan --store, run kantin yang sudah ada di penyimpanan run tidak
+disimulasikan ulang, dan run baru ikut disimpan.
+"""
+import time
+
+_MULAI_IMPOR = time.perf_counter()
+
+import os
+import sys
+import json
+import argparse
+import tomllib
+from dataclasses import fields, replace
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from kantin_des import Config
+from replikasi import seed_replikasi, jalankan_satu_replikasi
+from simulasi_piket import PARAMETER_PIKET, jalankan_piket
+from penyimpanan_run import ENV_PENYIMPANAN
+
+WAKTU_IMPOR = time.perf_counter() - _MULAI_IMPOR
+
+# ============================
+# MEMBACA FILE SKENARIO
+# ============================
+KUNCI_UMUM = {'nama', 'model', 'engine', 'replikasi'}
+ENGINE_KANTIN = ("fast", "simpy")
+TIPE_CONFIG = {f.name: f.type for f in fields(Config)}
+TIPE_PIKET = {nama: type(nilai) for nama, nilai in PARAMETER_PIKET.items()}
+
+def baca_skenario(path: str) -> list:
+    """Baca daftar skenario dari file .json atau .toml"""
+    if path.endswith('.toml'):
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('skenario', [])
+    if not isinstance(data, list) or not data:
+        raise ValueError(f"{path}: tidak ada skenario (butuh list atau [[skenario]])")
+    return [validasi_skenario(s, i) for i, s in enumerate(data)]
+
+def tipe_cocok(nilai, tipe: type) -> bool:
+    """True bila nilai dari file skenario sesuai tipe field (int boleh untuk float)"""
+    if tipe is bool:
+        return isinstance(nilai, bool)
+    if isinstance(nilai, bool):
+        return False
+    if tipe is float:
+        return isinstance(nilai, (int, float))
+    return isinstance(nilai, tipe)
+
+def validasi_skenario(skenario: dict, indeks: int) -> dict:
+    """Lengkapi nilai default, tolak kunci yang tidak dikenal dan nilai bertipe salah"""
+    skenario = dict(skenario)
+    skenario.setdefault('nama', f"skenario_{indeks}")
+    skenario.setdefault('model', "kantin")
+    skenario.setdefault('replikasi', 1)
+    nama = skenario['nama']
+
+    if skenario['model'] == "kantin":
+        tipe_parameter = TIPE_CONFIG
+        skenario.setdefault('engine', "fast")
+        if skenario['engine'] not in ENGINE_KANTIN:
+            raise ValueError(f"{nama}: engine '{skenario['engine']}' tidak dikenal "
+                             f"(pilih {' atau '.join(ENGINE_KANTIN)})")
+    elif skenario['model'] == "piket":
+        tipe_parameter = TIPE_PIKET
+        if 'engine' in skenario:
+            raise ValueError(f"{nama}: model piket tidak memakai engine")
+    else:
+        raise ValueError(f"{nama}: model '{skenario['model']}' tidak dikenal")
+
+    asing = set(skenario) - KUNCI_UMUM - set(tipe_parameter)
+    if asing:
+        raise ValueError(f"{nama}: parameter tidak dikenal {sorted(asing)}")
+    for kunci, tipe in [('replikasi', int), *tipe_parameter.items()]:
+        if kunci in skenario and not tipe_cocok(skenario[kunci], tipe):
+            raise ValueError(f"{nama}: {kunci} harus bertipe {tipe.__name__}, "
+                             f"bukan {type(skenario[kunci]).__name__} ({skenario[kunci]!r})")
+    if skenario['replikasi'] < 1:
+        raise ValueError(f"{nama}: replikasi harus >= 1")
+    return skenario
+
+# ============================
+# MENJALANKAN SKENARIO
+# ============================
+def buat_tugas(skenario: dict) -> list:
+    """Pecah skenario menjadi tugas independen yang bisa dijalankan paralel"""
+    parameter = {k: v for k, v in skenario.items() if k not in KUNCI_UMUM}
+    if skenario['model'] == "piket":
+        # Semua replikasi piket dihitung sekaligus oleh engine vektor
+        return [(skenario, {**PARAMETER_PIKET, **parameter}, None)]
+
+    config = Config(**parameter)
+    # Sama dengan jalankan_replikasi: seed anak dari SeedSequence.spawn, juga
+    # untuk satu replikasi agar replikasi ke-i tidak berubah saat jumlahnya ditambah
+    return [
+        (skenario, replace(config, RANDOM_SEED=seed), i)
+        for i, seed in enumerate(seed_replikasi(config.RANDOM_SEED, skenario['replikasi']))
+    ]
+
+def jalankan_tugas(tugas) -> list:
+    """Jalankan satu tugas dan kembalikan baris-baris hasilnya"""
+    skenario, parameter, replikasi = tugas
+    if skenario['model'] == "piket":
+        hasil = jalankan_piket(parameter, replikasi=skenario['replikasi'])
+        return [
+            {
+                'skenario': skenario['nama'],
+                'model': "piket",
+                'replikasi': r,
+                'waktu_total_detik': float(hasil.waktu_total[r]),
+                'total_lauk_detik': float(hasil.total_lauk[r]),
+                'total_angkat_detik': float(hasil.total_angkat[r]),
+                'total_nasi_detik': float(hasil.total_nasi[r])
+            }
+            for r in range(skenario['replikasi'])
+        ]
+
+    mulai = time.perf_counter()
+    metrik = jalankan_satu_replikasi(parameter, skenario['engine'])
+    return [{
+        'skenario': skenario['nama'],
+        'model': "kantin",
+        'engine': skenario['engine'],
+        'replikasi': replikasi,
+        # Seed 128 bit tidak muat di kolom int64, ditulis sebagai teks
+        'seed': str(parameter.RANDOM_SEED),
+        **metrik,
+        'durasi_detik': time.perf_counter() - mulai
+    }]
+
+def jalankan_batch(daftar_skenario: list, max_workers: int = 1) -> pd.DataFrame:
+    """Jalankan semua skenario dan gabungkan hasilnya menjadi satu DataFrame"""
+    semua_tugas = [t for s in daftar_skenario for t in buat_tugas(s)]
+    max_workers = min(max_workers or os.cpu_count() or 1, len(semua_tugas))
+
+    if max_workers <= 1:
+        hasil = list(map(jalankan_tugas, semua_tugas))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            hasil = list(executor.map(jalankan_tugas, semua_tugas))
+
+    df = pd.DataFrame([baris for baris_tugas in hasil for baris in baris_tugas])
+    # Kolom replikasi tetap bilangan bulat (bukan float) di semua format keluaran
+    if 'replikasi' in df:
+        df['replikasi'] = df['replikasi'].astype('Int64')
+    return df
+
+def tulis_hasil(df: pd.DataFrame, path: str):
+    """Tulis hasil ke CSV, Parquet, atau Arrow IPC (.arrow/.feather) sesuai ekstensi file"""
+    # Impor lokal: pyarrow hanya dimuat bila hasil memang ditulis ke file
+    from ekspor_hasil import tulis_file
+    tulis_file(df, path)
+
+# ============================
+# ENTRY POINT
+# ============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Jalankan skenario simulasi kantin/piket dari file JSON atau TOML"
+    )
+    parser.add_argument('skenario', help="file skenario (.json atau .toml)")
+    parser.add_argument('-o', '--output',
+                        help="file hasil (.csv, .parquet, atau .arrow); default CSV ke stdout")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="jumlah proses paralel (0 = semua core)")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="tampilkan waktu impor dan waktu eksekusi ke stderr")
+    parser.add_argument('--store',
+                        help="database penyimpanan run (SQLite); default dari $KANTIN_RUN_STORE")
+    args = parser.parse_args(argv)
+
+    if args.store:
+        # Di-set sebelum pool dibuat agar worker ikut mewarisinya
+        os.environ[ENV_PENYIMPANAN] = args.store
+
+    try:
+        daftar_skenario = baca_skenario(args.skenario)
+    except (OSError, ValueError, TypeError, tomllib.TOMLDecodeError) as e:
+        parser.error(str(e))
+
+    mulai = time.perf_counter()
+    df = jalankan_batch(daftar_skenario, max_workers=args.workers)
+    durasi = time.perf_counter() - mulai
+
+    if args.output:
+        tulis_hasil(df, args.output)
+    else:
+        df.to_csv(sys.stdout, index=False)
+
+    if args.verbose:
+        print(f"Impor modul: {WAKTU_IMPOR:.2f} s, "
+              f"{len(daftar_skenario)} skenario / {len(df)} baris dalam {durasi:.2f} s",
+              file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,828 @@
+import simpy
+import time
+import heapq
+import numpy as np
+from collections import deque
+from datetime import datetime, timedelta
+import pandas as pd
+from typing import TYPE_CHECKING
+from dataclasses import dataclass, replace
+from statistik import (
+    Welford, RataRataWaktu, SketsaKuantil, HistogramTetap, RataRataBatch,
+    cek_little, analisis_steady_state
+)
+from profil_engine import ProfilEngine, EnvironmentProfil
+from variat_acak import PenyediaVariat, seragam, eksponensial
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Jeda cek ulang staff bebas pada DISPATCH_MODE "polling" (menit)
+JEDA_POLLING = 0.01
+
+MENIT_PER_HARI = 24 * 60
+
+# Naikkan bila perubahan model mengubah hasil untuk Config yang sama
+# (run lama di penyimpanan_run tidak lagi dipakai)
+VERSI_MODEL = 1
+
+# ============================
+# KONFIGURASI SIMULASI
+# ============================
+@dataclass
+class Config:
+    """Konfigurasi parameter simulasi"""
+    # Parameter dasar
+    NUM_MAHASISWA: int = 500
+    NUM_STAFF_PER_KELOMPOK: int = 2
+    NUM_KELOMPOK: int = 2
+    
+    # Distribusi waktu
+    MIN_SERVICE_TIME: float = 1.0
+    MAX_SERVICE_TIME: float = 3.0
+    
+    # Waktu kedatangan
+    MEAN_INTERARRIVAL: float = 120 / 500
+    
+    # Jam mulai
+    START_HOUR: int = 8
+    START_MINUTE: int = 0
+    
+    # Seed untuk reproduktibilitas
+    RANDOM_SEED: int = 42
+    
+    # Mode pembagian staff: "event" (dibangunkan saat staff bebas)
+    # atau "polling" (cek ulang setiap 0.01 menit, perilaku lama)
+    DISPATCH_MODE: str = "event"
+    
+    # Mode streaming: hanya simpan ringkasan (memori konstan, tanpa DataFrame)
+    STREAMING: bool = False
+    
+    # Profiling engine: hitung event per jenis dan waktu per proses (lebih lambat)
+    PROFILING: bool = False
+    
+    # Replikasi antitetik: setiap bilangan acak U diganti 1-U
+    ANTITETIK: bool = False
+
+# ============================
+# PEREKAM STATISTIK KOLOMNAR
+# ============================
+def offset_ke_jam(start_time: datetime, waktu_simulasi) -> pd.DatetimeIndex:
+    """Konversi vektor waktu simulasi (menit) ke datetime64, presisi mikrodetik seperti timedelta"""
+    mikrodetik = np.round(np.asarray(waktu_simulasi, dtype=np.float64) * 60e6).astype(np.int64)
+    return pd.Timestamp(start_time) + pd.to_timedelta(mikrodetik, unit='us')
+
+def dtype_kelompok(jumlah_kelompok: int) -> np.dtype:
+    """Tipe integer terkecil untuk indeks kelompok 0..jumlah_kelompok-1"""
+    return np.min_scalar_type(max(int(jumlah_kelompok) - 1, 0))
+
+class RekamanMahasiswa:
+    """Data per mahasiswa dalam array NumPy yang dialokasikan di awal"""
+    
+    def __init__(self, kapasitas: int, jumlah_kelompok: int):
+        kapasitas = max(int(kapasitas), 1)
+        self.n = 0
+        self.id = np.empty(kapasitas, dtype=np.int32)
+        self.waktu_datang = np.empty(kapasitas, dtype=np.float64)
+        self.waktu_mulai = np.empty(kapasitas, dtype=np.float64)
+        self.waktu_selesai = np.empty(kapasitas, dtype=np.float64)
+        self.waktu_layanan = np.empty(kapasitas, dtype=np.float64)
+        self.kelompok = np.empty(kapasitas, dtype=dtype_kelompok(jumlah_kelompok))
+    
+    def __len__(self):
+        return self.n
+    
+    def catat(self, mahasiswa_id, waktu_datang, waktu_mulai, waktu_selesai,
+              waktu_layanan, kelompok):
+        i = self.n
+        if i == len(self.id):
+            self._perbesar()
+        self.id[i] = mahasiswa_id
+        self.waktu_datang[i] = waktu_datang
+        self.waktu_mulai[i] = waktu_mulai
+        self.waktu_selesai[i] = waktu_selesai
+        self.waktu_layanan[i] = waktu_layanan
+        self.kelompok[i] = kelompok
+        self.n = i + 1
+    
+    def catat_banyak(self, id_awal, waktu_datang, waktu_mulai, waktu_layanan, kelompok):
+        """Catat satu blok mahasiswa berurutan (id_awal, id_awal+1, ...)"""
+        jumlah = len(waktu_datang)
+        while self.n + jumlah > len(self.id):
+            self._perbesar()
+        blok = slice(self.n, self.n + jumlah)
+        self.id[blok] = np.arange(id_awal, id_awal + jumlah)
+        self.waktu_datang[blok] = waktu_datang
+        self.waktu_mulai[blok] = waktu_mulai
+        np.add(waktu_mulai, waktu_layanan, out=self.waktu_selesai[blok])
+        self.waktu_layanan[blok] = waktu_layanan
+        self.kelompok[blok] = kelompok
+        self.n += jumlah
+    
+    def _perbesar(self):
+        for nama in ['id', 'waktu_datang', 'waktu_mulai', 'waktu_selesai',
+                     'waktu_layanan', 'kelompok']:
+            lama = getattr(self, nama)
+            baru = np.empty(2 * len(lama), dtype=lama.dtype)
+            baru[:len(lama)] = lama
+            setattr(self, nama, baru)
+    
+    @property
+    def waktu_tunggu(self) -> np.ndarray:
+        return self.waktu_mulai[:self.n] - self.waktu_datang[:self.n]
+    
+    def to_arrow(self, start_time: datetime) -> 'pa.Table':
+        """Tabel Arrow yang membungkus array rekaman tanpa menyalin (kolom jam dihitung baru)"""
+        # Impor lokal: run streaming dan worker replikasi tidak perlu memuat pyarrow
+        import pyarrow as pa
+        n = self.n
+        return pa.table({
+            'id': self.id[:n],
+            'waktu_datang': self.waktu_datang[:n],
+            'waktu_mulai': self.waktu_mulai[:n],
+            'waktu_selesai': self.waktu_selesai[:n],
+            'waktu_tunggu': self.waktu_tunggu,
+            'waktu_layanan': self.waktu_layanan[:n],
+            'kelompok': self.kelompok[:n],
+            'jam_datang': offset_ke_jam(start_time, self.waktu_datang[:n]),
+            'jam_selesai': offset_ke_jam(start_time, self.waktu_selesai[:n])
+        })
+    
+    def to_dataframe(self, start_time: datetime) -> pd.DataFrame:
+        """DataFrame dengan kolom yang sama seperti daftar dict per mahasiswa
+        
+        Kolom berbagi buffer dengan tabel Arrow (split_blocks: tanpa konsolidasi
+        blok), sehingga ekspor Parquet/Arrow dari DataFrame ini juga tanpa salinan.
+        """
+        return self.to_arrow(start_time).to_pandas(split_blocks=True)
+
+class RingkasanStreaming:
+    """Pengganti RekamanMahasiswa untuk mode streaming: hanya ringkasan bermemori tetap
+    
+    Data per mahasiswa ditampung di buffer kecil lalu dilipat ke akumulator
+    Welford, sketsa kuantil dan histogram bin tetap. Ringkasan dari replikasi
+    paralel dapat digabung dengan gabung().
+    """
+    
+    def __init__(self, min_layanan: float, max_layanan: float,
+                 batas_tunggu: float = 240.0, jumlah_bin: int = 60, ukuran_buffer: int = 8192):
+        self.n = 0
+        self.tunggu = Welford()
+        self.layanan = Welford()
+        self.sketsa_tunggu = SketsaKuantil()
+        self.histogram_tunggu = HistogramTetap(0.0, batas_tunggu, jumlah_bin)
+        self.histogram_layanan = HistogramTetap(min_layanan, max_layanan, jumlah_bin // 2)
+        self.selesai_terakhir = 0.0
+        # Selesai per menit simulasi (mod 24 jam): jam mulai cukup diterapkan saat dibaca
+        self.selesai_per_menit = np.zeros(MENIT_PER_HARI, dtype=np.int64)
+        
+        self._j = 0
+        self._datang = np.empty(ukuran_buffer)
+        self._mulai = np.empty(ukuran_buffer)
+        self._layanan = np.empty(ukuran_buffer)
+    
+    def __len__(self):
+        return self.n + self._j
+    
+    def catat(self, mahasiswa_id, waktu_datang, waktu_mulai, waktu_selesai,
+              waktu_layanan, kelompok):
+        j = self._j
+        self._datang[j] = waktu_datang
+        self._mulai[j] = waktu_mulai
+        self._layanan[j] = waktu_layanan
+        self._j = j + 1
+        if self._j == len(self._datang):
+            self.flush()
+    
+    def catat_banyak(self, id_awal, waktu_datang, waktu_mulai, waktu_layanan, kelompok):
+        self.flush()
+        self._lipat(np.asarray(waktu_datang), np.asarray(waktu_mulai), np.asarray(waktu_layanan))
+    
+    def flush(self):
+        if self._j:
+            j, self._j = self._j, 0
+            self._lipat(self._datang[:j], self._mulai[:j], self._layanan[:j])
+    
+    def _lipat(self, waktu_datang, waktu_mulai, waktu_layanan):
+        if len(waktu_datang) == 0:
+            return
+        waktu_tunggu = waktu_mulai - waktu_datang
+        waktu_selesai = waktu_mulai + waktu_layanan
+        
+        self.n += len(waktu_datang)
+        self.tunggu.tambah_banyak(waktu_tunggu)
+        self.layanan.tambah_banyak(waktu_layanan)
+        self.sketsa_tunggu.tambah_banyak(waktu_tunggu)
+        self.histogram_tunggu.tambah_banyak(waktu_tunggu)
+        self.histogram_layanan.tambah_banyak(waktu_layanan)
+        self.selesai_terakhir = max(self.selesai_terakhir, float(waktu_selesai.max()))
+        
+        # Menit selesai dalam mikrodetik, sama seperti offset_ke_jam
+        mikrodetik = np.round(waktu_selesai * 60e6).astype(np.int64)
+        menit = (mikrodetik // 60_000_000) % MENIT_PER_HARI
+        self.selesai_per_menit += np.bincount(menit, minlength=MENIT_PER_HARI)
+    
+    def gabung(self, lain: 'RingkasanStreaming'):
+        """Gabungkan ringkasan dari replikasi lain"""
+        self.flush()
+        lain.flush()
+        self.n += lain.n
+        self.tunggu.gabung(lain.tunggu)
+        self.layanan.gabung(lain.layanan)
+        self.sketsa_tunggu.gabung(lain.sketsa_tunggu)
+        self.histogram_tunggu.gabung(lain.histogram_tunggu)
+        self.histogram_layanan.gabung(lain.histogram_layanan)
+        self.selesai_terakhir = max(self.selesai_terakhir, lain.selesai_terakhir)
+        self.selesai_per_menit += lain.selesai_per_menit
+    
+    def distribusi_jam(self, start_time: datetime) -> dict:
+        """Jumlah mahasiswa selesai per jam dinding untuk jam mulai tertentu (menit bulat)"""
+        geser = start_time.hour * 60 + start_time.minute
+        per_jam = np.roll(self.selesai_per_menit, geser).reshape(24, 60).sum(axis=1)
+        return {jam: int(jumlah) for jam, jumlah in enumerate(per_jam) if jumlah > 0}
+
+# ============================
+# CUPLIKAN SIMULASI BERTAHAP
+# ============================
+@dataclass
+class Cuplikan:
+    """Hasil sementara yang di-yield selama simulasi berjalan bertahap"""
+    waktu: float            # waktu simulasi (menit) saat cuplikan diambil
+    dilayani: int           # mahasiswa yang sudah tercatat
+    rata_tunggu: float      # rata-rata waktu tunggu berjalan (menit)
+    panjang_antrian: int    # panjang antrian saat ini
+    progres: float          # dilayani / NUM_MAHASISWA
+    hasil: tuple = None     # (results, df), hanya pada cuplikan terakhir
+    
+    @property
+    def selesai(self) -> bool:
+        return self.hasil is not None
+
+# ============================
+# MODEL SIMULASI
+# ============================
+class KantinPrasmananDES:
+    def __init__(self, config: Config):
+        self.config = config
+        
+        # Environment berinstrumen hanya bila profiling diminta
+        if config.PROFILING:
+            self.profil = ProfilEngine(
+                jeda_polling=JEDA_POLLING if config.DISPATCH_MODE == "polling" else None
+            )
+            self.env = EnvironmentProfil(self.profil)
+        else:
+            self.profil = None
+            self.env = simpy.Environment()
+        
+        # Resources: Staff per kelompok
+        self.kelompok_staff = [
+            simpy.Resource(self.env, capacity=config.NUM_STAFF_PER_KELOMPOK)
+            for _ in range(config.NUM_KELOMPOK)
+        ]
+        
+        # Antrian tunggal untuk semua mahasiswa
+        self.antrian = simpy.Store(self.env)
+        
+        # Mahasiswa yang menunggu staff (mode event), urut FCFS
+        self.menunggu_staff = deque()
+        
+        # Jumlah event yang diproses environment
+        self.jumlah_event = 0
+        
+        # Waktu mulai simulasi
+        self.start_time = datetime(2024, 1, 1, config.START_HOUR, config.START_MINUTE)
+        
+        # Statistik
+        if config.STREAMING:
+            rekaman = RingkasanStreaming(config.MIN_SERVICE_TIME, config.MAX_SERVICE_TIME)
+        else:
+            rekaman = RekamanMahasiswa(config.NUM_MAHASISWA, config.NUM_KELOMPOK)
+        
+        self.statistics = {
+            'mahasiswa_data': rekaman,
+            'queue_lengths': [],
+            'queue_times': [],
+            'service_times': []
+        }
+        
+        # Monitor berbobot waktu (memori O(1), tanpa daftar per event)
+        self.monitor_antrian = RataRataWaktu()
+        self.monitor_sibuk = [RataRataWaktu() for _ in range(config.NUM_KELOMPOK)]
+        self.akumulator_tunggu = Welford()
+        # Rata-rata per batch waktu tunggu untuk deteksi warm-up (memori terbatas)
+        self.batch_tunggu = RataRataBatch()
+        
+        # Stream acak terpisah per keperluan (common random numbers): jumlah
+        # staff tidak mengubah kedatangan maupun waktu layanan mahasiswa ke-i.
+        # Variat ditarik per blok oleh numpy Generator (lihat variat_acak.py)
+        seed_kedatangan, seed_layanan = np.random.SeedSequence(config.RANDOM_SEED).spawn(2)
+        self.variat_kedatangan = PenyediaVariat(
+            seed_kedatangan, eksponensial(config.MEAN_INTERARRIVAL),
+            antitetik=config.ANTITETIK
+        )
+        self.variat_layanan = PenyediaVariat(
+            seed_layanan, seragam(config.MIN_SERVICE_TIME, config.MAX_SERVICE_TIME),
+            antitetik=config.ANTITETIK
+        )
+    
+    def waktu_ke_jam(self, waktu_simulasi: float) -> datetime:
+        return self.start_time + timedelta(minutes=waktu_simulasi)
+    
+    def waktu_ke_jam_array(self, waktu_simulasi: np.ndarray) -> pd.DatetimeIndex:
+        """Versi vektor waktu_ke_jam"""
+        return offset_ke_jam(self.start_time, waktu_simulasi)
+    
+    def generate_service_time(self) -> float:
+        return self.variat_layanan.ambil()
+    
+    def generate_interarrival_time(self) -> float:
+        return self.variat_kedatangan.ambil()
+    
+    def proses_mahasiswa(self, mahasiswa_id: int):
+        waktu_datang = self.env.now
+        
+        # 1. Masuk ke antrian
+        yield self.antrian.put(mahasiswa_id)
+        
+        # Catat panjang antrian
+        if not self.config.STREAMING:
+            self.statistics['queue_lengths'].append({
+                'time': self.env.now,
+                'queue_length': len(self.antrian.items)
+            })
+        self.monitor_antrian.ubah(self.env.now, len(self.antrian.items))
+        
+        # 2. Tunggu sampai ada staff yang tersedia
+        if self.config.DISPATCH_MODE == "polling":
+            kelompok_terpilih = None
+            
+            while kelompok_terpilih is None:
+                kelompok_terpilih = self.cari_kelompok_bebas()
+                
+                if kelompok_terpilih is None:
+                    yield self.env.timeout(JEDA_POLLING)
+            
+            request = None
+        else:
+            dipanggil = self.env.event()
+            self.menunggu_staff.append(dipanggil)
+            self.dispatch_staff()
+            kelompok_terpilih, request = yield dipanggil
+        
+        # 3. Keluar dari antrian
+        yield self.antrian.get()
+        self.monitor_antrian.ubah(self.env.now, len(self.antrian.items))
+        
+        # 4. Catat waktu mulai layanan dan waktu tunggu
+        waktu_mulai_layanan = self.env.now
+        self.akumulator_tunggu.tambah(waktu_mulai_layanan - waktu_datang)
+        self.batch_tunggu.tambah(waktu_mulai_layanan - waktu_datang, waktu_mulai_layanan)
+        
+        # 5. Gunakan staff dari kelompok terpilih
+        if request is None:
+            request = self.kelompok_staff[kelompok_terpilih].request()
+        
+        kelompok = self.kelompok_staff[kelompok_terpilih]
+        monitor_sibuk = self.monitor_sibuk[kelompok_terpilih]
+        
+        with request:
+            yield request
+            
+            # Catat utilisasi
+            monitor_sibuk.ubah(self.env.now, kelompok.count)
+            
+            # 6. Proses layanan
+            service_time = self.generate_service_time()
+            yield self.env.timeout(service_time)
+            
+            # 7. Selesai
+            waktu_selesai = self.env.now
+            
+            # Simpan data mahasiswa (jam_datang/jam_selesai dihitung saat analisis)
+            self.statistics['mahasiswa_data'].catat(
+                mahasiswa_id, waktu_datang, waktu_mulai_layanan, waktu_selesai,
+                service_time, kelompok_terpilih
+            )
+        
+        monitor_sibuk.ubah(self.env.now, kelompok.count)
+        
+        # 8. Staff kembali bebas, panggil mahasiswa berikutnya
+        if self.config.DISPATCH_MODE != "polling":
+            self.dispatch_staff()
+    
+    def cari_kelompok_bebas(self):
+        """Indeks kelompok pertama yang masih punya staff bebas"""
+        for i, kelompok in enumerate(self.kelompok_staff):
+            if kelompok.count < kelompok.capacity:
+                return i
+        return None
+    
+    def dispatch_staff(self):
+        """Bangunkan mahasiswa terdepan selama masih ada staff bebas"""
+        while self.menunggu_staff:
+            kelompok_terpilih = self.cari_kelompok_bebas()
+            if kelompok_terpilih is None:
+                break
+            
+            # Request langsung dipenuhi sehingga slot staff tidak
+            # bisa diambil mahasiswa lain pada waktu yang sama
+            request = self.kelompok_staff[kelompok_terpilih].request()
+            self.menunggu_staff.popleft().succeed((kelompok_terpilih, request))
+    
+    def proses_kedatangan(self):
+        for i in range(self.config.NUM_MAHASISWA):
+            self.env.process(self.proses_mahasiswa(i))
+            
+            if i < self.config.NUM_MAHASISWA - 1:
+                interarrival = self.generate_interarrival_time()
+                yield self.env.timeout(interarrival)
+    
+    def run_simulation(self, engine: str = "simpy"):
+        for cuplikan in self.jalankan_bertahap(engine, jumlah_irisan=1):
+            pass
+        return cuplikan.hasil
+    
+    def jalankan_bertahap(self, engine: str = "simpy", jumlah_irisan: int = 20):
+        """Generator: jalankan simulasi per irisan dan yield Cuplikan tiap irisan
+        
+        Engine SimPy maju per irisan waktu selebar horizon kedatangan dibagi
+        jumlah_irisan; engine fast maju per blok mahasiswa. Cuplikan terakhir
+        membawa hasil akhir (results, df) yang sama dengan run_simulation().
+        """
+        if engine == "fast":
+            n = self.config.NUM_MAHASISWA
+            ukuran_blok = min(8192, max(1, -(-n // jumlah_irisan)))
+            tahapan = self._fast_bertahap(ukuran_blok)
+        else:
+            tahapan = self._simpy_bertahap(jumlah_irisan)
+        
+        if self.profil is None:
+            yield from tahapan
+        else:
+            self.profil.engine = engine
+            yield from self._profil_bertahap(tahapan)
+    
+    def _profil_bertahap(self, tahapan):
+        """Ukur waktu engine (tanpa jeda di antara cuplikan) dan lampirkan profil"""
+        while True:
+            mulai = time.perf_counter()
+            try:
+                cuplikan = next(tahapan)
+            except StopIteration:
+                return
+            self.profil.waktu_engine += time.perf_counter() - mulai
+            if cuplikan.selesai and cuplikan.hasil[0] is not None:
+                cuplikan.hasil[0]['profil'] = self.profil.ringkasan()
+            yield cuplikan
+    
+    def _hasil_akhir(self):
+        mulai = time.perf_counter()
+        hasil = self.analyze_results()
+        if self.profil is not None:
+            self.profil.waktu_analisis = time.perf_counter() - mulai
+        return hasil
+    
+    def _simpy_bertahap(self, jumlah_irisan: int):
+        """Isi jalankan_bertahap untuk engine SimPy"""
+        self.env.process(self.proses_kedatangan())
+        
+        horizon = self.config.NUM_MAHASISWA * self.config.MEAN_INTERARRIVAL
+        lebar_irisan = max(horizon / jumlah_irisan, 1e-9)
+        batas = lebar_irisan
+        
+        # Setara env.run(until=batas) per irisan, sekaligus menghitung event
+        env = self.env
+        while True:
+            while env.peek() < batas:
+                env.step()
+                self.jumlah_event += 1
+            if env.peek() == float('inf'):
+                break
+            yield self._cuplikan(batas, len(self.antrian.items))
+            batas += lebar_irisan
+        
+        rekaman = self.statistics['mahasiswa_data']
+        if self.config.STREAMING:
+            rekaman.flush()
+        else:
+            self.statistics['queue_times'] = rekaman.waktu_tunggu
+            self.statistics['service_times'] = rekaman.waktu_layanan[:rekaman.n]
+        
+        yield self._cuplikan(env.now, 0, self._hasil_akhir())
+    
+    def _cuplikan(self, waktu, panjang_antrian, hasil=None) -> Cuplikan:
+        dilayani = len(self.statistics['mahasiswa_data'])
+        return Cuplikan(
+            waktu=waktu,
+            dilayani=dilayani,
+            rata_tunggu=self.akumulator_tunggu.mean,
+            panjang_antrian=panjang_antrian,
+            progres=dilayani / max(self.config.NUM_MAHASISWA, 1),
+            hasil=hasil
+        )
+    
+    def run_fast(self, ukuran_blok: int = 8192):
+        """Antrian FCFS multi-server tanpa SimPy (rekursi Lindley dengan heap)
+        
+        Setiap kelompok menyimpan heap waktu bebas staff-nya. Mahasiswa dilayani
+        kelompok pertama yang punya staff bebas saat ia datang, atau kelompok
+        yang paling cepat bebas jika semua staff sedang melayani. Hasil ditulis
+        ke rekaman per blok sehingga mode streaming tetap bermemori konstan.
+        """
+        for cuplikan in self._fast_bertahap(ukuran_blok):
+            pass
+        return cuplikan.hasil
+    
+    def _fast_bertahap(self, ukuran_blok: int):
+        """Isi run_fast dalam bentuk generator, yield Cuplikan setiap blok"""
+        n = self.config.NUM_MAHASISWA
+        if n <= 0:
+            yield self._cuplikan(0.0, 0, (None, None))
+            return
+        
+        staff_bebas = [
+            [0.0] * self.config.NUM_STAFF_PER_KELOMPOK
+            for _ in range(self.config.NUM_KELOMPOK)
+        ]
+        urutan_kelompok = range(self.config.NUM_KELOMPOK)
+        
+        # Event yang belum dimasukkan ke monitor: waktu mulai mahasiswa yang
+        # masih di antrian (tidak pernah turun) dan waktu selesai per kelompok
+        mulai_tertunda = deque()
+        selesai_tertunda = [[] for _ in urutan_kelompok]
+        monitor_antrian = self.monitor_antrian
+        panjang_antrian = 0
+        
+        rekaman = self.statistics['mahasiswa_data']
+        simpan_antrian = not self.config.STREAMING
+        sampel_antrian = []
+        
+        m = min(ukuran_blok, n)
+        blok_datang = np.empty(m)
+        blok_mulai = np.empty(m)
+        blok_layanan = np.empty(m)
+        # dtype sama dengan RekamanMahasiswa.kelompok agar catat_banyak tidak memotong nilai
+        blok_kelompok = np.empty(m, dtype=dtype_kelompok(self.config.NUM_KELOMPOK))
+        blok_antrian = np.empty(m, dtype=np.int32)
+        
+        def simpan_blok(id_awal, jumlah):
+            rekaman.catat_banyak(
+                id_awal, blok_datang[:jumlah], blok_mulai[:jumlah],
+                blok_layanan[:jumlah], blok_kelompok[:jumlah]
+            )
+            tunggu = blok_mulai[:jumlah] - blok_datang[:jumlah]
+            self.akumulator_tunggu.tambah_banyak(tunggu)
+            self.batch_tunggu.tambah_banyak(tunggu, blok_mulai[:jumlah])
+            if simpan_antrian:
+                sampel_antrian.append((blok_datang[:jumlah].copy(), blok_antrian[:jumlah].copy()))
+        
+        t = 0.0
+        for awal in range(0, n, m):
+            jumlah = min(m, n - awal)
+            # Variat satu blok ditarik sekaligus; urutannya sama dengan ambil()
+            # per mahasiswa, jadi hasilnya identik dengan engine SimPy
+            blok_antar = self.variat_kedatangan.ambil_banyak(jumlah - (awal == 0)).tolist()
+            if awal == 0:
+                blok_antar.insert(0, 0.0)  # mahasiswa pertama datang di t = 0
+            blok_layanan[:jumlah] = self.variat_layanan.ambil_banyak(jumlah)
+            
+            for j, (antar, service_time) in enumerate(zip(blok_antar, blok_layanan[:jumlah].tolist())):
+                t += antar
+                
+                # Mahasiswa yang sudah mulai dilayani keluar dari antrian
+                while mulai_tertunda and mulai_tertunda[0] <= t:
+                    panjang_antrian -= 1
+                    monitor_antrian.ubah(mulai_tertunda.popleft(), panjang_antrian)
+                panjang_antrian += 1
+                monitor_antrian.ubah(t, panjang_antrian)
+                
+                # Kelompok pertama yang bebas, atau yang paling cepat bebas
+                k = 0
+                for g in urutan_kelompok:
+                    if staff_bebas[g][0] <= t:
+                        k = g
+                        break
+                    if staff_bebas[g][0] < staff_bebas[k][0]:
+                        k = g
+                
+                mulai = max(t, staff_bebas[k][0])
+                selesai = mulai + service_time
+                heapq.heapreplace(staff_bebas[k], selesai)
+                mulai_tertunda.append(mulai)
+                
+                # Staff sibuk: selesaikan layanan sebelum `mulai`, lalu tambah satu
+                tertunda = selesai_tertunda[k]
+                monitor_sibuk = self.monitor_sibuk[k]
+                while tertunda and tertunda[0] <= mulai:
+                    monitor_sibuk.ubah(heapq.heappop(tertunda), monitor_sibuk.level - 1)
+                monitor_sibuk.ubah(mulai, monitor_sibuk.level + 1)
+                heapq.heappush(tertunda, selesai)
+                
+                blok_datang[j] = t
+                blok_mulai[j] = mulai
+                blok_kelompok[j] = k
+                blok_antrian[j] = panjang_antrian
+            
+            simpan_blok(awal, jumlah)
+            if awal + jumlah < n:
+                yield self._cuplikan(t, panjang_antrian)
+        
+        # Tutup monitor dengan event yang tersisa
+        while mulai_tertunda:
+            panjang_antrian -= 1
+            monitor_antrian.ubah(mulai_tertunda.popleft(), panjang_antrian)
+        for k in urutan_kelompok:
+            monitor_sibuk = self.monitor_sibuk[k]
+            while selesai_tertunda[k]:
+                monitor_sibuk.ubah(heapq.heappop(selesai_tertunda[k]), monitor_sibuk.level - 1)
+        
+        if simpan_antrian:
+            self.statistics['queue_lengths'] = {
+                'time': np.concatenate([w for w, _ in sampel_antrian]),
+                'queue_length': np.concatenate([q for _, q in sampel_antrian])
+            }
+            self.statistics['queue_times'] = rekaman.waktu_tunggu
+            self.statistics['service_times'] = rekaman.waktu_layanan[:rekaman.n]
+        
+        yield self._cuplikan(t, 0, self._hasil_akhir())
+    
+    def analyze_results(self):
+        rekaman = self.statistics['mahasiswa_data']
+        if not rekaman:
+            return None, None
+        
+        if self.config.STREAMING:
+            df = None
+            results = self.ringkas_streaming(rekaman)
+        else:
+            df = rekaman.to_dataframe(self.start_time)
+            results = self.ringkas_dataframe(df)
+        
+        # Utilisasi dan panjang antrian rata-rata berbobot waktu dari monitor
+        total_simulation_time = results['waktu_selesai_terakhir']
+        results['avg_staff_sibuk'] = {}
+        for kelompok, monitor in enumerate(self.monitor_sibuk):
+            sibuk = monitor.rata_rata(total_simulation_time)
+            results['avg_staff_sibuk'][kelompok] = sibuk
+            results['utilisasi_kelompok'][kelompok] = (
+                sibuk / self.config.NUM_STAFF_PER_KELOMPOK * 100
+            )
+        
+        results['avg_panjang_antrian'] = self.monitor_antrian.rata_rata(total_simulation_time)
+        results['max_panjang_antrian'] = int(self.monitor_antrian.maks)
+        results['cek_little'] = cek_little(
+            results['avg_panjang_antrian'],
+            self.akumulator_tunggu.n,
+            self.akumulator_tunggu.mean,
+            total_simulation_time
+        )
+        
+        # Warm-up (MSER-5) dan CI batch means waktu tunggu dari run ini saja
+        steady = analisis_steady_state(self.batch_tunggu)
+        if steady is not None:
+            steady['jam_potong'] = self.waktu_ke_jam(steady['waktu_potong'])
+        results['steady_state'] = steady
+        results['start_time'] = self.start_time
+        
+        return results, df
+    
+    def ringkas_dataframe(self, df):
+        """Statistik dasar dari DataFrame per mahasiswa"""
+        return {
+            'total_mahasiswa': len(df),
+            'waktu_selesai_terakhir': df['waktu_selesai'].max(),
+            'jam_selesai_terakhir': self.waktu_ke_jam(df['waktu_selesai'].max()),
+            
+            # Statistik waktu tunggu
+            'avg_waktu_tunggu': df['waktu_tunggu'].mean(),
+            'max_waktu_tunggu': df['waktu_tunggu'].max(),
+            'min_waktu_tunggu': df['waktu_tunggu'].min(),
+            'std_waktu_tunggu': df['waktu_tunggu'].std(),
+            
+            # Statistik waktu layanan
+            'avg_waktu_layanan': df['waktu_layanan'].mean(),
+            'total_waktu_layanan': df['waktu_layanan'].sum(),
+            
+            # Utilisasi
+            'utilisasi_kelompok': {},
+            
+            # Distribusi per jam
+            'distribusi_jam': self.calculate_hourly_distribution(df),
+            
+            # Kuantil waktu tunggu (eksak)
+            'kuantil_waktu_tunggu': dict(zip(
+                ['p50', 'p90', 'p99'],
+                np.percentile(df['waktu_tunggu'], [50, 90, 99]).tolist()
+            )),
+            
+            # Beban event environment
+            'jumlah_event': self.jumlah_event
+        }
+    
+    def ringkas_streaming(self, ringkasan: RingkasanStreaming):
+        """Statistik dasar dari RingkasanStreaming, kunci sama dengan ringkas_dataframe"""
+        ringkasan.flush()
+        sketsa = ringkasan.sketsa_tunggu
+        return {
+            'total_mahasiswa': ringkasan.n,
+            'waktu_selesai_terakhir': ringkasan.selesai_terakhir,
+            'jam_selesai_terakhir': self.waktu_ke_jam(ringkasan.selesai_terakhir),
+            
+            # Statistik waktu tunggu
+            'avg_waktu_tunggu': ringkasan.tunggu.mean,
+            'max_waktu_tunggu': ringkasan.tunggu.max,
+            'min_waktu_tunggu': ringkasan.tunggu.min,
+            'std_waktu_tunggu': ringkasan.tunggu.std,
+            
+            # Statistik waktu layanan
+            'avg_waktu_layanan': ringkasan.layanan.mean,
+            'total_waktu_layanan': ringkasan.layanan.total,
+            
+            # Utilisasi
+            'utilisasi_kelompok': {},
+            
+            # Distribusi per jam
+            'distribusi_jam': ringkasan.distribusi_jam(self.start_time),
+            
+            # Kuantil waktu tunggu (perkiraan sketsa, galat relatif alpha)
+            'kuantil_waktu_tunggu': {
+                'p50': sketsa.kuantil(0.50),
+                'p90': sketsa.kuantil(0.90),
+                'p99': sketsa.kuantil(0.99)
+            },
+            'histogram_waktu_tunggu': ringkasan.histogram_tunggu,
+            'histogram_waktu_layanan': ringkasan.histogram_layanan,
+            'ringkasan_streaming': ringkasan,
+            
+            # Beban event environment
+            'jumlah_event': self.jumlah_event
+        }
+    
+    def calculate_hourly_distribution(self, df):
+        return distribusi_jam_dataframe(df)
+
+# ============================
+# LAPISAN PRESENTASI (JAM MULAI)
+# ============================
+# Field Config yang hanya menggeser jam dinding, tidak mengubah jalannya simulasi
+FIELD_PRESENTASI = ('START_HOUR', 'START_MINUTE')
+
+def config_simulasi(config: Config) -> Config:
+    """Config dengan field presentasi dikembalikan ke default (kunci cache simulasi)"""
+    return replace(config, **{nama: getattr(Config, nama) for nama in FIELD_PRESENTASI})
+
+def distribusi_jam_dataframe(df: pd.DataFrame) -> dict:
+    """Jumlah mahasiswa selesai per jam dari kolom jam_selesai (menambah kolom 'jam')"""
+    df['jam'] = df['jam_selesai'].dt.hour
+    hourly = df.groupby('jam').size().reset_index(name='jumlah')
+    return dict(zip(hourly['jam'], hourly['jumlah']))
+
+def geser_jam_mulai(results: dict, df: pd.DataFrame, config: Config):
+    """Terapkan START_HOUR/START_MINUTE config ke hasil yang sudah ada tanpa simulasi ulang
+
+    Kolom jam_datang/jam_selesai digeser secara vektor, lalu distribusi_jam,
+    jam_selesai_terakhir dan jam potong steady state diturunkan ulang. results
+    dan df asli (mis. di cache) tidak diubah.
+    """
+    if results is None:
+        return results, df
+    start_baru = datetime(2024, 1, 1, config.START_HOUR, config.START_MINUTE)
+    geser = start_baru - results['start_time']
+    if not geser:
+        return results, df
+    
+    results = dict(results)
+    results['start_time'] = start_baru
+    results['jam_selesai_terakhir'] = results['jam_selesai_terakhir'] + geser
+    if results['steady_state'] is not None:
+        results['steady_state'] = {
+            **results['steady_state'],
+            'jam_potong': results['steady_state']['jam_potong'] + geser
+        }
+    
+    if df is None:
+        results['distribusi_jam'] = results['ringkasan_streaming'].distribusi_jam(start_baru)
+    else:
+        df = df.assign(
+            jam_datang=df['jam_datang'] + geser,
+            jam_selesai=df['jam_selesai'] + geser
+        )
+        results['distribusi_jam'] = distribusi_jam_dataframe(df)
+    return results, df
+
+def bandingkan_dispatch(config: Config) -> pd.DataFrame:
+    """Bandingkan jumlah event dan durasi mode polling vs event"""
+    rows = []
+    for mode in ["polling", "event"]:
+        model = KantinPrasmananDES(replace(config, DISPATCH_MODE=mode))
+        mulai = time.perf_counter()
+        results, _ = model.run_simulation()
+        rows.append({
+            'mode': mode,
+            'jumlah_event': model.jumlah_event,
+            'durasi_detik': time.perf_counter() - mulai,
+            'avg_waktu_tunggu': results['avg_waktu_tunggu'],
+            'waktu_selesai_terakhir': results['waktu_selesai_terakhir']
+        })
+    return pd.DataFrame(rows)
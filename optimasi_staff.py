@@ -0,0 +1,218 @@
+import os
+import math
+import numpy as np
+import pandas as pd
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor
+from kantin_des import Config
+from statistik import t_kritis_95, peluang_t
+from replikasi import seed_replikasi, jalankan_satu_replikasi
+from analitik import estimasi_analitik, tanpa_harapan
+
+# ============================
+# OPTIMASI JUMLAH STAFF
+# ============================
+METRIK_TARGET = ['p90_waktu_tunggu', 'avg_waktu_tunggu', 'p99_waktu_tunggu',
+                 'max_waktu_tunggu', 'waktu_selesai_terakhir']
+
+LAYAK = "layak"
+TIDAK_LAYAK = "tidak_layak"
+TIDAK_PASTI = "tidak_pasti"
+DIPANGKAS = "dipangkas"
+
+class EvaluasiStaff:
+    """Evaluasi satu konfigurasi staffing dengan replikasi bertahap
+
+    Replikasi ke-i semua konfigurasi memakai seed yang sama (common random
+    numbers), jadi perbandingan antar konfigurasi tidak tertutup derau acak.
+    executor (opsional) dipakai bersama oleh semua evaluasi agar worker
+    tidak dibuat ulang di setiap langkah.
+    """
+
+    def __init__(self, config: Config, metrik: str, target: float,
+                 seeds: list, engine: str, executor: ProcessPoolExecutor = None):
+        self.config = config
+        self.metrik = metrik
+        self.target = target
+        self.seeds = seeds
+        self.engine = engine
+        self.executor = executor
+        self.nilai = []
+
+    @property
+    def n(self) -> int:
+        return len(self.nilai)
+
+    def tambah_replikasi(self, n_baru: int):
+        """Jalankan replikasi sampai total n_baru (seed berikutnya dari daftar bersama)"""
+        configs = [replace(self.config, RANDOM_SEED=seed) for seed in self.seeds[self.n:n_baru]]
+        peta = self.executor.map if self.executor else map
+        hasil = peta(jalankan_satu_replikasi, configs, [self.engine] * len(configs))
+        self.nilai.extend(metrik[self.metrik] for metrik in hasil)
+
+    def ringkasan(self) -> dict:
+        nilai = np.array(self.nilai)
+        mean = float(nilai.mean())
+        std = float(nilai.std(ddof=1)) if self.n > 1 else 0.0
+        half_width = t_kritis_95(self.n - 1) * std / math.sqrt(self.n)
+        return {'n': self.n, 'mean': mean, 'std': std,
+                'ci_bawah': mean - half_width, 'ci_atas': mean + half_width}
+
+    def status(self) -> str:
+        """Layak bila seluruh CI 95% di bawah target, tidak layak bila seluruhnya di atas"""
+        r = self.ringkasan()
+        if r['ci_atas'] <= self.target:
+            return LAYAK
+        if r['ci_bawah'] > self.target:
+            return TIDAK_LAYAK
+        return TIDAK_PASTI
+
+    def keyakinan(self) -> float:
+        """Peluang (t Student satu sisi) bahwa rata-rata metrik sebenarnya <= target"""
+        r = self.ringkasan()
+        if r['std'] == 0:
+            return 1.0 if r['mean'] <= self.target else 0.0
+        return peluang_t((self.target - r['mean']) / (r['std'] / math.sqrt(self.n)), self.n - 1)
+
+    def putuskan(self, n_awal: int, n_maks: int) -> bool:
+        """Tambah replikasi (dua kali lipat) sampai status jelas atau n_maks tercapai
+
+        Konfigurasi yang jelas tidak layak sudah gugur setelah n_awal replikasi.
+        Bila tetap tidak pasti pada n_maks, keputusan diambil dari rata-rata.
+        """
+        n = max(self.n, n_awal)
+        self.tambah_replikasi(n)
+        while self.status() == TIDAK_PASTI and n < n_maks:
+            n = min(2 * n, n_maks)
+            self.tambah_replikasi(n)
+        return self.ringkasan()['mean'] <= self.target
+
+def optimasi_staff(config: Config,
+                   target: float = 5.0,
+                   metrik: str = 'p90_waktu_tunggu',
+                   max_kelompok: int = 5,
+                   max_staff_per_kelompok: int = 5,
+                   n_awal: int = 5,
+                   n_maks: int = 40,
+                   engine: str = "fast",
+                   max_workers: int = None,
+                   pangkas_analitik: bool = True) -> dict:
+    """Cari konfigurasi staff termurah (total staff) dengan rata-rata metrik <= target
+
+    Memanfaatkan monotonisitas: metrik tidak naik bila staff ditambah. Untuk tiap
+    NUM_KELOMPOK, NUM_STAFF_PER_KELOMPOK minimum dicari dengan bisection dalam
+    batas hasil kelompok sebelumnya (frontier tangga), sehingga hanya sebagian
+    kecil grid yang disimulasikan. Setiap titik dievaluasi secara sekuensial
+    (lihat EvaluasiStaff.putuskan). Antrian dilayani staff mana pun, jadi
+    metrik target hanya bergantung pada total staff: tata letak dengan total
+    sama (mis. 2x4 dan 4x2) berbagi satu evaluasi. Dengan pangkas_analitik, titik yang
+    menurut estimasi M/G/c jelas jauh di atas target (analitik.tanpa_harapan)
+    dianggap tidak layak tanpa disimulasikan.
+
+    Mengembalikan dict berisi 'terbaik' (None bila tidak ada yang layak),
+    'evaluasi' (DataFrame semua titik yang dievaluasi, termasuk yang dipangkas),
+    'jumlah_run', 'jumlah_dipangkas', serta 'jumlah_run_grid_min' dan
+    'jumlah_run_grid_maks': batas bawah dan atas run grid penuh dengan aturan
+    sekuensial yang sama (satu evaluasi per total staff, n_awal sampai n_maks
+    replikasi). Jumlah pastinya baru diketahui bila seluruh grid disimulasikan.
+    """
+    if metrik not in METRIK_TARGET:
+        raise ValueError(f"metrik harus salah satu dari {METRIK_TARGET}")
+    if not 2 <= n_awal <= n_maks:
+        raise ValueError("butuh 2 <= n_awal <= n_maks")
+
+    seeds = seed_replikasi(config.RANDOM_SEED, n_maks)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    evaluasi = {}
+    per_total = {}
+    dipangkas = {}
+
+    def layak(kelompok: int, staff: int) -> bool:
+        config_titik = replace(config, NUM_KELOMPOK=kelompok, NUM_STAFF_PER_KELOMPOK=staff)
+        if pangkas_analitik and tanpa_harapan(config_titik, metrik, target):
+            dipangkas[kelompok, staff] = estimasi_analitik(config_titik)[metrik]
+            return False
+        total = kelompok * staff
+        if total not in per_total:
+            per_total[total] = EvaluasiStaff(config_titik, metrik, target, seeds, engine, executor)
+        evaluasi[kelompok, staff] = per_total[total]
+        return per_total[total].putuskan(n_awal, n_maks)
+
+    # Satu pool untuk seluruh pencarian agar worker tidak dibuat ulang
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        # Frontier: staff minimum per kelompok tidak naik saat kelompok bertambah
+        kandidat = []
+        batas_atas = max_staff_per_kelompok
+        for kelompok in range(1, max_kelompok + 1):
+            if not layak(kelompok, batas_atas):
+                continue
+            bawah, atas = 1, batas_atas
+            while bawah < atas:
+                tengah = (bawah + atas) // 2
+                if layak(kelompok, tengah):
+                    atas = tengah
+                else:
+                    bawah = tengah + 1
+            kandidat.append((kelompok, atas))
+            batas_atas = atas
+            if atas == 1:
+                break
+    finally:
+        if executor:
+            executor.shutdown()
+
+    baris = []
+    for (kelompok, staff), ev in evaluasi.items():
+        baris.append({
+            'NUM_KELOMPOK': kelompok,
+            'NUM_STAFF_PER_KELOMPOK': staff,
+            'total_staff': kelompok * staff,
+            **ev.ringkasan(),
+            'status': ev.status(),
+            'keyakinan': ev.keyakinan()
+        })
+    for (kelompok, staff), estimasi in dipangkas.items():
+        baris.append({
+            'NUM_KELOMPOK': kelompok,
+            'NUM_STAFF_PER_KELOMPOK': staff,
+            'total_staff': kelompok * staff,
+            'n': 0,
+            'mean': estimasi,
+            'std': float('nan'),
+            'ci_bawah': float('nan'),
+            'ci_atas': float('nan'),
+            'status': DIPANGKAS,
+            'keyakinan': 0.0
+        })
+    df_evaluasi = pd.DataFrame(baris)
+    total_grid = {kelompok * staff for kelompok in range(1, max_kelompok + 1)
+                  for staff in range(1, max_staff_per_kelompok + 1)}
+    if not df_evaluasi.empty:
+        df_evaluasi = df_evaluasi.sort_values(['total_staff', 'NUM_KELOMPOK']).reset_index(drop=True)
+
+    terbaik = None
+    if kandidat:
+        kelompok, staff = min(
+            kandidat, key=lambda ks: (ks[0] * ks[1], -evaluasi[ks].keyakinan())
+        )
+        ev = evaluasi[kelompok, staff]
+        terbaik = {
+            'NUM_KELOMPOK': kelompok,
+            'NUM_STAFF_PER_KELOMPOK': staff,
+            'total_staff': kelompok * staff,
+            **ev.ringkasan(),
+            'keyakinan': ev.keyakinan()
+        }
+
+    return {
+        'metrik': metrik,
+        'target': target,
+        'terbaik': terbaik,
+        'evaluasi': df_evaluasi,
+        'jumlah_run': sum(ev.n for ev in per_total.values()),
+        'jumlah_dipangkas': len(dipangkas),
+        'jumlah_run_grid_min': len(total_grid) * n_awal,
+        'jumlah_run_grid_maks': len(total_grid) * n_maks
+    }
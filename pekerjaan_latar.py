@@ -0,0 +1,253 @@
+import os
+import time
+import uuid
+import queue
+import threading
+import multiprocessing
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from kantin_des import Config, Cuplikan, KantinPrasmananDES, config_simulasi
+from cache_hasil import cache_simulasi, hash_config
+from replikasi import ringkas_metrik
+from penyimpanan_run import penyimpanan_aktif
+
+# ============================
+# PEKERJAAN SIMULASI LATAR BELAKANG
+# ============================
+ANTRI = "antri"
+BERJALAN = "berjalan"
+SELESAI = "selesai"
+DIBATALKAN = "dibatalkan"
+GAGAL = "gagal"
+STATUS_AKHIR = (SELESAI, DIBATALKAN, GAGAL)
+
+# Proses server Streamlit bermultithread: fork bisa mewarisi lock yang sedang
+# dipegang thread lain (deadlock di anak), jadi worker dan Manager dibuat
+# dari proses forkserver yang bersih
+KONTEKS_PROSES = "forkserver"
+
+def kunci_simulasi(config: Config, engine: str) -> str:
+    """Kunci cache satu run (jam mulai tidak ikut, lihat config_simulasi)"""
+    return hash_config(config_simulasi(config), engine)
+
+def simpan_run(config: Config, engine: str, hasil: tuple, durasi: float = None):
+    """Catat run penuh (results, df, queue_lengths) ke penyimpanan run bila aktif
+
+    Run PROFILING hanya dicatat metriknya: hasilnya memuat data profil yang
+    tidak boleh muncul kembali untuk run biasa dengan kunci yang sama.
+    """
+    penyimpanan = penyimpanan_aktif()
+    if penyimpanan is None:
+        return
+    results, df, queue_lengths = hasil
+    if config.PROFILING:
+        penyimpanan.simpan(config, engine, ringkas_metrik(results), durasi=durasi)
+    else:
+        penyimpanan.simpan(config, engine, ringkas_metrik(results), df=df, durasi=durasi,
+                           hasil=(results, queue_lengths))
+
+def muat_run(config: Config, engine: str) -> tuple:
+    """Run penuh dari penyimpanan run (mis. setelah server restart), atau None
+
+    Run PROFILING selalu disimulasikan ulang karena yang diminta adalah pengukurannya.
+    """
+    penyimpanan = penyimpanan_aktif()
+    if penyimpanan is None or config.PROFILING:
+        return None
+    return penyimpanan.ambil_hasil(config, engine)
+
+def _simulasi_proses(config: Config, engine: str, jumlah_irisan: int, progres, batal):
+    """Dijalankan di proses worker: kirim cuplikan progres lewat antrian Manager
+
+    Mengembalikan (results, df, queue_lengths), atau None bila dibatalkan.
+    """
+    model = KantinPrasmananDES(config)
+    for cuplikan in model.jalankan_bertahap(engine, jumlah_irisan):
+        if cuplikan.selesai:
+            break
+        progres.put(cuplikan)
+        if batal.is_set():
+            return None
+    results, df = cuplikan.hasil
+    return results, df, model.statistics['queue_lengths']
+
+@dataclass
+class Pekerjaan:
+    """Satu run simulasi yang dijalankan di worker pool"""
+    id: str
+    config: Config
+    engine: str
+    pemilik: str = None
+    status: str = ANTRI
+    dibuat: float = field(default_factory=time.time)
+    mulai: float = None
+    selesai: float = None
+    cuplikan: Cuplikan = None
+    hasil: tuple = None
+    galat: str = None
+    batal: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def progres(self) -> float:
+        if self.status == SELESAI:
+            return 1.0
+        return self.cuplikan.progres if self.cuplikan else 0.0
+
+    @property
+    def durasi(self) -> float:
+        if self.mulai is None:
+            return 0.0
+        return (self.selesai or time.time()) - self.mulai
+
+class ManajerPekerjaan:
+    """Antrian run simulasi bersama untuk semua sesi, dengan progres dan pembatalan
+
+    Simulasi murni Python terikat CPU, jadi dijalankan di ProcessPoolExecutor:
+    thread tidak mempercepatnya (GIL) dan justru berebut GIL dengan skrip
+    Streamlit sesi lain. Tiap pekerjaan diawasi satu thread yang hampir selalu
+    tidur: ia meneruskan cuplikan progres dari antrian Manager dan permintaan
+    batal (Event Manager, diperiksa worker di antara irisan jalankan_bertahap).
+    Hasil yang selesai juga disimpan ke cache_simulasi dengan kunci yang sama
+    seperti run langsung, sehingga run identik tidak dihitung dua kali.
+    """
+
+    def __init__(self, max_workers: int = None, max_riwayat: int = 50, jumlah_irisan: int = 50):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_riwayat = max_riwayat
+        self.jumlah_irisan = jumlah_irisan
+        self._pengawas = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="pengawas-simulasi")
+        # Pool proses dan Manager baru dibuat saat pekerjaan pertama dijalankan
+        self._proses = None
+        self._manager = None
+        self._pekerjaan = {}
+        self._lock = threading.Lock()
+
+    def kirim(self, config: Config, engine: str = "fast", pemilik: str = None) -> str:
+        """Masukkan run ke antrian dan kembalikan ID pekerjaan"""
+        pekerjaan = Pekerjaan(id=uuid.uuid4().hex[:8], config=config, engine=engine, pemilik=pemilik)
+        hasil = cache_simulasi.get(kunci_simulasi(config, engine))
+        with self._lock:
+            self._pekerjaan[pekerjaan.id] = pekerjaan
+            self._rapikan()
+        if hasil is not None:
+            pekerjaan.hasil = hasil
+            pekerjaan.status = SELESAI
+            pekerjaan.mulai = pekerjaan.selesai = time.time()
+        else:
+            self._pengawas.submit(self._jalankan, pekerjaan)
+        return pekerjaan.id
+
+    def ambil(self, id_pekerjaan: str) -> Pekerjaan:
+        return self._pekerjaan.get(id_pekerjaan)
+
+    def batalkan(self, id_pekerjaan: str) -> bool:
+        """Minta pembatalan; berlaku di irisan berikutnya (atau sebelum mulai bila masih antri)"""
+        pekerjaan = self.ambil(id_pekerjaan)
+        if pekerjaan is None or pekerjaan.status in STATUS_AKHIR:
+            return False
+        pekerjaan.batal.set()
+        if pekerjaan.status == ANTRI:
+            pekerjaan.status = DIBATALKAN
+            pekerjaan.selesai = time.time()
+        return True
+
+    def daftar(self, pemilik: str = None) -> list:
+        """Pekerjaan (terbaru dulu), opsional hanya milik satu sesi"""
+        with self._lock:
+            semua = list(self._pekerjaan.values())
+        if pemilik is not None:
+            semua = [p for p in semua if p.pemilik == pemilik]
+        return sorted(semua, key=lambda p: p.dibuat, reverse=True)
+
+    def posisi_antrian(self, id_pekerjaan: str) -> int:
+        """Jumlah pekerjaan antri yang dikirim lebih dulu (0 = berikutnya jalan)"""
+        pekerjaan = self.ambil(id_pekerjaan)
+        if pekerjaan is None or pekerjaan.status != ANTRI:
+            return 0
+        return sum(p.status == ANTRI and p.dibuat < pekerjaan.dibuat for p in self.daftar())
+
+    def ringkasan(self) -> str:
+        semua = self.daftar()
+        berjalan = sum(p.status == BERJALAN for p in semua)
+        antri = sum(p.status == ANTRI for p in semua)
+        return f"Server: {berjalan} berjalan, {antri} antri ({self.max_workers} worker)"
+
+    def _rapikan(self):
+        """Buang pekerjaan selesai tertua bila riwayat melebihi max_riwayat (dipanggil dengan lock)"""
+        selesai = sorted(
+            (p for p in self._pekerjaan.values() if p.status in STATUS_AKHIR),
+            key=lambda p: p.dibuat
+        )
+        for p in selesai[:max(len(self._pekerjaan) - self.max_riwayat, 0)]:
+            del self._pekerjaan[p.id]
+
+    def _siapkan_proses(self):
+        with self._lock:
+            if self._proses is None:
+                konteks = multiprocessing.get_context(KONTEKS_PROSES)
+                # Modul simulasi diimpor sekali di forkserver, bukan di tiap worker
+                konteks.set_forkserver_preload([__name__])
+                self._manager = konteks.Manager()
+                self._proses = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=konteks)
+        return self._proses, self._manager
+
+    def _buang_proses(self, proses: ProcessPoolExecutor):
+        """Lepas pool yang rusak (worker mati) agar pekerjaan berikutnya membuat yang baru"""
+        with self._lock:
+            if self._proses is not proses:
+                return
+            manager, self._proses, self._manager = self._manager, None, None
+        proses.shutdown(wait=False, cancel_futures=True)
+        manager.shutdown()
+
+    def _hitung(self, pekerjaan: Pekerjaan) -> tuple:
+        """Jalankan simulasi di pool proses sambil meneruskan progres dan pembatalan"""
+        proses, manager = self._siapkan_proses()
+        try:
+            progres, batal = manager.Queue(), manager.Event()
+            future = proses.submit(
+                _simulasi_proses, config_simulasi(pekerjaan.config), pekerjaan.engine,
+                self.jumlah_irisan, progres, batal
+            )
+            while not future.done():
+                if pekerjaan.batal.is_set():
+                    batal.set()
+                try:
+                    pekerjaan.cuplikan = progres.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            return future.result()
+        except BrokenProcessPool:
+            self._buang_proses(proses)
+            raise
+
+    def _jalankan(self, pekerjaan: Pekerjaan):
+        if pekerjaan.batal.is_set():
+            return
+        pekerjaan.status = BERJALAN
+        pekerjaan.mulai = time.time()
+        try:
+            hasil = muat_run(pekerjaan.config, pekerjaan.engine)
+            if hasil is not None:
+                cache_simulasi.put(kunci_simulasi(pekerjaan.config, pekerjaan.engine), hasil)
+                pekerjaan.hasil = hasil
+                pekerjaan.status = SELESAI
+                return
+            hasil = self._hitung(pekerjaan)
+            if hasil is None or pekerjaan.batal.is_set():
+                pekerjaan.status = DIBATALKAN
+                return
+            cache_simulasi.put(kunci_simulasi(pekerjaan.config, pekerjaan.engine), hasil)
+            simpan_run(pekerjaan.config, pekerjaan.engine, hasil, pekerjaan.durasi)
+            pekerjaan.hasil = hasil
+            pekerjaan.status = SELESAI
+        except Exception as e:
+            pekerjaan.galat = f"{type(e).__name__}: {e}"
+            pekerjaan.status = GAGAL
+        finally:
+            pekerjaan.selesai = time.time()
+
+# Satu manajer per proses server, dipakai bersama oleh semua sesi pengguna
+manajer_pekerjaan = ManajerPekerjaan()
@@ -0,0 +1,239 @@
+import os
+import json
+import pickle
+import sqlite3
+import threading
+from contextlib import closing, suppress
+from datetime import datetime
+from dataclasses import fields, replace
+import pandas as pd
+from kantin_des import Config, VERSI_MODEL, config_simulasi
+from cache_hasil import hash_config
+
+# ============================
+# PENYIMPANAN RUN PERSISTEN (SQLITE)
+# ============================
+# Path database; bila variabel lingkungan ini tidak di-set, penyimpanan nonaktif.
+# Di-set saat proses dijalankan, mis.
+#     KANTIN_RUN_STORE=hasil_run/run_store.sqlite streamlit run app_latihan.py
+# Worker ProcessPoolExecutor mewarisinya, jadi replikasi paralel ikut memakai store.
+ENV_PENYIMPANAN = 'KANTIN_RUN_STORE'
+PATH_DEFAULT = os.path.join('hasil_run', 'run_store.sqlite')
+
+# Batas total file run penuh (hasil + Parquet per mahasiswa); yang tertua dibuang.
+# Metrik ringkas di SQLite tidak pernah dibuang.
+BATAS_DATA_MB = 1024
+
+TIPE_SQL = {int: 'INTEGER', float: 'REAL', bool: 'INTEGER', str: 'TEXT'}
+KOLOM_CONFIG = {f.name: TIPE_SQL.get(f.type, 'TEXT') for f in fields(Config)}
+# Seed replikasi 128 bit tidak muat di INTEGER SQLite (64 bit), disimpan sebagai teks
+KOLOM_CONFIG['RANDOM_SEED'] = 'TEXT'
+# Metrik yang dijadikan kolom agar bisa difilter/diurutkan langsung dengan SQL
+KOLOM_METRIK = ['avg_waktu_tunggu', 'max_waktu_tunggu', 'p90_waktu_tunggu',
+                'waktu_selesai_terakhir', 'utilisasi_rata']
+KOLOM_LAIN = {
+    'kunci': 'TEXT PRIMARY KEY', 'engine': 'TEXT', 'versi_model': 'INTEGER',
+    'metrik': 'TEXT', 'path_data': 'TEXT', 'path_hasil': 'TEXT', 'durasi': 'REAL',
+    'dibuat': 'TEXT'
+}
+
+def kunci_run(config: Config, engine: str) -> str:
+    """Hash kanonik run: Config tanpa field presentasi/profiling, engine, dan VERSI_MODEL"""
+    return hash_config(replace(config_simulasi(config), PROFILING=False), engine, VERSI_MODEL)
+
+class PenyimpananRun:
+    """Metrik ringkas per run di SQLite, run penuh opsional sebagai file
+
+    Satu baris per kunci_run; kolom Config dan KOLOM_METRIK terindeks sehingga
+    kueri perbandingan (mis. semua run 500 mahasiswa urut rata-rata tunggu)
+    tidak perlu membaca file data. Run penuh (dict results + panjang antrian
+    dalam pickle, data per mahasiswa dalam Parquet) dibatasi batas_data_mb.
+    """
+
+    def __init__(self, path: str = PATH_DEFAULT, batas_data_mb: float = BATAS_DATA_MB):
+        self.path = path
+        self.batas_data = batas_data_mb * 1024 ** 2
+        self.folder_data = os.path.splitext(path)[0] + '_data'
+        os.makedirs(self.folder_data, exist_ok=True)
+        with closing(self._koneksi()) as kon, kon:
+            kon.execute('PRAGMA journal_mode=WAL')
+            kolom = {**KOLOM_LAIN, **KOLOM_CONFIG, **{m: 'REAL' for m in KOLOM_METRIK}}
+            kon.execute(f"CREATE TABLE IF NOT EXISTS run ({', '.join(f'{k} {t}' for k, t in kolom.items())})")
+            # Field Config baru ditambahkan ke tabel lama tanpa migrasi manual
+            ada = {baris[1] for baris in kon.execute("PRAGMA table_info(run)")}
+            for nama, tipe in kolom.items():
+                if nama not in ada:
+                    kon.execute(f"ALTER TABLE run ADD COLUMN {nama} {tipe}")
+            kon.execute("CREATE INDEX IF NOT EXISTS idx_run_mahasiswa "
+                        "ON run (NUM_MAHASISWA, avg_waktu_tunggu)")
+
+    def _koneksi(self) -> sqlite3.Connection:
+        kon = sqlite3.connect(self.path, timeout=30)
+        kon.execute('PRAGMA synchronous=NORMAL')
+        return kon
+
+    def __len__(self):
+        with closing(self._koneksi()) as kon:
+            return kon.execute("SELECT COUNT(*) FROM run").fetchone()[0]
+
+    def ambil_metrik(self, config: Config, engine: str) -> dict:
+        """Metrik run yang tersimpan, atau None bila belum pernah dijalankan"""
+        with closing(self._koneksi()) as kon:
+            baris = kon.execute(
+                "SELECT metrik FROM run WHERE kunci = ?", (kunci_run(config, engine),)
+            ).fetchone()
+        return json.loads(baris[0]) if baris else None
+
+    def _path_file(self, config: Config, engine: str) -> tuple:
+        with closing(self._koneksi()) as kon:
+            baris = kon.execute(
+                "SELECT path_data, path_hasil FROM run WHERE kunci = ?", (kunci_run(config, engine),)
+            ).fetchone()
+        return baris or (None, None)
+
+    def ambil_data(self, config: Config, engine: str) -> pd.DataFrame:
+        """Data per mahasiswa yang tersimpan (Parquet), atau None"""
+        path_data, _ = self._path_file(config, engine)
+        if not path_data:
+            return None
+        # File bisa dibuang _pangkas_file proses lain kapan saja
+        try:
+            return pd.read_parquet(path_data)
+        except FileNotFoundError:
+            return None
+
+    def ambil_hasil(self, config: Config, engine: str) -> tuple:
+        """(results, df, queue_lengths) run penuh yang tersimpan, atau None
+
+        df None untuk run STREAMING; run non-streaming yang data per
+        mahasiswanya sudah dibuang dianggap tidak tersimpan.
+        """
+        _, path_hasil = self._path_file(config, engine)
+        if not path_hasil:
+            return None
+        df = None
+        if not config.STREAMING:
+            df = self.ambil_data(config, engine)
+            if df is None:
+                return None
+        try:
+            with open(path_hasil, 'rb') as f:
+                results, queue_lengths = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        return results, df, queue_lengths
+
+    def simpan(self, config: Config, engine: str, metrik: dict,
+               df: pd.DataFrame = None, durasi: float = None, hasil: tuple = None):
+        """Simpan (atau timpa) satu run
+
+        hasil = (results, queue_lengths) dan df per mahasiswa bersifat opsional;
+        bila diberikan, keduanya ditulis ke file agar run penuh bisa dimuat ulang.
+        """
+        kunci = kunci_run(config, engine)
+        # Run ulang tanpa file tidak menghapus file run penuh yang sudah ada
+        path_data, path_hasil = self._path_file(config, engine)
+        if df is not None:
+            # Impor lokal: worker replikasi yang hanya menyimpan metrik tidak memuat pyarrow
+            from ekspor_hasil import tulis_file
+            path_data = os.path.join(self.folder_data, f"{kunci}.parquet")
+            tulis_file(df, path_data)
+        if hasil is not None:
+            path_hasil = os.path.join(self.folder_data, f"{kunci}.pkl")
+            with open(path_hasil, 'wb') as f:
+                pickle.dump(hasil, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        utilisasi = [v for k, v in metrik.items() if k.startswith('utilisasi_kelompok_')]
+        nilai = {
+            **{nama: getattr(config, nama) for nama in KOLOM_CONFIG},
+            'RANDOM_SEED': str(config.RANDOM_SEED),
+            **{m: metrik.get(m) for m in KOLOM_METRIK},
+            'utilisasi_rata': sum(utilisasi) / len(utilisasi) if utilisasi else None,
+            'kunci': kunci,
+            'engine': engine,
+            'versi_model': VERSI_MODEL,
+            'metrik': json.dumps(metrik),
+            'path_data': path_data,
+            'path_hasil': path_hasil,
+            'durasi': durasi,
+            'dibuat': datetime.now().isoformat(timespec='seconds')
+        }
+        with closing(self._koneksi()) as kon, kon:
+            kon.execute(
+                f"INSERT OR REPLACE INTO run ({', '.join(nilai)}) "
+                f"VALUES ({', '.join('?' * len(nilai))})",
+                list(nilai.values())
+            )
+        if df is not None or hasil is not None:
+            self._pangkas_file()
+
+    def _pangkas_file(self):
+        """Buang file run penuh tertua sampai total ukurannya <= batas_data"""
+        with closing(self._koneksi()) as kon, kon:
+            baris = kon.execute(
+                "SELECT kunci, path_data, path_hasil FROM run "
+                "WHERE path_data IS NOT NULL OR path_hasil IS NOT NULL "
+                # rowid ikut naik di setiap INSERT OR REPLACE: pemecah seri dalam detik yang sama
+                "ORDER BY dibuat DESC, rowid DESC"
+            ).fetchall()
+            total = 0
+            for kunci, *paths in baris:
+                # Worker lain bisa memangkas store yang sama bersamaan: file yang
+                # sudah hilang cukup dilewati, tanpa cek exists() lebih dulu
+                paths = [p for p in paths if p]
+                for p in paths:
+                    with suppress(FileNotFoundError):
+                        total += os.path.getsize(p)
+                if total > self.batas_data:
+                    for p in paths:
+                        with suppress(FileNotFoundError):
+                            os.remove(p)
+                    kon.execute(
+                        "UPDATE run SET path_data = NULL, path_hasil = NULL WHERE kunci = ?", (kunci,)
+                    )
+
+    def cari(self, urut: str = 'avg_waktu_tunggu', menurun: bool = False,
+             batas: int = None, semua_versi: bool = False, **filter) -> pd.DataFrame:
+        """Kueri run tersimpan, mis. cari(NUM_MAHASISWA=500, urut='avg_waktu_tunggu')
+
+        Filter berupa kolom Config atau 'engine' (nilai tunggal atau list).
+        Secara default hanya run dengan VERSI_MODEL saat ini.
+        """
+        kolom_valid = set(KOLOM_CONFIG) | set(KOLOM_METRIK) | {'engine', 'dibuat', 'durasi'}
+        for nama in [urut, *filter]:
+            if nama not in kolom_valid:
+                raise ValueError(f"kolom '{nama}' tidak dikenal")
+
+        kondisi, parameter = [], []
+        if not semua_versi:
+            kondisi.append("versi_model = ?")
+            parameter.append(VERSI_MODEL)
+        for nama, nilai in filter.items():
+            nilai = list(nilai) if isinstance(nilai, (list, tuple, set)) else [nilai]
+            if nama == 'RANDOM_SEED':
+                nilai = [str(v) for v in nilai]
+            kondisi.append(f"{nama} IN ({', '.join('?' * len(nilai))})")
+            parameter.extend(nilai)
+
+        sql = (f"SELECT engine, {', '.join(KOLOM_CONFIG)}, {', '.join(KOLOM_METRIK)}, "
+               f"durasi, dibuat, path_data IS NOT NULL AS ada_data FROM run")
+        if kondisi:
+            sql += " WHERE " + " AND ".join(kondisi)
+        sql += f" ORDER BY {urut} {'DESC' if menurun else 'ASC'}"
+        if batas:
+            sql += f" LIMIT {int(batas)}"
+        with closing(self._koneksi()) as kon:
+            return pd.read_sql_query(sql, kon, params=parameter)
+
+_penyimpanan = {}
+_lock = threading.Lock()
+
+def penyimpanan_aktif() -> PenyimpananRun:
+    """PenyimpananRun dari variabel lingkungan KANTIN_RUN_STORE, atau None bila tidak di-set"""
+    path = os.environ.get(ENV_PENYIMPANAN)
+    if not path:
+        return None
+    with _lock:
+        if path not in _penyimpanan:
+            _penyimpanan[path] = PenyimpananRun(path)
+        return _penyimpanan[path]
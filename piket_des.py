@@ -0,0 +1,373 @@
+import heapq
+import itertools
+import simpy
+import numpy as np
+import pandas as pd
+from collections import deque
+from dataclasses import dataclass, replace
+
+# ============================
+# KONFIGURASI PIKET TANDEM
+# ============================
+@dataclass
+class ConfigPiket:
+    """Konfigurasi model piket tiga tahap lauk -> angkat -> nasi (satuan detik)"""
+    TOTAL_MEJA: int = 60
+    MAHASISWA_PER_MEJA: int = 3
+
+    # Jumlah mahasiswa piket per tahap
+    PEKERJA_LAUK: int = 3
+    PEKERJA_ANGKAT: int = 2
+    PEKERJA_NASI: int = 2
+
+    # Waktu satu pekerja per ompreng (lauk, nasi) atau per batch (angkat)
+    MIN_LAUK: float = 30
+    MAX_LAUK: float = 60
+    MIN_ANGKAT: float = 20
+    MAX_ANGKAT: float = 60
+    MIN_NASI: float = 30
+    MAX_NASI: float = 60
+
+    # Ompreng diangkat per batch berukuran acak BATCH_MIN-BATCH_MAX
+    BATCH_MIN: int = 4
+    BATCH_MAX: int = 7
+
+    # Tempat ompreng berlauk yang menunggu diangkat (0 = tak terbatas).
+    # Jika penuh, pekerja lauk tertahan memegang ompreng (blocking).
+    KAPASITAS_BUFFER: int = 0
+
+    RANDOM_SEED: int = 42
+
+TAHAP = ['lauk', 'angkat', 'nasi']
+
+def config_dari_parameter(parameter: dict) -> ConfigPiket:
+    """ConfigPiket dari dict parameter app/PARAMETER_PIKET (tanpa pembagian pekerja)"""
+    return ConfigPiket(
+        TOTAL_MEJA=parameter["total_meja"],
+        MAHASISWA_PER_MEJA=parameter["mahasiswa_per_meja"],
+        MIN_LAUK=parameter["min_lauk"], MAX_LAUK=parameter["max_lauk"],
+        MIN_ANGKAT=parameter["min_angkat"], MAX_ANGKAT=parameter["max_angkat"],
+        MIN_NASI=parameter["min_nasi"], MAX_NASI=parameter["max_nasi"],
+        RANDOM_SEED=parameter["seed"]
+    )
+
+# ============================
+# MODEL SIMULASI
+# ============================
+class PiketDES:
+    """Antrian tandem lauk -> angkat (batch) -> nasi dengan pool pekerja per tahap
+
+    Semua ompreng tersedia di awal. Pekerja lauk mengambil ompreng berikutnya
+    sesuai urutan; ompreng berlauk masuk buffer. Batch diangkat berurutan
+    (FIFO dari buffer) begitu isi buffer cukup dan ada pekerja angkat bebas.
+    Setelah tiba, ompreng dilayani pekerja nasi secara FCFS.
+    """
+
+    def __init__(self, config: ConfigPiket):
+        for nama in ('PEKERJA_LAUK', 'PEKERJA_ANGKAT', 'PEKERJA_NASI'):
+            if getattr(config, nama) < 1:
+                raise ValueError(f"{nama} harus >= 1")
+        if 0 < config.KAPASITAS_BUFFER < config.BATCH_MAX:
+            raise ValueError("KAPASITAS_BUFFER harus 0 atau >= BATCH_MAX agar batch terbesar muat")
+
+        self.config = config
+        self.T = T = config.TOTAL_MEJA * config.MAHASISWA_PER_MEJA
+
+        # Stream acak per keperluan: jumlah pekerja tidak mengubah variat (CRN)
+        ss_lauk, ss_angkat, ss_nasi, ss_batch = np.random.SeedSequence(config.RANDOM_SEED).spawn(4)
+        self.waktu_lauk = np.random.default_rng(ss_lauk).uniform(config.MIN_LAUK, config.MAX_LAUK, T)
+        self.waktu_nasi = np.random.default_rng(ss_nasi).uniform(config.MIN_NASI, config.MAX_NASI, T)
+
+        ukuran = np.random.default_rng(ss_batch).integers(
+            config.BATCH_MIN, config.BATCH_MAX + 1, T // config.BATCH_MIN + 1
+        )
+        akhir = np.minimum(np.cumsum(ukuran), T)
+        akhir = akhir[:np.searchsorted(akhir, T) + 1]
+        # Ukuran tiap batch; batch terakhir mengambil sisa ompreng
+        self.ukuran_batch = np.diff(akhir, prepend=0).tolist()
+        self.waktu_angkat = np.random.default_rng(ss_angkat).uniform(
+            config.MIN_ANGKAT, config.MAX_ANGKAT, len(self.ukuran_batch)
+        )
+
+        # Catatan waktu per ompreng dan per batch
+        self.mulai_lauk = np.zeros(T)
+        self.selesai_lauk = np.zeros(T)
+        self.masuk_buffer = np.zeros(T)
+        self.diangkat = np.zeros(T)
+        self.tiba = np.zeros(T)
+        self.mulai_nasi = np.zeros(T)
+        self.selesai_nasi = np.zeros(T)
+        self.mulai_angkat = np.zeros(len(self.ukuran_batch))
+
+    def run(self, engine: str = "simpy") -> dict:
+        if self.T == 0:
+            return None
+        if engine == "fast":
+            self.run_fast()
+        else:
+            self.run_simpy()
+        return self.analyze_results()
+
+    # ----------------------------
+    # Engine SimPy
+    # ----------------------------
+    def run_simpy(self):
+        config = self.config
+        env = simpy.Environment()
+        kapasitas = config.KAPASITAS_BUFFER or float('inf')
+        buffer = simpy.Container(env, capacity=kapasitas)
+        # Container melayani put secara FIFO, jadi urutan permintaan put sama
+        # dengan urutan ompreng masuk buffer
+        urutan_buffer = deque()
+        pekerja_angkat = simpy.Resource(env, capacity=config.PEKERJA_ANGKAT)
+        pekerja_nasi = simpy.Resource(env, capacity=config.PEKERJA_NASI)
+        urutan = iter(range(self.T))
+
+        def pekerja_lauk():
+            for k in urutan:
+                self.mulai_lauk[k] = env.now
+                yield env.timeout(self.waktu_lauk[k])
+                self.selesai_lauk[k] = env.now
+                urutan_buffer.append(k)
+                # Tertahan di sini selama buffer penuh
+                yield buffer.put(1)
+                self.masuk_buffer[k] = env.now
+
+        def nasi(k):
+            with pekerja_nasi.request() as request:
+                yield request
+                self.mulai_nasi[k] = env.now
+                yield env.timeout(self.waktu_nasi[k])
+                self.selesai_nasi[k] = env.now
+
+        def angkat(b, isi, request):
+            yield env.timeout(self.waktu_angkat[b])
+            pekerja_angkat.release(request)
+            for k in isi:
+                self.tiba[k] = env.now
+                env.process(nasi(k))
+
+        def pengatur_angkat():
+            for b, ukuran in enumerate(self.ukuran_batch):
+                request = pekerja_angkat.request()
+                yield request
+                yield buffer.get(ukuran)
+                isi = [urutan_buffer.popleft() for _ in range(ukuran)]
+                self.mulai_angkat[b] = env.now
+                self.diangkat[isi] = env.now
+                env.process(angkat(b, isi, request))
+
+        for _ in range(config.PEKERJA_LAUK):
+            env.process(pekerja_lauk())
+        env.process(pengatur_angkat())
+        env.run()
+
+    # ----------------------------
+    # Engine fast (loop event tanpa SimPy)
+    # ----------------------------
+    def run_fast(self):
+        """Logika yang sama dengan run_simpy, dengan heap event dan tanpa generator"""
+        config = self.config
+        T = self.T
+        kapasitas = config.KAPASITAS_BUFFER or T + 1
+        waktu_lauk = self.waktu_lauk.tolist()
+        waktu_nasi = self.waktu_nasi.tolist()
+        waktu_angkat = self.waktu_angkat.tolist()
+        ukuran_batch = self.ukuran_batch
+        jumlah_batch = len(ukuran_batch)
+
+        # Kolom catatan sebagai list Python (lebih cepat diisi satu per satu)
+        mulai_lauk = [0.0] * T
+        selesai_lauk = [0.0] * T
+        masuk_buffer = [0.0] * T
+        diangkat = [0.0] * T
+        tiba = [0.0] * T
+        mulai_nasi = [0.0] * T
+        selesai_nasi = [0.0] * T
+        mulai_angkat = [0.0] * jumlah_batch
+
+        LAUK, ANGKAT, NASI = 0, 1, 2
+        event = []
+        nomor = itertools.count()
+
+        lauk_berikutnya = 0
+        buffer = deque()
+        tertahan = deque()
+        isi_angkat = [None] * jumlah_batch
+        batch_berikutnya = 0
+        angkat_bebas = config.PEKERJA_ANGKAT
+        antrian_nasi = deque()
+        nasi_bebas = config.PEKERJA_NASI
+
+        def mulai_lauk_baru(t):
+            nonlocal lauk_berikutnya
+            if lauk_berikutnya < T:
+                k = lauk_berikutnya
+                lauk_berikutnya += 1
+                mulai_lauk[k] = t
+                heapq.heappush(event, (t + waktu_lauk[k], next(nomor), LAUK, k))
+
+        def masukkan_buffer(k, t):
+            buffer.append(k)
+            masuk_buffer[k] = t
+            mulai_lauk_baru(t)
+
+        def coba_angkat(t):
+            nonlocal batch_berikutnya, angkat_bebas
+            while (batch_berikutnya < jumlah_batch and angkat_bebas > 0
+                   and len(buffer) >= ukuran_batch[batch_berikutnya]):
+                b = batch_berikutnya
+                isi = [buffer.popleft() for _ in range(ukuran_batch[b])]
+                for k in isi:
+                    diangkat[k] = t
+                isi_angkat[b] = isi
+                angkat_bebas -= 1
+                mulai_angkat[b] = t
+                heapq.heappush(event, (t + waktu_angkat[b], next(nomor), ANGKAT, b))
+                batch_berikutnya += 1
+                # Ruang buffer kosong: pekerja lauk yang tertahan dilepas FIFO
+                while tertahan and len(buffer) < kapasitas:
+                    masukkan_buffer(tertahan.popleft(), t)
+
+        def coba_nasi(t):
+            nonlocal nasi_bebas
+            while nasi_bebas > 0 and antrian_nasi:
+                k = antrian_nasi.popleft()
+                nasi_bebas -= 1
+                mulai_nasi[k] = t
+                heapq.heappush(event, (t + waktu_nasi[k], next(nomor), NASI, k))
+
+        for _ in range(config.PEKERJA_LAUK):
+            mulai_lauk_baru(0.0)
+
+        while event:
+            t, _, jenis, x = heapq.heappop(event)
+            if jenis == LAUK:
+                selesai_lauk[x] = t
+                if len(buffer) < kapasitas:
+                    masukkan_buffer(x, t)
+                else:
+                    tertahan.append(x)
+                coba_angkat(t)
+            elif jenis == ANGKAT:
+                angkat_bebas += 1
+                for k in isi_angkat[x]:
+                    tiba[k] = t
+                    antrian_nasi.append(k)
+                coba_nasi(t)
+                coba_angkat(t)
+            else:
+                selesai_nasi[x] = t
+                nasi_bebas += 1
+                coba_nasi(t)
+
+        self.mulai_lauk[:] = mulai_lauk
+        self.selesai_lauk[:] = selesai_lauk
+        self.masuk_buffer[:] = masuk_buffer
+        self.diangkat[:] = diangkat
+        self.tiba[:] = tiba
+        self.mulai_nasi[:] = mulai_nasi
+        self.selesai_nasi[:] = selesai_nasi
+        self.mulai_angkat[:] = mulai_angkat
+
+    # ----------------------------
+    # Analisis
+    # ----------------------------
+    def analyze_results(self) -> dict:
+        config = self.config
+        waktu_total = float(self.selesai_nasi.max())
+
+        def ringkas_tahap(pekerja, kerja, tunggu, tertahan=0.0):
+            kapasitas = pekerja * waktu_total
+            return {
+                'pekerja': pekerja,
+                'utilisasi': float(kerja / kapasitas * 100),
+                'blocking': tertahan / kapasitas * 100,
+                'avg_tunggu': float(tunggu.mean()),
+                'max_tunggu': float(tunggu.max())
+            }
+
+        tahap = {
+            'lauk': ringkas_tahap(
+                config.PEKERJA_LAUK, self.waktu_lauk.sum(), self.mulai_lauk,
+                tertahan=float((self.masuk_buffer - self.selesai_lauk).sum())
+            ),
+            'angkat': ringkas_tahap(
+                config.PEKERJA_ANGKAT, self.waktu_angkat.sum(), self.diangkat - self.masuk_buffer
+            ),
+            'nasi': ringkas_tahap(
+                config.PEKERJA_NASI, self.waktu_nasi.sum(), self.mulai_nasi - self.tiba
+            )
+        }
+        return {
+            'waktu_total': waktu_total,
+            'total_ompreng': self.T,
+            'jumlah_batch': len(self.ukuran_batch),
+            'tahap': tahap,
+            'bottleneck': max(tahap, key=lambda nama: tahap[nama]['utilisasi']),
+            'waktu_selesai': self.selesai_nasi.copy()
+        }
+
+    def dataframe_ompreng(self) -> pd.DataFrame:
+        """Catatan waktu per ompreng (detik)"""
+        return pd.DataFrame({
+            'ompreng': np.arange(1, self.T + 1),
+            'mulai_lauk': self.mulai_lauk,
+            'selesai_lauk': self.selesai_lauk,
+            'masuk_buffer': self.masuk_buffer,
+            'diangkat': self.diangkat,
+            'tiba': self.tiba,
+            'mulai_nasi': self.mulai_nasi,
+            'selesai_nasi': self.selesai_nasi
+        })
+
+# ============================
+# PENCARIAN PEMBAGIAN PEKERJA
+# ============================
+def semua_pembagian(total_pekerja: int) -> list:
+    """Semua pembagian (lauk, angkat, nasi) dengan minimal satu pekerja per tahap"""
+    return [
+        (lauk, angkat, total_pekerja - lauk - angkat)
+        for lauk in range(1, total_pekerja - 1)
+        for angkat in range(1, total_pekerja - lauk)
+    ]
+
+def cari_pembagian_pekerja(total_pekerja: int,
+                           config: ConfigPiket = None,
+                           replikasi: int = 20,
+                           engine: str = "fast") -> pd.DataFrame:
+    """Evaluasi semua pembagian pekerja dan urutkan dari waktu total tercepat
+
+    Semua pembagian memakai seed replikasi yang sama (common random numbers),
+    sehingga perbedaan antar pembagian tidak tertutup derau acak.
+    """
+    config = config or ConfigPiket()
+    anak = np.random.SeedSequence(config.RANDOM_SEED).spawn(replikasi)
+    # 128 bit entropi per anak (seperti replikasi.seed_replikasi)
+    seeds = [int.from_bytes(s.generate_state(4).tobytes(), 'little') for s in anak]
+
+    baris = []
+    for lauk, angkat, nasi in semua_pembagian(total_pekerja):
+        hasil = [
+            PiketDES(replace(
+                config, PEKERJA_LAUK=lauk, PEKERJA_ANGKAT=angkat, PEKERJA_NASI=nasi,
+                RANDOM_SEED=seed
+            )).run(engine)
+            for seed in seeds
+        ]
+        waktu = np.array([h['waktu_total'] for h in hasil])
+        b = {
+            'PEKERJA_LAUK': lauk,
+            'PEKERJA_ANGKAT': angkat,
+            'PEKERJA_NASI': nasi,
+            'waktu_total_mean': waktu.mean(),
+            'waktu_total_std': waktu.std(ddof=1) if replikasi > 1 else 0.0
+        }
+        for tahap in TAHAP:
+            b[f'utilisasi_{tahap}'] = np.mean([h['tahap'][tahap]['utilisasi'] for h in hasil])
+        b['blocking_lauk'] = np.mean([h['tahap']['lauk']['blocking'] for h in hasil])
+        baris.append(b)
+
+    if not baris:
+        return pd.DataFrame()
+    return pd.DataFrame(baris).sort_values('waktu_total_mean').reset_index(drop=True)
@@ -0,0 +1,129 @@
+import time
+import simpy
+from collections import Counter, defaultdict
+from simpy.events import Timeout, Initialize, Process
+from simpy.resources.store import StorePut, StoreGet
+from simpy.resources.resource import Request, Release
+
+# ============================
+# PROFILING ENGINE SIMPY (OPT-IN)
+# ============================
+JENIS_EVENT = [
+    (Initialize, 'proses_mulai'),
+    (StorePut, 'antrian_put'),
+    (StoreGet, 'antrian_get'),
+    (Request, 'resource_request'),
+    (Release, 'resource_release'),
+    (Process, 'proses_selesai'),
+]
+
+def nama_proses(proses) -> str:
+    """Nama fungsi generator dari sebuah simpy.Process (mis. 'proses_mahasiswa')"""
+    if proses is None:
+        return 'luar_proses'
+    return getattr(proses._generator, '__name__', 'proses_lain')
+
+class ProfilEngine:
+    """Penghitung event per jenis, waktu per jenis proses, dan ukuran kalender"""
+
+    def __init__(self, engine: str = "simpy", jeda_polling: float = None,
+                 max_sampel_kalender: int = 2000):
+        self.engine = engine
+        self.jeda_polling = jeda_polling
+        self.dijadwalkan = Counter()
+        self.diproses = Counter()
+        self.waktu_proses = defaultdict(float)
+        self.step_proses = Counter()
+        self.max_sampel_kalender = max_sampel_kalender
+        self.jarak_sampel = 1
+        self.sampel_kalender = []
+        self.kalender_maks = 0
+        self.jumlah_step = 0
+        self.waktu_engine = 0.0
+        self.waktu_analisis = 0.0
+
+    def jenis_event(self, event, proses_aktif) -> str:
+        """Klasifikasi event saat dijadwalkan, berdasarkan kelas dan proses pembuatnya"""
+        if isinstance(event, Timeout):
+            pembuat = nama_proses(proses_aktif)
+            if pembuat == 'proses_kedatangan':
+                return 'timeout_kedatangan'
+            if self.jeda_polling is not None and event._delay == self.jeda_polling:
+                return 'timeout_polling'
+            return 'timeout_layanan'
+        for kelas, nama in JENIS_EVENT:
+            if isinstance(event, kelas):
+                return nama
+        return 'event_dispatch'
+
+    def catat_kalender(self, waktu: float, ukuran: int):
+        """Simpan ukuran kalender tiap jarak_sampel step (dijarangkan bila penuh)"""
+        if ukuran > self.kalender_maks:
+            self.kalender_maks = ukuran
+        if self.jumlah_step % self.jarak_sampel:
+            return
+        self.sampel_kalender.append((waktu, ukuran))
+        if len(self.sampel_kalender) >= self.max_sampel_kalender:
+            self.sampel_kalender = self.sampel_kalender[::2]
+            self.jarak_sampel *= 2
+
+    def ringkasan(self) -> dict:
+        total_step = sum(self.waktu_proses.values())
+        return {
+            'engine': self.engine,
+            'waktu_engine': self.waktu_engine,
+            'waktu_simulasi': self.waktu_engine - self.waktu_analisis,
+            'waktu_analisis': self.waktu_analisis,
+            'jumlah_step': self.jumlah_step,
+            'event_dijadwalkan': dict(self.dijadwalkan),
+            'event_diproses': dict(self.diproses),
+            'waktu_per_proses': dict(self.waktu_proses),
+            'step_per_proses': dict(self.step_proses),
+            # Loop irisan, penjadwalan, dan biaya instrumentasi itu sendiri
+            'waktu_di_luar_step': (
+                max(self.waktu_engine - self.waktu_analisis - total_step, 0.0)
+                if self.engine == "simpy" else None
+            ),
+            'kalender_maks': self.kalender_maks,
+            'sampel_kalender': list(self.sampel_kalender)
+        }
+
+class EnvironmentProfil(simpy.Environment):
+    """simpy.Environment yang mencatat setiap event ke ProfilEngine
+
+    Hanya dipakai bila Config.PROFILING aktif, sehingga environment biasa
+    tidak menanggung biaya instrumentasi sama sekali.
+    """
+
+    def __init__(self, profil: ProfilEngine, initial_time: float = 0):
+        super().__init__(initial_time)
+        self.profil = profil
+
+    def schedule(self, event, priority=simpy.events.NORMAL, delay=0):
+        jenis = self.profil.jenis_event(event, self.active_process)
+        event._jenis_profil = jenis
+        self.profil.dijadwalkan[jenis] += 1
+        super().schedule(event, priority, delay)
+
+    def step(self):
+        if self._queue:
+            event = self._queue[0][3]
+            profil = self.profil
+            profil.diproses[getattr(event, '_jenis_profil', 'tidak_dikenal')] += 1
+
+            # Waktu step dibebankan ke proses pertama yang dibangunkan event ini
+            nama = 'simpy_internal'
+            for callback in event.callbacks or ():
+                pemilik = getattr(callback, '__self__', None)
+                if isinstance(pemilik, Process):
+                    nama = nama_proses(pemilik)
+                    break
+
+            mulai = time.perf_counter()
+            super().step()
+            profil.waktu_proses[nama] += time.perf_counter() - mulai
+            profil.step_proses[nama] += 1
+            profil.jumlah_step += 1
+            profil.catat_kalender(self._now, len(self._queue))
+        else:
+            super().step()
@@ -0,0 +1,118 @@
+import numpy as np
+import plotly.graph_objects as go
+
+# ============================
+# LEVEL OF DETAIL UNTUK GRAFIK
+# ============================
+# Di atas BATAS_WEBGL titik per trace dipakai Scattergl (WebGL) alih-alih SVG
+BATAS_WEBGL = 2000
+# Jumlah titik maksimum per trace yang dikirim ke browser
+ANGGARAN_TITIK = 4000
+
+def pilih_scatter(jumlah_titik: int):
+    """Kelas trace scatter sesuai jumlah titik (SVG untuk sedikit, WebGL untuk banyak)"""
+    return go.Scattergl if jumlah_titik > BATAS_WEBGL else go.Scatter
+
+def lttb(x, y, n_target: int) -> np.ndarray:
+    """Indeks titik hasil Largest-Triangle-Three-Buckets
+
+    Titik pertama dan terakhir selalu dipertahankan; dari tiap bucket dipilih
+    titik yang membentuk segitiga terbesar dengan titik terpilih sebelumnya
+    dan rata-rata bucket berikutnya, sehingga bentuk kurva tetap terjaga.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_target >= n or n_target < 3:
+        return np.arange(n)
+
+    jumlah_bucket = n_target - 2
+    tepi = (np.arange(jumlah_bucket + 1) * (n - 2) / jumlah_bucket).astype(np.int64) + 1
+    tepi[-1] = n - 1
+
+    indeks = np.empty(n_target, dtype=np.int64)
+    indeks[0], indeks[-1] = 0, n - 1
+    a = 0
+    for i in range(jumlah_bucket):
+        awal, akhir = tepi[i], tepi[i + 1]
+        if i + 2 <= jumlah_bucket:
+            rata_x = x[tepi[i + 1]:tepi[i + 2]].mean()
+            rata_y = y[tepi[i + 1]:tepi[i + 2]].mean()
+        else:
+            rata_x, rata_y = x[-1], y[-1]
+        luas = np.abs(
+            (x[a] - rata_x) * (y[awal:akhir] - y[a])
+            - (x[a] - x[awal:akhir]) * (rata_y - y[a])
+        )
+        a = awal + int(np.argmax(luas))
+        indeks[i + 1] = a
+    return indeks
+
+def turunkan_minmax(y, n_target: int) -> np.ndarray:
+    """Indeks titik min dan max tiap bucket (puncak antrian tidak pernah hilang)"""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_target >= n or n_target < 4:
+        return np.arange(n)
+
+    jumlah_bucket = (n_target - 2) // 2
+    tepi = (np.arange(jumlah_bucket) * n / jumlah_bucket).astype(np.int64)
+    bucket = np.repeat(np.arange(jumlah_bucket), np.diff(np.append(tepi, n)))
+    minimum = np.minimum.reduceat(y, tepi)[bucket]
+    maksimum = np.maximum.reduceat(y, tepi)[bucket]
+
+    # Kemunculan pertama nilai min dan max di tiap bucket
+    _, pertama_min = np.unique(bucket[y == minimum], return_index=True)
+    _, pertama_max = np.unique(bucket[y == maksimum], return_index=True)
+    posisi = np.arange(n)
+    terpilih = np.concatenate([
+        [0, n - 1],
+        posisi[y == minimum][pertama_min],
+        posisi[y == maksimum][pertama_max]
+    ])
+    return np.unique(terpilih)
+
+def turunkan(x, y, anggaran: int = ANGGARAN_TITIK, metode: str = "lttb"):
+    """Downsample deret (x, y) ke paling banyak `anggaran` titik
+
+    Mengembalikan (x, y, info) dengan info berisi jumlah titik asli,
+    jumlah yang ditampilkan, dan metode yang dipakai.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) > anggaran and np.any(np.diff(x) < 0):
+        # LTTB dan bucketing berasumsi x terurut (mis. waktu selesai per ID)
+        urut = np.argsort(x, kind='stable')
+        x, y = x[urut], y[urut]
+    if metode == "minmax":
+        indeks = turunkan_minmax(y, anggaran)
+    else:
+        indeks = lttb(x, y, anggaran)
+    info = {'asli': len(x), 'ditampilkan': len(indeks), 'metode': metode}
+    return x[indeks], y[indeks], info
+
+def catatan_lod(fig, *info):
+    """Tambahkan keterangan jumlah titik yang tidak dikirim ke browser"""
+    asli = sum(i['asli'] for i in info)
+    ditampilkan = sum(i['ditampilkan'] for i in info)
+    if ditampilkan >= asli:
+        return fig
+    metode = "/".join(sorted({i['metode'].upper() for i in info if i['ditampilkan'] < i['asli']}))
+    fig.add_annotation(
+        text=(f"Menampilkan {ditampilkan:,} dari {asli:,} titik "
+              f"({asli - ditampilkan:,} diringkas, {metode})"),
+        xref="paper", yref="paper", x=0, y=-0.22,
+        xanchor="left", showarrow=False, font=dict(size=10, color="gray")
+    )
+    return fig
+
+def statistik_box(data) -> dict:
+    """Kuartil dan pagar Tukey untuk go.Box tanpa mengirim seluruh data"""
+    data = np.asarray(data, dtype=np.float64)
+    q1, median, q3 = np.percentile(data, [25, 50, 75])
+    iqr = q3 - q1
+    dalam = data[(data >= q1 - 1.5 * iqr) & (data <= q3 + 1.5 * iqr)]
+    return {
+        'q1': [q1], 'median': [median], 'q3': [q3],
+        'lowerfence': [dalam.min()], 'upperfence': [dalam.max()]
+    }
@@ -0,0 +1,249 @@
+import os
+import math
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor
+from kantin_des import Config, KantinPrasmananDES
+from statistik import t_kritis_95
+from penyimpanan_run import penyimpanan_aktif
+
+# ============================
+# REPLIKASI INDEPENDEN
+# ============================
+METRIK_REPLIKASI = ['avg_waktu_tunggu', 'max_waktu_tunggu', 'waktu_selesai_terakhir']
+
+def seed_replikasi(seed: int, n_replikasi: int) -> list:
+    """Seed independen per replikasi dari SeedSequence.spawn (bukan seed+i)
+
+    Tiap seed memuat 128 bit entropi anak (generate_state(4)), bukan satu
+    kata 32 bit yang bisa bertabrakan untuk jumlah replikasi besar.
+    """
+    anak = np.random.SeedSequence(seed).spawn(n_replikasi)
+    return [int.from_bytes(s.generate_state(4).tobytes(), 'little') for s in anak]
+
+def ringkas_metrik(results: dict) -> dict:
+    """Ambil metrik skalar dari dict results untuk dibandingkan antar replikasi"""
+    metrik = {nama: float(results[nama]) for nama in METRIK_REPLIKASI}
+    for nama, nilai in results['kuantil_waktu_tunggu'].items():
+        metrik[f'{nama}_waktu_tunggu'] = float(nilai)
+    for kelompok, util in results['utilisasi_kelompok'].items():
+        metrik[f'utilisasi_kelompok_{kelompok + 1}'] = float(util)
+    return metrik
+
+def jalankan_satu_replikasi(config: Config, engine: str = "fast") -> dict:
+    """Jalankan satu replikasi dan kembalikan metrik ringkasnya
+
+    Bila penyimpanan run aktif (KANTIN_RUN_STORE), run yang sudah pernah
+    dijalankan diambil dari disk dan run baru disimpan.
+    """
+    penyimpanan = penyimpanan_aktif()
+    if penyimpanan is not None:
+        metrik = penyimpanan.ambil_metrik(config, engine)
+        if metrik is not None:
+            return metrik
+    mulai = time.perf_counter()
+    model = KantinPrasmananDES(config)
+    results, _ = model.run_simulation(engine=engine)
+    metrik = ringkas_metrik(results)
+    if penyimpanan is not None:
+        penyimpanan.simpan(config, engine, metrik, durasi=time.perf_counter() - mulai)
+    return metrik
+
+def interval_kepercayaan(df_replikasi: pd.DataFrame) -> pd.DataFrame:
+    """Rata-rata, standar deviasi, dan CI 95% untuk tiap kolom metrik"""
+    n = len(df_replikasi)
+    mean = df_replikasi.mean()
+    std = df_replikasi.std(ddof=1)
+    half_width = t_kritis_95(n - 1) * std / math.sqrt(n)
+    return pd.DataFrame({
+        'mean': mean,
+        'std': std,
+        'ci_bawah': mean - half_width,
+        'ci_atas': mean + half_width,
+        'half_width': half_width
+    })
+
+def _jalankan_semua(configs: list, engine: str, max_workers: int = None) -> pd.DataFrame:
+    """Jalankan jalankan_satu_replikasi untuk tiap config, paralel bila bisa"""
+    engines = [engine] * len(configs)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(configs))
+
+    if max_workers <= 1:
+        hasil = list(map(jalankan_satu_replikasi, configs, engines))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            hasil = list(executor.map(jalankan_satu_replikasi, configs, engines))
+    return pd.DataFrame(hasil)
+
+def jalankan_replikasi(config: Config,
+                       n_replikasi: int = 10,
+                       engine: str = "fast",
+                       max_workers: int = None,
+                       antitetik: bool = False):
+    """Jalankan N replikasi independen secara paralel di semua core
+
+    Setiap replikasi memakai seed hasil SeedSequence(config.RANDOM_SEED).spawn.
+    Mengembalikan (ringkasan, df_replikasi): ringkasan berisi mean, std dan
+    CI 95% per metrik, df_replikasi berisi metrik tiap replikasi.
+
+    Dengan antitetik=True setiap seed dijalankan dua kali (U dan 1-U) dan
+    rata-rata pasangan dianggap satu replikasi; ringkasan mendapat kolom
+    faktor_reduksi_varians (>1 berarti lebih efisien per run dari replikasi biasa).
+    """
+    seeds = seed_replikasi(config.RANDOM_SEED, n_replikasi)
+    if not antitetik:
+        configs = [replace(config, RANDOM_SEED=seed, ANTITETIK=False) for seed in seeds]
+        df_replikasi = _jalankan_semua(configs, engine, max_workers)
+        df_replikasi.index.name = 'replikasi'
+        return interval_kepercayaan(df_replikasi), df_replikasi
+
+    configs = [
+        replace(config, RANDOM_SEED=seed, ANTITETIK=anti)
+        for seed in seeds for anti in (False, True)
+    ]
+    df_run = _jalankan_semua(configs, engine, max_workers)
+    df_replikasi = (df_run.iloc[0::2].reset_index(drop=True)
+                    + df_run.iloc[1::2].reset_index(drop=True)) / 2
+    df_replikasi.index.name = 'replikasi'
+
+    ringkasan = interval_kepercayaan(df_replikasi)
+    # Var(rata-rata 2n run independen) / Var(rata-rata n pasangan antitetik)
+    ringkasan['faktor_reduksi_varians'] = (
+        df_run.var(ddof=1) / 2 / df_replikasi.var(ddof=1)
+    )
+    return ringkasan, df_replikasi
+
+# ============================
+# REPLIKASI SEKUENSIAL (STOPPING RULE)
+# ============================
+METRIK_PRESISI = ['avg_waktu_tunggu', 'waktu_selesai_terakhir']
+# Half-width (menit) yang dianggap cukup presisi berapa pun mean-nya; tanpa ini
+# metrik yang mean-nya ~0 (tunggu pada beban rendah) tidak pernah mencapai target relatif
+TOLERANSI_ABSOLUT = 0.05
+
+def presisi_relatif(ringkasan: pd.DataFrame) -> pd.Series:
+    """Half-width CI relatif terhadap |mean| (0 bila half-width 0, mis. tanpa antrian)"""
+    return (ringkasan['half_width'] / ringkasan['mean'].abs()).where(ringkasan['half_width'] > 0, 0.0)
+
+def presisi_tercapai(ringkasan: pd.DataFrame, target_presisi: float,
+                     toleransi_absolut: float = TOLERANSI_ABSOLUT) -> pd.Series:
+    """half_width <= max(target_presisi * |mean|, toleransi_absolut) per metrik"""
+    batas = np.maximum(target_presisi * ringkasan['mean'].abs(), toleransi_absolut)
+    return ringkasan['half_width'] <= batas
+
+def jalankan_sampai_presisi(config: Config,
+                            target_presisi: float = 0.05,
+                            metrik: list = None,
+                            toleransi_absolut: float = TOLERANSI_ABSOLUT,
+                            anggaran_waktu: float = None,
+                            n_awal: int = 5,
+                            n_maks: int = 500,
+                            ukuran_batch: int = None,
+                            engine: str = "fast",
+                            max_workers: int = None,
+                            antitetik: bool = False):
+    """Tambah replikasi per batch sampai half-width CI 95% relatif <= target_presisi
+
+    Half-width <= toleransi_absolut (menit) juga dianggap cukup, agar metrik
+    dengan mean mendekati 0 tidak menghabiskan seluruh n_maks.
+    Berhenti bila semua metrik (default METRIK_PRESISI) mencapai presisi,
+    anggaran_waktu (detik) habis, atau n_maks replikasi tercapai. Anggaran
+    diperiksa antar batch, jadi batch terakhir bisa sedikit melewatinya.
+    Seed sama dengan jalankan_replikasi, sehingga n replikasi pertama identik.
+
+    Mengembalikan (ringkasan, df_replikasi, info); info berisi n_replikasi,
+    durasi, alasan_berhenti ('presisi', 'anggaran_waktu', 'n_maks') dan
+    presisi_relatif per metrik.
+    """
+    metrik = metrik or METRIK_PRESISI
+    if n_maks < 2:
+        raise ValueError("n_maks harus >= 2 agar CI bisa dihitung")
+    n_awal = min(max(n_awal, 2), n_maks)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    ukuran_batch = ukuran_batch or max(max_workers, 2)
+    seeds = seed_replikasi(config.RANDOM_SEED, n_maks)
+    mulai = time.perf_counter()
+
+    # Satu pool untuk semua batch agar worker tidak dibuat ulang
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    peta = executor.map if executor else map
+    df_run = pd.DataFrame()
+    try:
+        n = 0
+        while True:
+            n_baru = min(max(n_awal, n + ukuran_batch), n_maks)
+            configs = [
+                replace(config, RANDOM_SEED=seed, ANTITETIK=anti)
+                for seed in seeds[n:n_baru]
+                for anti in ((False, True) if antitetik else (False,))
+            ]
+            hasil = list(peta(jalankan_satu_replikasi, configs, [engine] * len(configs)))
+            df_run = pd.concat([df_run, pd.DataFrame(hasil)], ignore_index=True)
+            n = n_baru
+
+            if antitetik:
+                df_replikasi = (df_run.iloc[0::2].reset_index(drop=True)
+                                + df_run.iloc[1::2].reset_index(drop=True)) / 2
+            else:
+                df_replikasi = df_run
+            ringkasan = interval_kepercayaan(df_replikasi)
+            presisi = presisi_relatif(ringkasan.loc[metrik])
+
+            if presisi_tercapai(ringkasan.loc[metrik], target_presisi, toleransi_absolut).all():
+                alasan = 'presisi'
+                break
+            if n >= n_maks:
+                alasan = 'n_maks'
+                break
+            if anggaran_waktu is not None and time.perf_counter() - mulai >= anggaran_waktu:
+                alasan = 'anggaran_waktu'
+                break
+    finally:
+        if executor:
+            executor.shutdown()
+
+    df_replikasi.index.name = 'replikasi'
+    ringkasan['presisi_relatif'] = presisi_relatif(ringkasan)
+    info = {
+        'n_replikasi': n,
+        'durasi': time.perf_counter() - mulai,
+        'alasan_berhenti': alasan,
+        'presisi_relatif': presisi.to_dict()
+    }
+    return ringkasan, df_replikasi, info
+
+def bandingkan_crn(config_a: Config,
+                   config_b: Config,
+                   n_replikasi: int = 10,
+                   engine: str = "fast",
+                   max_workers: int = None) -> pd.DataFrame:
+    """Bandingkan dua skenario dengan common random numbers (seed sama per replikasi)
+
+    Mengembalikan selisih (B - A) per metrik dengan CI 95% berpasangan,
+    half-width jika kedua skenario dijalankan dengan seed independen,
+    dan faktor_reduksi_varians = (Var A + Var B) / Var(B - A).
+    """
+    seeds = seed_replikasi(config_a.RANDOM_SEED, n_replikasi)
+    configs = [replace(config_a, RANDOM_SEED=seed) for seed in seeds]
+    configs += [replace(config_b, RANDOM_SEED=seed) for seed in seeds]
+    df_run = _jalankan_semua(configs, engine, max_workers)
+
+    # Metrik utilisasi per kelompok hanya dibandingkan jika ada di kedua skenario
+    df_a = df_run.iloc[:n_replikasi].reset_index(drop=True).dropna(axis=1, how='all')
+    df_b = df_run.iloc[n_replikasi:].reset_index(drop=True).dropna(axis=1, how='all')
+    kolom = [k for k in df_a.columns if k in df_b.columns]
+    df_a, df_b = df_a[kolom], df_b[kolom]
+
+    selisih = interval_kepercayaan(df_b - df_a)
+    var_independen = df_a.var(ddof=1) + df_b.var(ddof=1)
+    selisih['half_width_independen'] = (
+        t_kritis_95(n_replikasi - 1) * np.sqrt(var_independen / n_replikasi)
+    )
+    selisih['faktor_reduksi_varians'] = var_independen / (df_b - df_a).var(ddof=1)
+    return selisih
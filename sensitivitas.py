@@ -0,0 +1,116 @@
+import os
+import itertools
+import numpy as np
+import pandas as pd
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from kantin_des import Config, config_simulasi
+from cache_hasil import hash_config
+from replikasi import jalankan_satu_replikasi
+
+# ============================
+# ANALISIS SENSITIVITAS (GRID SWEEP)
+# ============================
+PARAMETER_GRID = [
+    'NUM_MAHASISWA', 'NUM_KELOMPOK', 'NUM_STAFF_PER_KELOMPOK',
+    'MIN_SERVICE_TIME', 'MAX_SERVICE_TIME'
+]
+
+def buat_grid(base: Config,
+              num_mahasiswa=None,
+              num_kelompok=None,
+              num_staff_per_kelompok=None,
+              service_time=None) -> list:
+    """Ekspansi grid Kartesius menjadi daftar Config
+
+    Parameter yang tidak diberikan memakai nilai dari base. service_time
+    berisi pasangan (min, max); pasangan dengan min > max dilewati.
+    """
+    num_mahasiswa = num_mahasiswa or [base.NUM_MAHASISWA]
+    num_kelompok = num_kelompok or [base.NUM_KELOMPOK]
+    num_staff_per_kelompok = num_staff_per_kelompok or [base.NUM_STAFF_PER_KELOMPOK]
+    service_time = service_time or [(base.MIN_SERVICE_TIME, base.MAX_SERVICE_TIME)]
+
+    configs = []
+    for n, k, s, (t_min, t_max) in itertools.product(
+        num_mahasiswa, num_kelompok, num_staff_per_kelompok, service_time
+    ):
+        if t_min > t_max:
+            continue
+        configs.append(replace(
+            base,
+            NUM_MAHASISWA=int(n),
+            NUM_KELOMPOK=int(k),
+            NUM_STAFF_PER_KELOMPOK=int(s),
+            MIN_SERVICE_TIME=float(t_min),
+            MAX_SERVICE_TIME=float(t_max)
+        ))
+    return configs
+
+def kunci_sel(config: Config, engine: str) -> str:
+    """Kunci unik satu sel grid, dipakai untuk melewati sel yang sudah dihitung
+
+    Sama dengan kunci cache run tunggal: jam mulai tidak ikut (config_simulasi).
+    """
+    return hash_config(config_simulasi(config), engine)
+
+def baris_sel(config: Config, metrik: dict) -> dict:
+    """Gabungkan parameter sel dan metrik hasil menjadi satu baris tidy"""
+    baris = {nama: getattr(config, nama) for nama in PARAMETER_GRID}
+    baris['total_staff'] = config.NUM_KELOMPOK * config.NUM_STAFF_PER_KELOMPOK
+    baris.update(metrik)
+    baris['utilisasi_rata'] = float(np.mean([
+        nilai for nama, nilai in metrik.items() if nama.startswith('utilisasi_kelompok_')
+    ]))
+    return baris
+
+def jalankan_sweep(configs: list,
+                   engine: str = "fast",
+                   max_workers: int = None,
+                   hasil_tersimpan: dict = None):
+    """Generator: jalankan sel grid paralel dan yield tiap baris begitu selesai
+
+    hasil_tersimpan (dict kunci_sel -> baris) diisi selama sweep berjalan;
+    sel yang kuncinya sudah ada langsung di-yield tanpa disimulasikan ulang.
+    """
+    if hasil_tersimpan is None:
+        hasil_tersimpan = {}
+
+    baru = {}
+    for config in configs:
+        kunci = kunci_sel(config, engine)
+        if kunci in hasil_tersimpan:
+            yield hasil_tersimpan[kunci]
+        else:
+            baru.setdefault(kunci, config)
+
+    if not baru:
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(baru))
+
+    if max_workers <= 1:
+        for kunci, config in baru.items():
+            baris = baris_sel(config, jalankan_satu_replikasi(config, engine))
+            hasil_tersimpan[kunci] = baris
+            yield baris
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(jalankan_satu_replikasi, config, engine): (kunci, config)
+            for kunci, config in baru.items()
+        }
+        for future in as_completed(futures):
+            kunci, config = futures[future]
+            baris = baris_sel(config, future.result())
+            hasil_tersimpan[kunci] = baris
+            yield baris
+
+def sweep_dataframe(baris: list) -> pd.DataFrame:
+    """Susun baris hasil sweep menjadi DataFrame tidy yang terurut"""
+    if not baris:
+        return pd.DataFrame(columns=PARAMETER_GRID)
+    return pd.DataFrame(baris).sort_values(PARAMETER_GRID).reset_index(drop=True)
@@ -0,0 +1,119 @@
+import numpy as np
+from dataclasses import dataclass
+
+# ============================
+# ENGINE VEKTOR PIKET OMPRENG
+# ============================
+@dataclass
+class HasilPiket:
+    """Hasil simulasi piket untuk R replikasi sekaligus (satuan detik)"""
+    waktu_selesai: np.ndarray   # (R, TOTAL_OMPRENG) waktu selesai nasi tiap ompreng
+    total_lauk: np.ndarray      # (R,)
+    total_angkat: np.ndarray    # (R,)
+    total_nasi: np.ndarray      # (R,)
+
+    @property
+    def waktu_total(self) -> np.ndarray:
+        """Waktu selesai ompreng terakhir per replikasi"""
+        if self.waktu_selesai.shape[1] == 0:
+            return np.zeros(self.waktu_selesai.shape[0])
+        return self.waktu_selesai[:, -1]
+
+    def waktu_selesai_meja(self, mahasiswa_per_meja: int) -> np.ndarray:
+        """Waktu selesai ompreng terakhir tiap meja, bentuk (R, jumlah meja)"""
+        return self.waktu_selesai[:, mahasiswa_per_meja - 1::mahasiswa_per_meja]
+
+def _rekurensi_max(batas, durasi):
+    """Hitung X_k = max(batas_k, X_{k-1}) + durasi_k, X_0 = 0, per baris
+
+    Dengan C_k = cumsum(durasi) berlaku X_k = C_k + max(0, max_{j<=k}(batas_j - C_{j-1})),
+    sehingga rantai max() cukup dihitung dengan cumsum dan running max.
+    """
+    kumulatif = np.cumsum(durasi, axis=1)
+    geser = np.maximum(batas - (kumulatif - durasi), 0.0)
+    return kumulatif + np.maximum.accumulate(geser, axis=1)
+
+def simulasi_piket_vektor(total_ompreng: int,
+                          total_mahasiswa_yang_piket: int,
+                          min_lauk: float, max_lauk: float,
+                          min_nasi: float, max_nasi: float,
+                          min_angkat: float, max_angkat: float,
+                          replikasi: int = 1,
+                          seed=None,
+                          batch_min: int = 4,
+                          batch_max: int = 7) -> HasilPiket:
+    """Simulasi pipeline lauk -> angkat (batch) -> nasi untuk banyak replikasi
+
+    Setara dengan loop per ompreng di app.py: waktu tiap tahap dibagi jumlah
+    mahasiswa piket, angkat dilakukan per batch acak berukuran 4-7 ompreng.
+    """
+    rng = np.random.default_rng(seed)
+    R, T = replikasi, total_ompreng
+    p = total_mahasiswa_yang_piket
+
+    if T <= 0:
+        kosong = np.zeros(R)
+        return HasilPiket(np.zeros((R, 0)), kosong, kosong.copy(), kosong.copy())
+
+    lauk = rng.uniform(min_lauk, max_lauk, (R, T))
+    nasi = rng.uniform(min_nasi, max_nasi, (R, T))
+
+    # LAUK: tanpa ketergantungan, cukup jumlah kumulatif
+    waktu_lauk_selesai = np.cumsum(lauk / p, axis=1)
+
+    # ANGKAT (BATCH): batch ke-k selesai diisi pada ompreng akhir_batch[k]
+    jumlah_batch_maks = T // batch_min + 1
+    ukuran_batch = rng.integers(batch_min, batch_max + 1, (R, jumlah_batch_maks))
+    akhir_batch = np.cumsum(ukuran_batch, axis=1) - 1
+    batch_valid = akhir_batch < T
+
+    angkat = np.where(
+        batch_valid, rng.uniform(min_angkat, max_angkat, (R, jumlah_batch_maks)), 0.0
+    )
+    lauk_saat_batch = np.take_along_axis(
+        waktu_lauk_selesai, np.minimum(akhir_batch, T - 1), axis=1
+    )
+    batas_angkat = np.where(batch_valid, lauk_saat_batch, -np.inf)
+    waktu_angkat_batch = _rekurensi_max(batas_angkat, angkat / p)
+
+    # Waktu angkat yang berlaku untuk tiap ompreng = batch terakhir yang sudah selesai
+    penanda = np.zeros((R, T + 1), dtype=np.int32)
+    baris = np.broadcast_to(np.arange(R)[:, None], akhir_batch.shape)
+    penanda[baris[batch_valid], akhir_batch[batch_valid]] = 1
+    batch_ke = np.cumsum(penanda[:, :T], axis=1)
+    waktu_angkat_selesai = np.take_along_axis(
+        np.hstack([np.zeros((R, 1)), waktu_angkat_batch]), batch_ke, axis=1
+    )
+
+    # NASI: menunggu angkat dan ompreng sebelumnya
+    waktu_nasi_selesai = _rekurensi_max(waktu_angkat_selesai, nasi / p)
+
+    return HasilPiket(
+        waktu_selesai=waktu_nasi_selesai,
+        total_lauk=lauk.sum(axis=1),
+        total_angkat=angkat.sum(axis=1),
+        total_nasi=nasi.sum(axis=1)
+    )
+
+# Parameter bawaan, sama dengan nilai awal sidebar app.py
+PARAMETER_PIKET = {
+    "total_mahasiswa_yang_piket": 7,
+    "total_meja": 60,
+    "mahasiswa_per_meja": 3,
+    "min_lauk": 30, "max_lauk": 60,
+    "min_nasi": 30, "max_nasi": 60,
+    "min_angkat": 20, "max_angkat": 60,
+    "seed": 42
+}
+
+def jalankan_piket(parameter: dict, replikasi: int = 1) -> HasilPiket:
+    """Jalankan simulasi piket dari dict parameter (format PARAMETER_PIKET)"""
+    return simulasi_piket_vektor(
+        parameter["total_meja"] * parameter["mahasiswa_per_meja"],
+        parameter["total_mahasiswa_yang_piket"],
+        parameter["min_lauk"], parameter["max_lauk"],
+        parameter["min_nasi"], parameter["max_nasi"],
+        parameter["min_angkat"], parameter["max_angkat"],
+        replikasi=replikasi,
+        seed=parameter["seed"]
+    )
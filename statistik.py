@@ -0,0 +1,384 @@
+import math
+import numpy as np
+
+# ============================
+# AKUMULATOR STATISTIK STREAMING
+# ============================
+class Welford:
+    """Rata-rata, varians, min dan max secara streaming dengan memori O(1)"""
+    __slots__ = ('n', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def tambah(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def tambah_banyak(self, data):
+        """Tambahkan satu array sekaligus (digabung dengan rumus Chan)"""
+        data = np.asarray(data, dtype=np.float64)
+        if data.size == 0:
+            return
+        batch = Welford()
+        batch.n = int(data.size)
+        batch.mean = float(data.mean())
+        batch.m2 = float(((data - batch.mean) ** 2).sum())
+        batch.min = float(data.min())
+        batch.max = float(data.max())
+        self.gabung(batch)
+
+    def gabung(self, lain: 'Welford'):
+        """Gabungkan akumulator lain (mis. dari replikasi paralel) ke akumulator ini"""
+        if lain.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean, self.m2 = lain.n, lain.mean, lain.m2
+            self.min, self.max = lain.min, lain.max
+            return
+        n = self.n + lain.n
+        delta = lain.mean - self.mean
+        self.mean += delta * lain.n / n
+        self.m2 += lain.m2 + delta**2 * self.n * lain.n / n
+        self.n = n
+        self.min = min(self.min, lain.min)
+        self.max = max(self.max, lain.max)
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.n
+
+    @property
+    def var(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else float('nan')
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var) if self.n > 1 else float('nan')
+
+class RataRataWaktu:
+    """Rata-rata berbobot waktu dari level yang berubah (panjang antrian, staff sibuk)
+
+    Hanya menyimpan luas di bawah kurva sampai perubahan terakhir, sehingga
+    memori tetap O(1) berapa pun jumlah event-nya.
+    """
+    __slots__ = ('t_awal', 't_terakhir', 'level', 'luas', 'maks')
+
+    def __init__(self, t_awal: float = 0.0, level: float = 0.0):
+        self.t_awal = t_awal
+        self.t_terakhir = t_awal
+        self.level = level
+        self.luas = 0.0
+        self.maks = level
+
+    def ubah(self, t: float, level: float):
+        """Catat bahwa level berubah menjadi `level` pada waktu t"""
+        self.luas += self.level * (t - self.t_terakhir)
+        self.t_terakhir = t
+        self.level = level
+        if level > self.maks:
+            self.maks = level
+
+    def ubah_banyak(self, waktu, level):
+        """Versi vektor dari ubah() untuk deret perubahan yang sudah terurut waktu"""
+        waktu = np.asarray(waktu, dtype=np.float64)
+        level = np.asarray(level, dtype=np.float64)
+        if waktu.size == 0:
+            return
+        self.luas += self.level * (waktu[0] - self.t_terakhir)
+        self.luas += float(np.dot(level[:-1], np.diff(waktu)))
+        self.t_terakhir = float(waktu[-1])
+        self.level = float(level[-1])
+        self.maks = max(self.maks, float(level.max()))
+
+    def rata_rata(self, t_akhir: float = None) -> float:
+        """Rata-rata level pada interval [t_awal, t_akhir]"""
+        if t_akhir is None:
+            t_akhir = self.t_terakhir
+        durasi = t_akhir - self.t_awal
+        if durasi <= 0:
+            return 0.0
+        luas = self.luas + self.level * (t_akhir - self.t_terakhir)
+        return luas / durasi
+
+class SketsaKuantil:
+    """Sketsa kuantil ber-galat relatif (DDSketch) yang dapat digabung
+
+    Nilai positif dimasukkan ke bucket logaritmik dengan rasio gamma, sehingga
+    kuantil yang dikembalikan berada dalam galat relatif alpha dari nilai aslinya.
+    Nilai <= batas_nol (mis. waktu tunggu nol) dihitung terpisah. Jumlah bucket
+    dibatasi max_bucket; bila terlampaui, bucket terendah digabung.
+    """
+
+    def __init__(self, alpha: float = 0.01, max_bucket: int = 2048, batas_nol: float = 1e-9):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self.log_gamma = math.log(self.gamma)
+        self.max_bucket = max_bucket
+        self.batas_nol = batas_nol
+        self.bucket = {}
+        self.jumlah_nol = 0
+        self.n = 0
+
+    def tambah(self, x: float):
+        self.n += 1
+        if x <= self.batas_nol:
+            self.jumlah_nol += 1
+            return
+        indeks = math.ceil(math.log(x) / self.log_gamma)
+        self.bucket[indeks] = self.bucket.get(indeks, 0) + 1
+        if len(self.bucket) > self.max_bucket:
+            self._ringkas()
+
+    def tambah_banyak(self, data):
+        data = np.asarray(data, dtype=np.float64)
+        if data.size == 0:
+            return
+        nol = data <= self.batas_nol
+        self.jumlah_nol += int(nol.sum())
+        self.n += int(data.size)
+        indeks = np.ceil(np.log(data[~nol]) / self.log_gamma).astype(np.int64)
+        for k, jumlah in zip(*np.unique(indeks, return_counts=True)):
+            self.bucket[int(k)] = self.bucket.get(int(k), 0) + int(jumlah)
+        if len(self.bucket) > self.max_bucket:
+            self._ringkas()
+
+    def _ringkas(self):
+        kunci = sorted(self.bucket)
+        lebih = len(kunci) - self.max_bucket
+        tujuan = kunci[lebih]
+        for k in kunci[:lebih]:
+            self.bucket[tujuan] += self.bucket.pop(k)
+
+    def gabung(self, lain: 'SketsaKuantil'):
+        """Gabungkan sketsa lain (alpha harus sama)"""
+        if lain.gamma != self.gamma:
+            raise ValueError("Sketsa dengan alpha berbeda tidak dapat digabung")
+        self.n += lain.n
+        self.jumlah_nol += lain.jumlah_nol
+        for k, jumlah in lain.bucket.items():
+            self.bucket[k] = self.bucket.get(k, 0) + jumlah
+        if len(self.bucket) > self.max_bucket:
+            self._ringkas()
+
+    def kuantil(self, q: float) -> float:
+        if self.n == 0:
+            return float('nan')
+        peringkat = q * (self.n - 1)
+        if peringkat < self.jumlah_nol:
+            return 0.0
+        kumulatif = self.jumlah_nol
+        for k in sorted(self.bucket):
+            kumulatif += self.bucket[k]
+            if kumulatif > peringkat:
+                return 2 * self.gamma**k / (self.gamma + 1)
+        return 2 * self.gamma**max(self.bucket) / (self.gamma + 1)
+
+class HistogramTetap:
+    """Histogram dengan tepi bin tetap; nilai di luar rentang dihitung terpisah"""
+
+    def __init__(self, batas_bawah: float, batas_atas: float, jumlah_bin: int):
+        if batas_atas <= batas_bawah:
+            batas_atas = batas_bawah + 1.0
+        self.tepi = np.linspace(batas_bawah, batas_atas, jumlah_bin + 1)
+        self.jumlah = np.zeros(jumlah_bin, dtype=np.int64)
+        self.di_bawah = 0
+        self.di_atas = 0
+
+    def tambah_banyak(self, data):
+        data = np.asarray(data, dtype=np.float64)
+        bawah, atas = self.tepi[0], self.tepi[-1]
+        self.di_bawah += int((data < bawah).sum())
+        self.di_atas += int((data > atas).sum())
+        dalam = data[(data >= bawah) & (data <= atas)]
+        # Seperti np.histogram, nilai tepat di batas atas masuk bin terakhir
+        indeks = np.minimum(
+            ((dalam - bawah) / (atas - bawah) * len(self.jumlah)).astype(np.int64),
+            len(self.jumlah) - 1
+        )
+        self.jumlah += np.bincount(indeks, minlength=len(self.jumlah))
+
+    def gabung(self, lain: 'HistogramTetap'):
+        if not np.array_equal(self.tepi, lain.tepi):
+            raise ValueError("Histogram dengan tepi bin berbeda tidak dapat digabung")
+        self.jumlah += lain.jumlah
+        self.di_bawah += lain.di_bawah
+        self.di_atas += lain.di_atas
+
+# ============================
+# DISTRIBUSI t
+# ============================
+# Nilai kritis t (dua sisi, 95%) untuk derajat bebas 1-30
+T_KRITIS_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+]
+
+def t_kritis_95(derajat_bebas: int) -> float:
+    """Nilai kritis t 95% dua sisi (tabel, lalu ekspansi Cornish-Fisher)"""
+    if derajat_bebas < 1:
+        return float('nan')
+    if derajat_bebas <= len(T_KRITIS_95):
+        return T_KRITIS_95[derajat_bebas - 1]
+    z = 1.959964
+    return (z + (z**3 + z) / (4 * derajat_bebas)
+            + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * derajat_bebas**2))
+
+def peluang_t(t: float, derajat_bebas: int) -> float:
+    """CDF distribusi t Student, P(T <= t), bentuk tertutup untuk derajat bebas bulat"""
+    if derajat_bebas < 1:
+        return float('nan')
+    theta = math.atan(t / math.sqrt(derajat_bebas))
+    cos2 = math.cos(theta) ** 2
+    # Deret 1 + a1 cos^2 + a2 cos^4 + ... dengan suku terakhir bergantung paritas
+    if derajat_bebas % 2:
+        suku, deret = 1.0, 1.0 if derajat_bebas > 1 else 0.0
+        for j in range(1, (derajat_bebas - 1) // 2):
+            suku *= cos2 * (2 * j) / (2 * j + 1)
+            deret += suku
+        dua_sisi = 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * deret)
+    else:
+        suku, deret = 1.0, 1.0
+        for j in range(1, derajat_bebas // 2):
+            suku *= cos2 * (2 * j - 1) / (2 * j)
+            deret += suku
+        dua_sisi = math.sin(theta) * deret
+    return 0.5 + dua_sisi / 2
+
+def cek_little(rata_antrian: float, jumlah: int, rata_tunggu: float, horizon: float) -> dict:
+    """Bandingkan L (rata-rata antrian berbobot waktu) dengan lambda * W"""
+    laju = jumlah / horizon if horizon > 0 else 0.0
+    lambda_w = laju * rata_tunggu
+    skala = max(abs(rata_antrian), abs(lambda_w), 1e-12)
+    return {
+        'L': rata_antrian,
+        'lambda': laju,
+        'W': rata_tunggu,
+        'lambda_W': lambda_w,
+        'selisih_relatif': abs(rata_antrian - lambda_w) / skala
+    }
+
+# ============================
+# STEADY STATE: MSER-5 DAN BATCH MEANS
+# ============================
+class RataRataBatch:
+    """Rata-rata per batch observasi berurutan dengan memori terbatas
+
+    Observasi dikelompokkan per ukuran_batch (awal 5, seperti MSER-5). Bila
+    jumlah batch mencapai max_batch, pasangan batch berdekatan digabung dan
+    ukuran batch digandakan, sehingga memori O(max_batch) untuk run sepanjang apa pun.
+    """
+
+    def __init__(self, ukuran_batch: int = 5, max_batch: int = 1024):
+        self.ukuran_batch = ukuran_batch
+        self.max_batch = max_batch
+        self.jumlah = []
+        self.waktu_akhir = []
+        self._jumlah_sisa = 0.0
+        self._n_sisa = 0
+
+    @property
+    def n(self) -> int:
+        return len(self.jumlah) * self.ukuran_batch + self._n_sisa
+
+    def tambah(self, x: float, waktu: float):
+        self._jumlah_sisa += x
+        self._n_sisa += 1
+        if self._n_sisa == self.ukuran_batch:
+            self._tutup_batch(self._jumlah_sisa, waktu)
+
+    def tambah_banyak(self, data, waktu):
+        """Tambahkan array observasi beserta waktu kejadiannya (urutan dipertahankan)"""
+        data = np.asarray(data, dtype=np.float64)
+        waktu = np.asarray(waktu, dtype=np.float64)
+        i = 0
+        while i < len(data):
+            perlu = self.ukuran_batch - self._n_sisa
+            if self._n_sisa or len(data) - i < perlu:
+                ambil = min(perlu, len(data) - i)
+                self._jumlah_sisa += float(data[i:i + ambil].sum())
+                self._n_sisa += ambil
+                i += ambil
+                if self._n_sisa == self.ukuran_batch:
+                    self._tutup_batch(self._jumlah_sisa, float(waktu[i - 1]))
+                continue
+            # Batch penuh sekaligus, dibatasi agar tidak melewati max_batch
+            k = min((len(data) - i) // self.ukuran_batch, self.max_batch - len(self.jumlah))
+            akhir = i + k * self.ukuran_batch
+            self.jumlah.extend(data[i:akhir].reshape(k, self.ukuran_batch).sum(axis=1).tolist())
+            self.waktu_akhir.extend(waktu[i:akhir][self.ukuran_batch - 1::self.ukuran_batch].tolist())
+            i = akhir
+            if len(self.jumlah) >= self.max_batch:
+                self._kompres()
+
+    def _tutup_batch(self, jumlah: float, waktu: float):
+        self.jumlah.append(jumlah)
+        self.waktu_akhir.append(waktu)
+        self._jumlah_sisa = 0.0
+        self._n_sisa = 0
+        if len(self.jumlah) >= self.max_batch:
+            self._kompres()
+
+    def _kompres(self):
+        genap = len(self.jumlah) // 2 * 2
+        self.jumlah = [a + b for a, b in zip(self.jumlah[0:genap:2], self.jumlah[1:genap:2])]
+        self.waktu_akhir = self.waktu_akhir[1:genap:2]
+        self.ukuran_batch *= 2
+
+    def rata_rata_batch(self) -> np.ndarray:
+        return np.asarray(self.jumlah) / self.ukuran_batch
+
+def titik_potong_mser(rata_batch: np.ndarray) -> int:
+    """Jumlah batch awal yang dibuang menurut MSER (minimum di paruh pertama)"""
+    k = len(rata_batch)
+    # Jumlah dan jumlah kuadrat ekor y[d:] untuk semua d sekaligus
+    ekor = np.cumsum(rata_batch[::-1])[::-1]
+    ekor_kuadrat = np.cumsum(rata_batch[::-1] ** 2)[::-1]
+    sisa = k - np.arange(k)
+    mser = (ekor_kuadrat - ekor**2 / sisa) / sisa**2
+    return int(np.argmin(mser[:k // 2 + 1]))
+
+def analisis_steady_state(batch: RataRataBatch, jumlah_batch_ci: int = 20) -> dict:
+    """Titik potong warm-up (MSER-5) dan CI 95% batch means dari satu run panjang
+
+    Setelah batch warm-up dibuang, sisa batch digabung menjadi jumlah_batch_ci
+    batch besar (sisa pembagian dibuang dari awal) untuk CI distribusi t.
+    Mengembalikan None bila data terlalu sedikit (< 10 batch).
+    """
+    rata_batch = batch.rata_rata_batch()
+    if len(rata_batch) < 10:
+        return None
+
+    d = titik_potong_mser(rata_batch)
+    steady = rata_batch[d:]
+    b = min(jumlah_batch_ci, len(steady))
+    per_batch = len(steady) // b
+    besar = steady[len(steady) - b * per_batch:].reshape(b, per_batch).mean(axis=1)
+
+    mean = float(besar.mean())
+    half_width = t_kritis_95(b - 1) * float(besar.std(ddof=1)) / math.sqrt(b)
+    return {
+        'titik_potong': d * batch.ukuran_batch,
+        'waktu_potong': batch.waktu_akhir[d - 1] if d else 0.0,
+        'n_steady': len(steady) * batch.ukuran_batch,
+        'rata_rata': mean,
+        'rata_rata_semua': float(rata_batch.mean()),
+        'half_width': half_width,
+        'ci_bawah': mean - half_width,
+        'ci_atas': mean + half_width,
+        'jumlah_batch': b,
+        'ukuran_batch': per_batch * batch.ukuran_batch,
+        'rata_rata_batch': rata_batch,
+        'waktu_batch': np.asarray(batch.waktu_akhir)
+    }
@@ -0,0 +1,11 @@
+import os
+import sys
+import pytest
+
+# Modul aplikasi berada di root repo (tanpa paket)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(autouse=True)
+def tanpa_penyimpanan_run(monkeypatch):
+    """Tes tidak boleh membaca/menulis penyimpanan run milik pengguna"""
+    monkeypatch.delenv('KANTIN_RUN_STORE', raising=False)
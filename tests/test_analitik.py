@@ -0,0 +1,30 @@
+import pytest
+from kantin_des import Config
+from analitik import erlang_c, estimasi_analitik, tanpa_harapan
+
+# ============================
+# ERLANG C
+# ============================
+@pytest.mark.parametrize('c, a, peluang', [
+    (1, 0.5, 0.5),        # M/M/1: P(menunggu) = rho
+    (2, 1.0, 1 / 3),
+    (10, 8.0, 0.4092),
+    (100, 90.0, 0.2169),
+])
+def test_erlang_c(c, a, peluang):
+    assert erlang_c(c, a) == pytest.approx(peluang, abs=1e-4)
+
+def test_estimasi_stabil_dan_tidak_stabil():
+    stabil = estimasi_analitik(Config(NUM_KELOMPOK=3, NUM_STAFF_PER_KELOMPOK=3))
+    assert stabil['stabil'] and stabil['metode'] == "Allen-Cunneen"
+    assert stabil['rho'] == pytest.approx(2.0 / (9 * 0.24))
+
+    # Default: 4 staff, rho ~ 2.08 -> fluida, tunggu rata-rata ~ (N-1)/2 (E[S]/c - 1/lambda)
+    jenuh = estimasi_analitik(Config())
+    assert not jenuh['stabil'] and jenuh['metode'] == "fluida"
+    assert jenuh['avg_waktu_tunggu'] == pytest.approx(499 / 2 * (2.0 / 4 - 0.24))
+
+def test_tanpa_harapan_hanya_di_rezim_tidak_stabil():
+    assert tanpa_harapan(Config(), 'avg_waktu_tunggu', 5.0)
+    assert not tanpa_harapan(Config(), 'avg_waktu_tunggu', 100.0)
+    assert not tanpa_harapan(Config(NUM_KELOMPOK=3, NUM_STAFF_PER_KELOMPOK=3), 'avg_waktu_tunggu', 0.01)
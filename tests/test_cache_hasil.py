@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+from kantin_des import Config
+from cache_hasil import LRUCache, hash_config, perkiraan_ukuran
+
+# ============================
+# CACHE HASIL SIMULASI (LRU)
+# ============================
+def test_hash_config_kanonik():
+    assert hash_config(Config(), 'fast') == hash_config(Config(), 'fast')
+    assert hash_config(Config(NUM_KELOMPOK=2.0), 'fast') == hash_config(Config(NUM_KELOMPOK=2), 'fast')
+    assert hash_config({'a': 1, 'b': 2}) == hash_config({'b': 2, 'a': 1})
+    assert hash_config(np.int64(3)) == hash_config(3)
+    assert hash_config(Config(), 'fast') != hash_config(Config(), 'simpy')
+    assert hash_config(Config(), 'fast') != hash_config(Config(RANDOM_SEED=43), 'fast')
+
+def test_buang_entri_terlama_berdasarkan_jumlah():
+    cache = LRUCache(max_entri=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1      # 'a' jadi yang terbaru dipakai
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+def test_buang_entri_berdasarkan_ukuran():
+    array = np.zeros(1000)          # 8000 byte
+    cache = LRUCache(max_entri=10, max_bytes=20_000)
+    for kunci in 'abc':
+        cache.put(kunci, array.copy())
+    assert list(cache._data) == ['b', 'c']
+    assert cache.total_bytes == 2 * perkiraan_ukuran(array) <= cache.max_bytes
+
+    # Hasil yang lebih besar dari seluruh kapasitas tidak disimpan dan tidak membuang entri lain
+    cache.put('besar', np.zeros(5000))
+    assert 'besar' not in cache
+    assert len(cache) == 2
+
+def test_timpa_kunci_memperbarui_ukuran():
+    cache = LRUCache(max_bytes=100_000)
+    cache.put('a', np.zeros(1000))
+    cache.put('a', np.zeros(10))
+    assert len(cache) == 1
+    assert cache.total_bytes == perkiraan_ukuran(np.zeros(10))
+
+def test_hit_miss_dan_get_or_compute():
+    cache = LRUCache()
+    dihitung = []
+
+    def hitung():
+        dihitung.append(1)
+        return pd.DataFrame({'x': [1, 2]})
+
+    pertama = cache.get_or_compute('k', hitung)
+    kedua = cache.get_or_compute('k', hitung)
+    assert kedua is pertama
+    assert len(dihitung) == 1
+    statistik = cache.statistik()
+    assert (statistik['hits'], statistik['misses'], statistik['entri']) == (1, 1, 1)
+
+    cache.clear()
+    assert len(cache) == 0 and cache.total_bytes == 0
@@ -0,0 +1,51 @@
+import io
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from kantin_des import Config, KantinPrasmananDES
+from ekspor_hasil import FORMAT_EKSPOR, ke_tabel, ke_parquet, ke_arrow_ipc, ke_csv, pembuat_unduhan, tulis_file
+
+# ============================
+# EKSPOR HASIL (ARROW / PARQUET)
+# ============================
+@pytest.fixture(scope='module')
+def df():
+    _, df = KantinPrasmananDES(Config(NUM_MAHASISWA=300)).run_simulation('fast')
+    return df
+
+def test_parquet_round_trip(df):
+    kembali = pq.read_table(io.BytesIO(ke_parquet(ke_tabel(df)))).to_pandas()
+    pd.testing.assert_frame_equal(kembali, df)
+
+def test_arrow_ipc_round_trip(df):
+    tabel = ke_tabel(df)
+    kembali = pa.ipc.open_file(pa.BufferReader(ke_arrow_ipc(tabel))).read_all()
+    assert kembali.equals(tabel)
+    pd.testing.assert_frame_equal(kembali.to_pandas(), df)
+
+def test_csv_round_trip(df):
+    kembali = pd.read_csv(io.BytesIO(ke_csv(ke_tabel(df))),
+                          parse_dates=['jam_datang', 'jam_selesai'])
+    pd.testing.assert_frame_equal(kembali, df, check_dtype=False)
+
+@pytest.mark.parametrize('nama_format', list(FORMAT_EKSPOR))
+def test_pembuat_unduhan_sama_dengan_fungsi_tulis(df, nama_format):
+    tulis = FORMAT_EKSPOR[nama_format][0]
+    assert pembuat_unduhan(df, nama_format)() == tulis(ke_tabel(df))
+
+@pytest.mark.parametrize('ekstensi, baca', [
+    ('parquet', pd.read_parquet),
+    ('arrow', pd.read_feather),
+    ('feather', pd.read_feather),
+])
+def test_tulis_file_sesuai_ekstensi(df, tmp_path, ekstensi, baca):
+    path = str(tmp_path / f'hasil.{ekstensi}')
+    tulis_file(df, path)
+    pd.testing.assert_frame_equal(baca(path), df)
+
+def test_tulis_file_csv(df, tmp_path):
+    path = str(tmp_path / 'hasil.csv')
+    tulis_file(df, path)
+    kembali = pd.read_csv(path, parse_dates=['jam_datang', 'jam_selesai'])
+    pd.testing.assert_frame_equal(kembali, df, check_dtype=False)
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dataclasses import replace
+from kantin_des import Config, KantinPrasmananDES, geser_jam_mulai
+from piket_des import ConfigPiket, PiketDES
+
+# ============================
+# KESETARAAN ENGINE SIMPY VS FAST
+# ============================
+KOLOM_KANTIN = ['waktu_datang', 'waktu_mulai', 'waktu_selesai', 'waktu_tunggu', 'waktu_layanan']
+
+@pytest.mark.parametrize('config', [
+    Config(NUM_MAHASISWA=300),
+    Config(NUM_MAHASISWA=300, NUM_KELOMPOK=3, NUM_STAFF_PER_KELOMPOK=3, RANDOM_SEED=7),
+    Config(NUM_MAHASISWA=200, NUM_KELOMPOK=1, NUM_STAFF_PER_KELOMPOK=1, ANTITETIK=True),
+])
+def test_kantin_simpy_sama_dengan_fast(config):
+    results_simpy, df_simpy = KantinPrasmananDES(config).run_simulation('simpy')
+    results_fast, df_fast = KantinPrasmananDES(config).run_simulation('fast')
+    # SimPy mencatat mahasiswa saat selesai dilayani, engine fast saat mulai dilayani
+    df_simpy = df_simpy.sort_values('id').reset_index(drop=True)
+    df_fast = df_fast.sort_values('id').reset_index(drop=True)
+
+    for kolom in KOLOM_KANTIN:
+        np.testing.assert_allclose(df_fast[kolom], df_simpy[kolom], atol=1e-9)
+    np.testing.assert_array_equal(df_fast['kelompok'], df_simpy['kelompok'])
+    for nama in ('avg_waktu_tunggu', 'max_waktu_tunggu', 'waktu_selesai_terakhir'):
+        assert results_fast[nama] == pytest.approx(results_simpy[nama])
+    for kelompok, util in results_simpy['utilisasi_kelompok'].items():
+        assert results_fast['utilisasi_kelompok'][kelompok] == pytest.approx(util)
+
+def test_kantin_streaming_sama_dengan_dataframe():
+    config = Config(NUM_MAHASISWA=500)
+    results, _ = KantinPrasmananDES(config).run_simulation('fast')
+    results_streaming, _ = KantinPrasmananDES(
+        Config(NUM_MAHASISWA=500, STREAMING=True)
+    ).run_simulation('fast')
+    assert results_streaming['avg_waktu_tunggu'] == pytest.approx(results['avg_waktu_tunggu'])
+    assert results_streaming['max_waktu_tunggu'] == pytest.approx(results['max_waktu_tunggu'])
+
+@pytest.mark.parametrize('engine', ['fast', 'simpy'])
+def test_kantin_lebih_dari_127_kelompok(engine):
+    config = Config(NUM_MAHASISWA=5000, NUM_KELOMPOK=300, NUM_STAFF_PER_KELOMPOK=1,
+                    MEAN_INTERARRIVAL=0.001)
+    results, df = KantinPrasmananDES(config).run_simulation(engine)
+    assert df['kelompok'].min() == 0
+    assert df['kelompok'].max() == 299
+    assert df['kelompok'].nunique() == 300
+    assert len(results['utilisasi_kelompok']) == 300
+
+def test_kantin_streaming_lebih_dari_127_kelompok():
+    config = Config(NUM_MAHASISWA=5000, NUM_KELOMPOK=300, NUM_STAFF_PER_KELOMPOK=1,
+                    MEAN_INTERARRIVAL=0.001, STREAMING=True)
+    results, _ = KantinPrasmananDES(config).run_simulation('fast')
+    assert results['total_mahasiswa'] == 5000
+
+@pytest.mark.parametrize('config', [
+    ConfigPiket(),
+    ConfigPiket(PEKERJA_LAUK=3, PEKERJA_ANGKAT=1, PEKERJA_NASI=2, RANDOM_SEED=3),
+])
+def test_piket_simpy_sama_dengan_fast(config):
+    hasil_simpy = PiketDES(config).run('simpy')
+    hasil_fast = PiketDES(config).run('fast')
+
+    assert hasil_fast['waktu_total'] == pytest.approx(hasil_simpy['waktu_total'])
+    assert hasil_fast['bottleneck'] == hasil_simpy['bottleneck']
+    for tahap, ringkasan in hasil_simpy['tahap'].items():
+        for nama, nilai in ringkasan.items():
+            assert hasil_fast['tahap'][tahap][nama] == pytest.approx(nilai), (tahap, nama)
+
+# ============================
+# GESER JAM MULAI TANPA SIMULASI ULANG
+# ============================
+@pytest.mark.parametrize('streaming', [False, True])
+def test_geser_jam_mulai_sama_dengan_run_baru(streaming):
+    config = Config(NUM_MAHASISWA=400, STREAMING=streaming)
+    results, df = KantinPrasmananDES(config).run_simulation('fast')
+    salinan_results = dict(results)
+    digeser = replace(config, START_HOUR=11, START_MINUTE=30)
+
+    results_geser, df_geser = geser_jam_mulai(results, df, digeser)
+    results_baru, df_baru = KantinPrasmananDES(digeser).run_simulation('fast')
+
+    for nama in ('start_time', 'jam_selesai_terakhir', 'distribusi_jam'):
+        assert results_geser[nama] == results_baru[nama], nama
+    assert results_geser['steady_state']['jam_potong'] == results_baru['steady_state']['jam_potong']
+    if streaming:
+        assert df_geser is None
+    else:
+        pd.testing.assert_frame_equal(df_geser, df_baru)
+    # Hasil asli (mis. di cache) tidak ikut berubah
+    assert results == salinan_results
+    assert results['start_time'].hour == 8
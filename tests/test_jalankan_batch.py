@@ -0,0 +1,68 @@
+import json
+import pandas as pd
+import pytest
+import jalankan_batch
+
+# ============================
+# CLI SKENARIO
+# ============================
+def tulis_skenario(tmp_path, skenario, nama='skenario.json'):
+    path = tmp_path / nama
+    path.write_text(json.dumps(skenario), encoding='utf-8')
+    return str(path)
+
+@pytest.mark.parametrize('skenario', [
+    [{'nama': 'salah', 'NUM_MAHASISWAA': 100}],
+    [{'nama': 'salah', 'model': 'piket', 'NUM_MAHASISWA': 100}],
+    [{'nama': 'salah', 'model': 'kantin_baru'}],
+    [{'nama': 'salah', 'replikasi': 0}],
+    [{'nama': 'salah', 'engine': 'fastt'}],
+    [{'nama': 'salah', 'model': 'piket', 'engine': 'fast'}],
+    [{'nama': 'salah', 'NUM_MAHASISWA': '500'}],
+    [{'nama': 'salah', 'NUM_MAHASISWA': 500.0}],
+    [{'nama': 'salah', 'STREAMING': 1}],
+    [{'nama': 'salah', 'replikasi': '2'}],
+    [{'nama': 'salah', 'model': 'piket', 'total_meja': 'enam puluh'}],
+    [],
+])
+def test_skenario_tidak_valid_keluar_dengan_kode_2(tmp_path, capsys, skenario):
+    path = tulis_skenario(tmp_path, skenario)
+    with pytest.raises(SystemExit) as keluar:
+        jalankan_batch.main([path])
+    assert keluar.value.code == 2
+    assert 'error' in capsys.readouterr().err
+
+def test_file_tidak_ada_keluar_dengan_kode_2(tmp_path):
+    with pytest.raises(SystemExit) as keluar:
+        jalankan_batch.main([str(tmp_path / 'tidak_ada.toml')])
+    assert keluar.value.code == 2
+
+def test_skenario_valid_menulis_hasil(tmp_path):
+    path = tulis_skenario(tmp_path, [
+        {'nama': 'kantin', 'NUM_MAHASISWA': 100, 'replikasi': 2},
+        {'nama': 'piket', 'model': 'piket', 'replikasi': 2},
+    ])
+    output = tmp_path / 'hasil.parquet'
+    assert jalankan_batch.main([path, '-o', str(output)]) is None
+
+    df = pd.read_parquet(output)
+    assert len(df) == 4
+    assert set(df['skenario']) == {'kantin', 'piket'}
+
+def test_tipe_field_yang_cocok_diterima(tmp_path):
+    path = tulis_skenario(tmp_path, [
+        {'nama': 'int_untuk_float', 'MEAN_INTERARRIVAL': 1, 'MIN_SERVICE_TIME': 1},
+    ])
+    [skenario] = jalankan_batch.baca_skenario(path)
+    assert skenario['engine'] == 'fast'
+
+def test_replikasi_pertama_tidak_bergantung_pada_jumlah_replikasi():
+    satu = jalankan_batch.jalankan_batch([
+        jalankan_batch.validasi_skenario({'NUM_MAHASISWA': 100, 'replikasi': 1}, 0)
+    ])
+    tiga = jalankan_batch.jalankan_batch([
+        jalankan_batch.validasi_skenario({'NUM_MAHASISWA': 100, 'replikasi': 3}, 0)
+    ])
+    assert satu['seed'][0] == tiga['seed'][0]
+    assert satu['avg_waktu_tunggu'][0] == tiga['avg_waktu_tunggu'][0]
+    assert tiga['seed'].nunique() == 3
@@ -0,0 +1,65 @@
+import pytest
+from dataclasses import replace
+from kantin_des import Config
+from replikasi import seed_replikasi
+from optimasi_staff import optimasi_staff, EvaluasiStaff, DIPANGKAS, LAYAK, TIDAK_LAYAK
+
+# ============================
+# OPTIMASI JUMLAH STAFF
+# ============================
+CONFIG = Config(NUM_MAHASISWA=300)
+PARAMETER = dict(target=2.0, metrik='p90_waktu_tunggu', max_kelompok=4,
+                 max_staff_per_kelompok=4, n_awal=3, n_maks=12, max_workers=1)
+
+@pytest.fixture(scope='module')
+def hasil():
+    return optimasi_staff(CONFIG, **PARAMETER)
+
+def test_frontier_sama_dengan_grid_penuh(hasil):
+    # Evaluasi setiap total staff di grid dengan aturan sekuensial dan seed yang sama
+    seeds = seed_replikasi(CONFIG.RANDOM_SEED, PARAMETER['n_maks'])
+    total_grid = {k * s for k in range(1, 5) for s in range(1, 5)}
+    total_layak = [
+        total for total in sorted(total_grid)
+        if EvaluasiStaff(replace(CONFIG, NUM_KELOMPOK=1, NUM_STAFF_PER_KELOMPOK=total),
+                         PARAMETER['metrik'], PARAMETER['target'], seeds, 'fast'
+                         ).putuskan(PARAMETER['n_awal'], PARAMETER['n_maks'])
+    ]
+    assert hasil['terbaik']['total_staff'] == min(total_layak)
+    assert hasil['terbaik']['mean'] <= PARAMETER['target']
+
+def test_run_lebih_sedikit_dari_grid(hasil):
+    evaluasi = hasil['evaluasi']
+    # Tata letak dengan total staff sama berbagi satu evaluasi
+    disimulasikan = evaluasi[evaluasi['status'] != DIPANGKAS]
+    assert hasil['jumlah_run'] == disimulasikan.drop_duplicates('total_staff')['n'].sum()
+    assert hasil['jumlah_run'] < hasil['jumlah_run_grid_min'] <= hasil['jumlah_run_grid_maks']
+    assert hasil['jumlah_run_grid_maks'] == 9 * PARAMETER['n_maks']  # 9 total berbeda di grid 4x4
+
+def test_pangkas_analitik_hanya_titik_tidak_stabil(hasil):
+    dipangkas = hasil['evaluasi'][hasil['evaluasi']['status'] == DIPANGKAS]
+    assert hasil['jumlah_dipangkas'] == len(dipangkas) > 0
+    assert (dipangkas['n'] == 0).all()
+    assert (dipangkas['mean'] > 2 * PARAMETER['target']).all()
+
+    tanpa_pangkas = optimasi_staff(CONFIG, **PARAMETER, pangkas_analitik=False)
+    assert tanpa_pangkas['jumlah_dipangkas'] == 0
+    assert tanpa_pangkas['terbaik']['total_staff'] == hasil['terbaik']['total_staff']
+    assert tanpa_pangkas['jumlah_run'] > hasil['jumlah_run']
+
+def test_status_evaluasi_konsisten_dengan_ci(hasil):
+    for _, baris in hasil['evaluasi'].iterrows():
+        if baris['status'] == LAYAK:
+            assert baris['ci_atas'] <= PARAMETER['target']
+        elif baris['status'] == TIDAK_LAYAK:
+            assert baris['ci_bawah'] > PARAMETER['target']
+
+def test_tidak_ada_yang_layak():
+    hasil = optimasi_staff(CONFIG, **{**PARAMETER, 'max_kelompok': 1, 'max_staff_per_kelompok': 2})
+    assert hasil['terbaik'] is None
+
+def test_parameter_tidak_valid():
+    with pytest.raises(ValueError):
+        optimasi_staff(CONFIG, metrik='rata_rata')
+    with pytest.raises(ValueError):
+        optimasi_staff(CONFIG, n_awal=1)
@@ -0,0 +1,90 @@
+import time
+import pytest
+from dataclasses import replace
+from kantin_des import Config
+from cache_hasil import cache_simulasi
+from pekerjaan_latar import (
+    ManajerPekerjaan, kunci_simulasi, SELESAI, DIBATALKAN, GAGAL, STATUS_AKHIR
+)
+
+# ============================
+# MANAJER PEKERJAAN LATAR BELAKANG
+# ============================
+def tunggu_selesai(manajer, id_pekerjaan, batas_detik=60):
+    akhir = time.time() + batas_detik
+    while time.time() < akhir:
+        pekerjaan = manajer.ambil(id_pekerjaan)
+        if pekerjaan.status in STATUS_AKHIR:
+            return pekerjaan
+        time.sleep(0.05)
+    raise TimeoutError(id_pekerjaan)
+
+@pytest.fixture
+def manajer():
+    manajer = ManajerPekerjaan(max_workers=1, jumlah_irisan=200)
+    yield manajer
+    if manajer._proses is not None:
+        manajer._buang_proses(manajer._proses)
+
+@pytest.fixture(autouse=True)
+def cache_kosong():
+    cache_simulasi.clear()
+    yield
+    cache_simulasi.clear()
+
+def test_cache_hit_selesai_tanpa_simulasi(manajer):
+    config = Config(NUM_MAHASISWA=100)
+    hasil = ({'avg_waktu_tunggu': 1.0}, None, [])
+    cache_simulasi.put(kunci_simulasi(config, 'fast'), hasil)
+
+    # Jam mulai tidak ikut kunci cache
+    id_pekerjaan = manajer.kirim(replace(config, START_HOUR=10), 'fast')
+    pekerjaan = manajer.ambil(id_pekerjaan)
+    assert pekerjaan.status == SELESAI
+    assert pekerjaan.hasil is hasil
+    assert manajer._proses is None
+
+def test_hasil_selesai_masuk_cache(manajer):
+    config = Config(NUM_MAHASISWA=200, RANDOM_SEED=11)
+    pekerjaan = tunggu_selesai(manajer, manajer.kirim(config, 'fast'))
+    assert pekerjaan.status == SELESAI, pekerjaan.galat
+    results, df, _ = pekerjaan.hasil
+    assert results['total_mahasiswa'] == len(df) == 200
+    assert cache_simulasi.get(kunci_simulasi(config, 'fast')) is pekerjaan.hasil
+
+def test_batalkan_pekerjaan_berjalan(manajer):
+    config = Config(NUM_MAHASISWA=200_000, MEAN_INTERARRIVAL=0.01, RANDOM_SEED=12)
+    id_pekerjaan = manajer.kirim(config, 'simpy')
+    akhir = time.time() + 60
+    while manajer.ambil(id_pekerjaan).cuplikan is None and time.time() < akhir:
+        time.sleep(0.05)
+    assert manajer.batalkan(id_pekerjaan)
+
+    pekerjaan = tunggu_selesai(manajer, id_pekerjaan, batas_detik=30)
+    assert pekerjaan.status == DIBATALKAN
+    assert pekerjaan.progres < 1.0
+    assert kunci_simulasi(config, 'simpy') not in cache_simulasi
+
+def test_batalkan_pekerjaan_antri(manajer):
+    lama = manajer.kirim(Config(NUM_MAHASISWA=200_000, MEAN_INTERARRIVAL=0.01), 'simpy')
+    antri = manajer.kirim(Config(NUM_MAHASISWA=100, RANDOM_SEED=13), 'fast')
+    assert manajer.batalkan(antri)
+    assert manajer.ambil(antri).status == DIBATALKAN
+    manajer.batalkan(lama)
+    tunggu_selesai(manajer, lama)
+
+def test_pool_rusak_diganti_untuk_pekerjaan_berikutnya(manajer):
+    pertama = tunggu_selesai(manajer, manajer.kirim(Config(NUM_MAHASISWA=100, RANDOM_SEED=14)))
+    assert pertama.status == SELESAI, pertama.galat
+    proses_lama = manajer._proses
+    for worker in list(proses_lama._processes.values()):
+        worker.kill()
+        worker.join()
+
+    rusak = tunggu_selesai(manajer, manajer.kirim(Config(NUM_MAHASISWA=100, RANDOM_SEED=15)))
+    assert rusak.status == GAGAL
+    assert 'BrokenProcessPool' in rusak.galat
+
+    berikutnya = tunggu_selesai(manajer, manajer.kirim(Config(NUM_MAHASISWA=100, RANDOM_SEED=16)))
+    assert berikutnya.status == SELESAI, berikutnya.galat
+    assert manajer._proses is not proses_lama
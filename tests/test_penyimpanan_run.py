@@ -0,0 +1,84 @@
+import os
+import pytest
+from dataclasses import replace
+from kantin_des import Config, KantinPrasmananDES
+from replikasi import ringkas_metrik
+from penyimpanan_run import PenyimpananRun, kunci_run
+
+# ============================
+# PENYIMPANAN RUN PERSISTEN
+# ============================
+def jalankan(config: Config):
+    model = KantinPrasmananDES(config)
+    results, df = model.run_simulation('fast')
+    return results, df, model.statistics['queue_lengths']
+
+def simpan_penuh(penyimpanan, config):
+    results, df, queue_lengths = jalankan(config)
+    penyimpanan.simpan(config, 'fast', ringkas_metrik(results), df=df,
+                       hasil=(results, queue_lengths))
+    return results, df
+
+@pytest.fixture
+def penyimpanan(tmp_path):
+    return PenyimpananRun(str(tmp_path / 'run_store.sqlite'))
+
+def test_kunci_run_tanpa_jam_mulai_dan_profiling():
+    config = Config()
+    assert kunci_run(config, 'fast') == kunci_run(replace(config, START_HOUR=10, PROFILING=True), 'fast')
+    assert kunci_run(config, 'fast') != kunci_run(config, 'simpy')
+    assert kunci_run(config, 'fast') != kunci_run(replace(config, RANDOM_SEED=43), 'fast')
+
+def test_metrik_dan_run_penuh_kembali_utuh(penyimpanan):
+    config = Config(NUM_MAHASISWA=200)
+    assert penyimpanan.ambil_metrik(config, 'fast') is None
+    assert penyimpanan.ambil_hasil(config, 'fast') is None
+
+    results, df = simpan_penuh(penyimpanan, config)
+    assert penyimpanan.ambil_metrik(config, 'fast') == ringkas_metrik(results)
+
+    results_muat, df_muat, queue_lengths = penyimpanan.ambil_hasil(config, 'fast')
+    assert results_muat['avg_waktu_tunggu'] == results['avg_waktu_tunggu']
+    assert len(queue_lengths['time']) == 200
+    assert df_muat['waktu_tunggu'].tolist() == df['waktu_tunggu'].tolist()
+
+def test_seed_128_bit_dan_cari(penyimpanan):
+    seed = 2 ** 100 + 7
+    for n in (100, 200):
+        config = Config(NUM_MAHASISWA=n, RANDOM_SEED=seed)
+        results, _, _ = jalankan(config)
+        penyimpanan.simpan(config, 'fast', ringkas_metrik(results))
+
+    assert len(penyimpanan) == 2
+    hasil = penyimpanan.cari(NUM_MAHASISWA=200, RANDOM_SEED=seed)
+    assert len(hasil) == 1
+    assert hasil['RANDOM_SEED'][0] == str(seed)
+    assert not hasil['ada_data'][0]
+    with pytest.raises(ValueError):
+        penyimpanan.cari(urut='kolom_asing')
+
+def test_pangkas_file_membuang_run_tertua(tmp_path):
+    penyimpanan = PenyimpananRun(str(tmp_path / 'run_store.sqlite'), batas_data_mb=0.05)
+    configs = [Config(NUM_MAHASISWA=500, RANDOM_SEED=s) for s in range(4)]
+    for config in configs:
+        simpan_penuh(penyimpanan, config)
+
+    # Yang terbaru selalu tersisa; yang tertua dibuang, metriknya tetap ada
+    assert penyimpanan.ambil_hasil(configs[-1], 'fast') is not None
+    assert penyimpanan.ambil_hasil(configs[0], 'fast') is None
+    assert penyimpanan.ambil_metrik(configs[0], 'fast') is not None
+    ukuran = sum(os.path.getsize(os.path.join(penyimpanan.folder_data, f))
+                 for f in os.listdir(penyimpanan.folder_data))
+    assert ukuran <= penyimpanan.batas_data
+
+def test_pangkas_file_yang_sudah_dihapus_proses_lain(tmp_path):
+    penyimpanan = PenyimpananRun(str(tmp_path / 'run_store.sqlite'), batas_data_mb=0.05)
+    lama = Config(NUM_MAHASISWA=500, RANDOM_SEED=1)
+    simpan_penuh(penyimpanan, lama)
+    for nama in os.listdir(penyimpanan.folder_data):
+        os.remove(os.path.join(penyimpanan.folder_data, nama))
+
+    assert penyimpanan.ambil_hasil(lama, 'fast') is None
+    simpan_penuh(penyimpanan, Config(NUM_MAHASISWA=500, RANDOM_SEED=2))
+    simpan_penuh(penyimpanan, Config(NUM_MAHASISWA=500, RANDOM_SEED=3))
+    assert penyimpanan.cari(RANDOM_SEED=1)['ada_data'].tolist() == [0]
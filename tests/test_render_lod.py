@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from render_lod import lttb, turunkan_minmax, turunkan, statistik_box
+
+# ============================
+# LEVEL OF DETAIL UNTUK GRAFIK
+# ============================
+def deret(n=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=np.float64)
+    y = np.cumsum(rng.normal(size=n))
+    return x, y
+
+def test_lttb_jumlah_titik_dan_ujung():
+    x, y = deret()
+    indeks = lttb(x, y, 500)
+    assert len(indeks) == 500
+    assert indeks[0] == 0 and indeks[-1] == len(x) - 1
+    assert (np.diff(indeks) > 0).all()
+
+def test_lttb_mempertahankan_puncak_tunggal():
+    x = np.arange(5000, dtype=np.float64)
+    y = np.zeros(5000)
+    y[3217] = 100.0
+    assert 3217 in lttb(x, y, 100)
+
+@pytest.mark.parametrize('n_target', [2, 10_000, 20_000])
+def test_lttb_tanpa_downsample(n_target):
+    x, y = deret()
+    np.testing.assert_array_equal(lttb(x, y, n_target), np.arange(len(x)))
+
+def test_minmax_menyimpan_min_dan_max_tiap_bucket():
+    _, y = deret()
+    n_target = 402
+    indeks = turunkan_minmax(y, n_target)
+    assert len(indeks) <= n_target
+    assert indeks[0] == 0 and indeks[-1] == len(y) - 1
+    assert (np.diff(indeks) > 0).all()
+    # Ekstrem global dan ekstrem setiap bucket selalu ikut terpilih
+    jumlah_bucket = (n_target - 2) // 2
+    for bucket in np.array_split(np.arange(len(y)), jumlah_bucket):
+        assert y[indeks[np.isin(indeks, bucket)]].max() == y[bucket].max()
+        assert y[indeks[np.isin(indeks, bucket)]].min() == y[bucket].min()
+
+def test_turunkan_mengurutkan_x_dan_info():
+    x, y = deret()
+    acak = np.random.default_rng(1).permutation(len(x))
+    x_lod, y_lod, info = turunkan(x[acak], y[acak], anggaran=300)
+    assert info == {'asli': len(x), 'ditampilkan': 300, 'metode': 'lttb'}
+    assert (np.diff(x_lod) > 0).all()
+    np.testing.assert_array_equal(y_lod, y[x_lod.astype(int)])
+
+    _, _, info = turunkan(x, y, anggaran=len(x), metode='minmax')
+    assert info['ditampilkan'] == len(x)
+
+def test_statistik_box_sama_dengan_tukey():
+    data = np.append(np.arange(100, dtype=np.float64), 1000.0)
+    statistik = statistik_box(data)
+    q1, median, q3 = np.percentile(data, [25, 50, 75])
+    assert statistik['q1'] == [q1] and statistik['median'] == [median] and statistik['q3'] == [q3]
+    assert statistik['lowerfence'] == [0.0]
+    assert statistik['upperfence'] == [99.0]   # pencilan 1000 di luar pagar
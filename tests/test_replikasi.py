@@ -0,0 +1,136 @@
+import math
+import numpy as np
+import pandas as pd
+import pytest
+from dataclasses import replace
+from kantin_des import Config, KantinPrasmananDES
+from statistik import t_kritis_95
+from replikasi import (
+    seed_replikasi, jalankan_satu_replikasi, jalankan_replikasi, bandingkan_crn,
+    jalankan_sampai_presisi, presisi_tercapai, METRIK_PRESISI
+)
+
+# ============================
+# REPLIKASI INDEPENDEN DAN CI 95%
+# ============================
+CONFIG = Config(NUM_MAHASISWA=200)
+
+def test_seed_replikasi_deterministik_unik_dan_128_bit():
+    seeds = seed_replikasi(42, 50)
+    assert seeds == seed_replikasi(42, 50)
+    assert len(set(seeds)) == 50
+    assert all(0 <= s < 2 ** 128 for s in seeds)
+    assert max(seeds) >= 2 ** 64
+    # Menambah jumlah replikasi tidak mengubah seed replikasi sebelumnya
+    assert seed_replikasi(42, 5) == seeds[:5]
+    assert seed_replikasi(43, 5) != seeds[:5]
+
+def test_replikasi_memakai_seed_anak():
+    _, df_replikasi = jalankan_replikasi(CONFIG, n_replikasi=3, max_workers=1)
+    for i, seed in enumerate(seed_replikasi(CONFIG.RANDOM_SEED, 3)):
+        metrik = jalankan_satu_replikasi(replace(CONFIG, RANDOM_SEED=seed))
+        assert df_replikasi.loc[i, 'avg_waktu_tunggu'] == metrik['avg_waktu_tunggu']
+
+def test_interval_kepercayaan():
+    n = 8
+    ringkasan, df_replikasi = jalankan_replikasi(CONFIG, n_replikasi=n, max_workers=1)
+    baris = ringkasan.loc['avg_waktu_tunggu']
+    nilai = df_replikasi['avg_waktu_tunggu']
+    assert baris['mean'] == pytest.approx(nilai.mean())
+    assert baris['std'] == pytest.approx(nilai.std(ddof=1))
+    assert baris['half_width'] == pytest.approx(t_kritis_95(n - 1) * nilai.std(ddof=1) / math.sqrt(n))
+    assert baris['ci_bawah'] == pytest.approx(baris['mean'] - baris['half_width'])
+    assert baris['ci_atas'] == pytest.approx(baris['mean'] + baris['half_width'])
+    assert baris['half_width'] > 0
+
+def test_paralel_sama_dengan_serial():
+    serial, _ = jalankan_replikasi(CONFIG, n_replikasi=4, max_workers=1)
+    paralel, _ = jalankan_replikasi(CONFIG, n_replikasi=4, max_workers=2)
+    assert paralel.equals(serial)
+
+# ============================
+# CRN DAN REPLIKASI ANTITETIK
+# ============================
+def test_stream_terpisah_untuk_crn():
+    _, df_a = KantinPrasmananDES(CONFIG).run_simulation('fast')
+    _, df_b = KantinPrasmananDES(replace(CONFIG, NUM_KELOMPOK=3)).run_simulation('fast')
+    # Jumlah staff tidak mengubah kedatangan maupun waktu layanan mahasiswa ke-i
+    assert df_a['waktu_datang'].tolist() == df_b['waktu_datang'].tolist()
+    assert df_a['waktu_layanan'].tolist() == df_b['waktu_layanan'].tolist()
+
+def test_run_antitetik_memakai_satu_dikurangi_u():
+    _, df = KantinPrasmananDES(CONFIG).run_simulation('fast')
+    _, df_anti = KantinPrasmananDES(replace(CONFIG, ANTITETIK=True)).run_simulation('fast')
+    # Layanan U(MIN, MAX): pasangan antitetik selalu berjumlah MIN + MAX
+    np.testing.assert_allclose(df['waktu_layanan'] + df_anti['waktu_layanan'],
+                               CONFIG.MIN_SERVICE_TIME + CONFIG.MAX_SERVICE_TIME)
+
+def test_replikasi_antitetik_rata_rata_pasangan():
+    n = 10
+    ringkasan, df_replikasi = jalankan_replikasi(CONFIG, n_replikasi=n, max_workers=1, antitetik=True)
+    assert len(df_replikasi) == n
+    seed = seed_replikasi(CONFIG.RANDOM_SEED, n)[3]
+    biasa = jalankan_satu_replikasi(replace(CONFIG, RANDOM_SEED=seed))
+    anti = jalankan_satu_replikasi(replace(CONFIG, RANDOM_SEED=seed, ANTITETIK=True))
+    assert df_replikasi.loc[3, 'avg_waktu_tunggu'] == pytest.approx(
+        (biasa['avg_waktu_tunggu'] + anti['avg_waktu_tunggu']) / 2
+    )
+    assert ringkasan.loc['avg_waktu_tunggu', 'faktor_reduksi_varians'] > 1
+
+def test_bandingkan_crn_mengurangi_varians_selisih():
+    selisih = bandingkan_crn(CONFIG, replace(CONFIG, NUM_STAFF_PER_KELOMPOK=3),
+                             n_replikasi=10, max_workers=1)
+    baris = selisih.loc['avg_waktu_tunggu']
+    assert baris['mean'] < 0  # staff lebih banyak, tunggu lebih singkat
+    assert baris['faktor_reduksi_varians'] > 1
+    assert baris['half_width'] < baris['half_width_independen']
+
+# ============================
+# REPLIKASI SEKUENSIAL (STOPPING RULE)
+# ============================
+def test_presisi_tercapai_relatif_atau_absolut():
+    ringkasan = pd.DataFrame({'mean': [10.0, 0.01, 10.0], 'half_width': [0.4, 0.04, 0.6]},
+                             index=['relatif', 'absolut', 'belum'])
+    tercapai = presisi_tercapai(ringkasan, target_presisi=0.05, toleransi_absolut=0.05)
+    assert tercapai.tolist() == [True, True, False]
+    assert not presisi_tercapai(ringkasan, 0.05, toleransi_absolut=0.0)['absolut']
+
+def test_berhenti_karena_presisi():
+    # Beban rendah: tunggu ~0, presisi relatifnya hanya bisa dipenuhi toleransi absolut
+    config = replace(CONFIG, NUM_STAFF_PER_KELOMPOK=8)
+    ringkasan, df_replikasi, info = jalankan_sampai_presisi(config, n_awal=5, max_workers=1)
+    assert info['alasan_berhenti'] == 'presisi'
+    assert info['n_replikasi'] == len(df_replikasi) < 20
+    assert info['presisi_relatif']['avg_waktu_tunggu'] > 0.05
+    assert presisi_tercapai(ringkasan.loc[METRIK_PRESISI], 0.05).all()
+
+    _, _, info = jalankan_sampai_presisi(config, n_awal=5, n_maks=20, toleransi_absolut=0.0,
+                                         max_workers=1)
+    assert info['alasan_berhenti'] == 'n_maks'
+
+def test_berhenti_karena_n_maks():
+    _, df_replikasi, info = jalankan_sampai_presisi(
+        CONFIG, target_presisi=1e-6, toleransi_absolut=0.0, n_awal=2, n_maks=6,
+        ukuran_batch=3, max_workers=1
+    )
+    assert info['alasan_berhenti'] == 'n_maks'
+    assert info['n_replikasi'] == len(df_replikasi) == 6
+
+def test_berhenti_karena_anggaran_waktu():
+    _, _, info = jalankan_sampai_presisi(
+        CONFIG, target_presisi=1e-6, toleransi_absolut=0.0, anggaran_waktu=0.0,
+        n_awal=3, max_workers=1
+    )
+    assert info['alasan_berhenti'] == 'anggaran_waktu'
+    assert info['n_replikasi'] == 3
+
+def test_sekuensial_sama_dengan_replikasi_tetap():
+    _, df_sekuensial, info = jalankan_sampai_presisi(
+        CONFIG, target_presisi=1e-6, toleransi_absolut=0.0, n_awal=4, n_maks=4, max_workers=1
+    )
+    _, df_tetap = jalankan_replikasi(CONFIG, n_replikasi=4, max_workers=1)
+    pd.testing.assert_frame_equal(df_sekuensial, df_tetap)
+
+def test_n_maks_minimal_dua():
+    with pytest.raises(ValueError):
+        jalankan_sampai_presisi(CONFIG, n_maks=1)
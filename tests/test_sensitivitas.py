@@ -0,0 +1,62 @@
+import pytest
+from dataclasses import replace
+import sensitivitas
+from kantin_des import Config
+from sensitivitas import buat_grid, kunci_sel, jalankan_sweep, sweep_dataframe
+
+# ============================
+# ANALISIS SENSITIVITAS (GRID SWEEP)
+# ============================
+BASE = Config(NUM_MAHASISWA=100)
+
+@pytest.fixture
+def hitung_run(monkeypatch):
+    """Hitung simulasi yang benar-benar dijalankan sweep serial"""
+    dijalankan = []
+    asli = sensitivitas.jalankan_satu_replikasi
+
+    def dicatat(config, engine):
+        dijalankan.append(kunci_sel(config, engine))
+        return asli(config, engine)
+
+    monkeypatch.setattr(sensitivitas, 'jalankan_satu_replikasi', dicatat)
+    return dijalankan
+
+def test_buat_grid_melewati_rentang_terbalik():
+    configs = buat_grid(BASE, num_kelompok=[1, 2], num_staff_per_kelompok=[1, 2, 3],
+                        service_time=[(1.0, 3.0), (4.0, 2.0)])
+    assert len(configs) == 6
+    assert {(c.NUM_KELOMPOK, c.NUM_STAFF_PER_KELOMPOK) for c in configs} == {
+        (k, s) for k in (1, 2) for s in (1, 2, 3)
+    }
+    assert all(c.NUM_MAHASISWA == 100 for c in configs)
+
+def test_sel_tersimpan_tidak_disimulasikan_ulang(hitung_run):
+    configs = buat_grid(BASE, num_kelompok=[1, 2], num_staff_per_kelompok=[1, 2])
+    tersimpan = {}
+    pertama = list(jalankan_sweep(configs, max_workers=1, hasil_tersimpan=tersimpan))
+    assert len(pertama) == len(hitung_run) == 4
+
+    # Sweep ulang dengan jam mulai berbeda: semua sel diambil dari hasil tersimpan
+    digeser = [replace(c, START_HOUR=11) for c in configs]
+    kedua = list(jalankan_sweep(digeser, max_workers=1, hasil_tersimpan=tersimpan))
+    assert len(hitung_run) == 4
+    assert sweep_dataframe(kedua).equals(sweep_dataframe(pertama))
+
+    # Grid diperluas: hanya sel baru yang dijalankan
+    diperluas = buat_grid(BASE, num_kelompok=[1, 2], num_staff_per_kelompok=[1, 2, 3])
+    ketiga = list(jalankan_sweep(diperluas, max_workers=1, hasil_tersimpan=tersimpan))
+    assert len(ketiga) == 6
+    assert len(hitung_run) == 6
+
+def test_sel_duplikat_dijalankan_sekali(hitung_run):
+    configs = [BASE, replace(BASE, START_HOUR=9), BASE]
+    assert len(list(jalankan_sweep(configs, max_workers=1))) == 1
+    assert len(hitung_run) == 1
+
+def test_sweep_paralel_sama_dengan_serial():
+    configs = buat_grid(BASE, num_kelompok=[1, 2], num_staff_per_kelompok=[2, 3])
+    serial = sweep_dataframe(list(jalankan_sweep(configs, max_workers=1)))
+    paralel = sweep_dataframe(list(jalankan_sweep(configs, max_workers=2)))
+    assert paralel.equals(serial)
+    assert serial['total_staff'].tolist() == [2, 3, 4, 6]
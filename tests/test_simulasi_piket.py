@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from simulasi_piket import simulasi_piket_vektor, jalankan_piket, PARAMETER_PIKET
+
+# ============================
+# ENGINE VEKTOR PIKET VS LOOP ACUAN
+# ============================
+def loop_acuan(lauk, nasi, ukuran_batch, angkat, p):
+    """Loop per ompreng seperti app.py lama, memakai variat yang sudah ditarik"""
+    waktu_lauk = waktu_angkat = waktu_nasi = 0.0
+    total_angkat = 0.0
+    batch, counter = 0, 0
+    selesai = []
+    for i in range(len(lauk)):
+        waktu_lauk += lauk[i] / p
+        counter += 1
+        if counter >= ukuran_batch[batch]:
+            total_angkat += angkat[batch]
+            waktu_angkat = max(waktu_lauk, waktu_angkat) + angkat[batch] / p
+            counter = 0
+            batch += 1
+        waktu_nasi = max(waktu_angkat, waktu_nasi) + nasi[i] / p
+        selesai.append(waktu_nasi)
+    return np.array(selesai), total_angkat
+
+@pytest.mark.parametrize('total_ompreng, piket, seed', [
+    (180, 7, 42), (3, 1, 0), (4, 2, 1), (1000, 5, 9),
+])
+def test_vektor_sama_dengan_loop(total_ompreng, piket, seed):
+    batas = dict(min_lauk=30, max_lauk=60, min_nasi=30, max_nasi=60, min_angkat=20, max_angkat=60)
+    R = 3
+    hasil = simulasi_piket_vektor(total_ompreng, piket, replikasi=R, seed=seed, **batas)
+
+    # Tarik variat dengan urutan yang sama seperti simulasi_piket_vektor
+    rng = np.random.default_rng(seed)
+    lauk = rng.uniform(30, 60, (R, total_ompreng))
+    nasi = rng.uniform(30, 60, (R, total_ompreng))
+    jumlah_batch = total_ompreng // 4 + 1
+    ukuran_batch = rng.integers(4, 8, (R, jumlah_batch))
+    angkat = rng.uniform(20, 60, (R, jumlah_batch))
+
+    for r in range(R):
+        selesai, total_angkat = loop_acuan(lauk[r], nasi[r], ukuran_batch[r], angkat[r], piket)
+        np.testing.assert_allclose(hasil.waktu_selesai[r], selesai, rtol=1e-12)
+        assert hasil.total_angkat[r] == pytest.approx(total_angkat)
+        assert hasil.total_lauk[r] == pytest.approx(lauk[r].sum())
+        assert hasil.total_nasi[r] == pytest.approx(nasi[r].sum())
+        assert hasil.waktu_total[r] == pytest.approx(selesai[-1])
+
+def test_tanpa_ompreng():
+    hasil = simulasi_piket_vektor(0, 7, 30, 60, 30, 60, 20, 60, replikasi=2, seed=1)
+    assert hasil.waktu_selesai.shape == (2, 0)
+    np.testing.assert_array_equal(hasil.waktu_total, [0.0, 0.0])
+
+def test_waktu_selesai_meja_dan_jalankan_piket():
+    hasil = jalankan_piket(PARAMETER_PIKET, replikasi=4)
+    meja = hasil.waktu_selesai_meja(PARAMETER_PIKET['mahasiswa_per_meja'])
+    assert meja.shape == (4, PARAMETER_PIKET['total_meja'])
+    np.testing.assert_array_equal(meja[:, -1], hasil.waktu_total)
+    assert (np.diff(hasil.waktu_selesai, axis=1) > 0).all()
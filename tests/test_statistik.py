@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from statistik import t_kritis_95, peluang_t, titik_potong_mser
+
+# ============================
+# DISTRIBUSI t
+# ============================
+@pytest.mark.parametrize('derajat_bebas, nilai', [
+    (1, 12.706), (2, 4.303), (10, 2.228), (30, 2.042), (60, 2.000), (120, 1.980), (1000, 1.962),
+])
+def test_t_kritis_95(derajat_bebas, nilai):
+    assert t_kritis_95(derajat_bebas) == pytest.approx(nilai, abs=1e-3)
+
+def test_t_kritis_95_derajat_bebas_tidak_valid():
+    assert np.isnan(t_kritis_95(0))
+
+@pytest.mark.parametrize('t, derajat_bebas, peluang', [
+    (0.0, 1, 0.5),
+    (0.0, 7, 0.5),
+    # Bentuk tertutup: df=1 -> 1/2 + atan(t)/pi, df=2 -> 1/2 + t / (2 sqrt(2 + t^2))
+    (1.0, 1, 0.75),
+    (1.0, 2, 0.5 + 1 / (2 * np.sqrt(3))),
+    (12.706, 1, 0.975),
+    (2.228, 10, 0.975),
+    (2.042, 30, 0.975),
+    (-2.228, 10, 0.025),
+])
+def test_peluang_t(t, derajat_bebas, peluang):
+    assert peluang_t(t, derajat_bebas) == pytest.approx(peluang, abs=1e-4)
+
+def test_peluang_t_kebalikan_t_kritis():
+    for derajat_bebas in (1, 2, 5, 17, 30, 50):
+        assert peluang_t(t_kritis_95(derajat_bebas), derajat_bebas) == pytest.approx(0.975, abs=5e-4)
+
+# ============================
+# MSER
+# ============================
+def test_mser_memotong_warm_up():
+    rng = np.random.default_rng(0)
+    warm_up = np.linspace(50, 10, 20)
+    steady = 10 + rng.normal(0, 1, 180)
+    d = titik_potong_mser(np.concatenate([warm_up, steady]))
+    assert 15 <= d <= 25
+
+def test_mser_tanpa_warm_up():
+    rng = np.random.default_rng(1)
+    assert titik_potong_mser(10 + rng.normal(0, 1, 200)) < 20
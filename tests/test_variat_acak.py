@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from variat_acak import PenyediaVariat, seragam, eksponensial
+
+# ============================
+# PENYEDIA VARIAT ACAK PER BLOK
+# ============================
+def identitas(u):
+    return u
+
+@pytest.mark.parametrize('ukuran_blok', [1, 7, 4096])
+def test_urutan_tidak_bergantung_ukuran_blok(ukuran_blok):
+    acuan = np.random.default_rng(5).random(100)
+    penyedia = PenyediaVariat(5, identitas, ukuran_blok=ukuran_blok)
+    np.testing.assert_array_equal([penyedia.ambil() for _ in range(100)], acuan)
+
+def test_ambil_banyak_melanjutkan_stream_yang_sama():
+    acuan = np.random.default_rng(5).random(100)
+    penyedia = PenyediaVariat(5, identitas, ukuran_blok=16)
+    bagian = [
+        [penyedia.ambil() for _ in range(3)],
+        penyedia.ambil_banyak(5),    # dari sisa blok pertama
+        penyedia.ambil_banyak(40),   # sisa blok ditambah tarikan baru
+        [penyedia.ambil() for _ in range(2)],
+        penyedia.ambil_banyak(0),
+        penyedia.ambil_banyak(50),
+    ]
+    np.testing.assert_array_equal(np.concatenate(bagian), acuan)
+
+def test_antitetik_memakai_satu_dikurangi_u():
+    biasa = PenyediaVariat(9, identitas).ambil_banyak(50)
+    antitetik = PenyediaVariat(9, identitas, antitetik=True).ambil_banyak(50)
+    np.testing.assert_allclose(biasa + antitetik, 1.0)
+
+def test_transformasi_seragam_dan_eksponensial():
+    layanan = PenyediaVariat(1, seragam(1.0, 3.0)).ambil_banyak(100_000)
+    assert layanan.min() >= 1.0 and layanan.max() < 3.0
+    assert layanan.mean() == pytest.approx(2.0, abs=0.01)
+
+    kedatangan = PenyediaVariat(1, eksponensial(0.24)).ambil_banyak(100_000)
+    assert kedatangan.min() >= 0.0
+    assert kedatangan.mean() == pytest.approx(0.24, rel=0.02)
+    # Mode antitetik bisa memberi nilai 1 (dari u = 0): log(1 - 1) dibatasi agar hingga
+    assert np.isfinite(eksponensial(0.24)(np.array([1.0]))).all()
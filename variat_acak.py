@@ -0,0 +1,55 @@
+import numpy as np
+
+# ============================
+# PENYEDIA VARIAT ACAK PER BLOK
+# ============================
+UKURAN_BLOK_VARIAT = 4096
+
+class PenyediaVariat:
+    """Variat acak yang ditarik per blok dengan numpy Generator
+
+    Satu blok U[0, 1) ditarik sekaligus, ditransformasi secara vektor, lalu
+    diambil satu per satu lewat iterator list (tanpa panggilan random per
+    variat). Urutan variat hanya bergantung pada seed, bukan ukuran blok.
+    """
+
+    def __init__(self, seed, transformasi, ukuran_blok: int = UKURAN_BLOK_VARIAT,
+                 antitetik: bool = False):
+        self.rng = np.random.default_rng(seed)
+        self.transformasi = transformasi
+        self.ukuran_blok = ukuran_blok
+        self.antitetik = antitetik
+        self._sisa = iter(())
+
+    def _seragam(self, n: int) -> np.ndarray:
+        u = self.rng.random(n)
+        return 1.0 - u if self.antitetik else u
+
+    def ambil(self) -> float:
+        """Satu variat berikutnya (blok baru ditarik bila blok lama habis)"""
+        try:
+            return next(self._sisa)
+        except StopIteration:
+            self._sisa = iter(self.transformasi(self._seragam(self.ukuran_blok)).tolist())
+            return next(self._sisa)
+
+    def ambil_banyak(self, n: int) -> np.ndarray:
+        """n variat berikutnya sebagai array (sisa blok dipakai lebih dulu)"""
+        sisa = np.fromiter(self._sisa, dtype=np.float64)
+        self._sisa = iter(())
+        if len(sisa) >= n:
+            self._sisa = iter(sisa[n:].tolist())
+            return sisa[:n]
+        return np.concatenate([sisa, self.transformasi(self._seragam(n - len(sisa)))])
+
+def seragam(bawah: float, atas: float):
+    """Transformasi U[0, 1) -> U[bawah, atas)"""
+    rentang = atas - bawah
+    return lambda u: bawah + rentang * u
+
+def eksponensial(rata_rata: float):
+    """Transformasi U[0, 1) -> Exp(rata_rata) dengan inversi CDF
+
+    1-U = 0 hanya mungkin pada mode antitetik; dibatasi agar log tetap hingga.
+    """
+    return lambda u: -rata_rata * np.log(np.maximum(1.0 - u, 2.0**-53))